@@ -0,0 +1,94 @@
+import csv
+import json
+import time
+import random
+import asyncio
+import argparse
+
+
+async def _worker(host: str, port: int, records: list, batch: int, remaining: list, latencies: list, errors: list):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while remaining:
+            remaining.pop()
+            body = json.dumps({"instances": random.sample(records, batch)}).encode()
+            start = time.perf_counter()
+            writer.write(
+                f"POST /predict HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+            status = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if b" 200 " not in status:
+                errors.append(status.decode().strip())
+    finally:
+        writer.close()
+
+
+async def run_load_test(host: str, port: int, records: list, requests: int, concurrency: int, batch: int) -> dict:
+    """
+    Sends requests from concurrent keep-alive connections and reports throughput and latency percentiles.
+
+    Args:
+        host (str): Server host.
+        port (int): Server port.
+        records (list): Records sampled into the request bodies.
+        requests (int): Total number of requests.
+        concurrency (int): Number of connections sending requests at the same time.
+        batch (int): Number of records per request.
+
+    Returns:
+        dict: The load test report.
+    """
+    latencies, errors = [], []
+    remaining = list(range(requests))
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(host, port, records, batch, remaining, latencies, errors) for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(q):
+        return 1000 * latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else None
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "concurrency": concurrency,
+        "records_per_request": batch,
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "rows_per_second": len(latencies) * batch / elapsed,
+        "latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "p99": percentile(0.99), "max": percentile(1.0)},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the prediction server.")
+    parser.add_argument("--data", default="extracted_data/StudentsPerformance.csv", help="CSV whose rows are sent as records.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=1, help="Records per request.")
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    args = parser.parse_args()
+    
+    with open(args.data, newline="") as f:
+        records = list(csv.DictReader(f))
+    report = asyncio.run(run_load_test(args.host, args.port, records, args.requests, args.concurrency, args.batch))
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
@@ -1,45 +1,240 @@
+import os
 import logging
+import tempfile
+import contextlib
 import pandas as pd
 import numpy as np
-import mlflow
 
 from steps.data_ingestion_step import ingest
 from steps.data_cleaning_step import clean
-from steps.data_transforming_step import transform
+from steps.data_transforming_step import transform, save_transform_state
 from steps.data_splitting_step import split
 from steps.model_training_step import train
 from steps.model_evaluator_step import evaluate
+from steps.model_sweep_step import sweep
+from steps.incremental_training_step import train_incremental
+from steps.model_export_step import export_predictor
+from src.step_cache import StepCache
+from src.dag_scheduler import Node, DAGScheduler
+from src.mlflow_logger import MLflowLogger
+from src.instrumentation import StepProfiler
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA
+from src.batch_training import BatchTrainer, find_files
 from urllib.parse import urlparse
 
 
-def train_pipeline(file_path: str):
+def _run_step(cache: StepCache, name: str, step, *args, **kwargs):
+    if cache is None:
+        return step(*args, **kwargs)
+    # Keyed on the bound arguments and the code of the step, see StepCache.
+    return cache.run(name, step, *args, **kwargs)
+
+
+def train_pipeline(file_path: str, cache_dir: str = None, step_cache_dir: str = None, tracker: MLflowLogger = None, profiler: StepProfiler = None):
     try:
-        df = ingest(file_path)
-        df_cleaned = clean(df)
-        numerical_features = df_cleaned.select_dtypes(include=np.number).columns
-        categorical_features = df_cleaned.select_dtypes(include="O").columns
-        df_transformed = transform(df_cleaned, strategy="label_encoding", features=categorical_features)
-        X_train, X_test, y_train, y_test = split(df_transformed, numerical_features)
+        tracker = tracker or MLflowLogger()
+        with profiler.activate() if profiler is not None else contextlib.nullcontext():
+            cache = StepCache(step_cache_dir) if step_cache_dir is not None else None
+        
+            df = _run_step(cache, "ingest", ingest, file_path, cache_dir=cache_dir, schema=STUDENT_PERFORMANCE_SCHEMA)
+            df_cleaned = _run_step(cache, "clean", clean, df)
+            numerical_features, categorical_features = select_features(df_cleaned)
+            df_transformed = _run_step(cache, "transform", transform, df_cleaned, strategy="label_encoding", features=categorical_features)
+            X_train, X_test, y_train, y_test = _run_step(cache, "split", split, df_transformed, numerical_features)
               
-        logging.info("Training and Evaluation with linear regression model.")
-        trained_model = train(X_train, y_train)
+            logging.info("Training and Evaluation with linear regression model.")
+            trained_model = _run_step(cache, "train", train, X_train, y_train)
         
-        logging.info("Training Completed.")
-        evaluation_metrics  = evaluate(trained_model, X_test, y_test)
+            logging.info("Training Completed.")
+            evaluation_metrics  = _run_step(cache, "evaluate", evaluate, trained_model, X_test, y_test)
         
-        logging.info("Evaluation completed.")
+            logging.info("Evaluation completed.")
+            if cache is not None:
+                logging.info(f"Step cache: {cache.hits} hits, {cache.misses} misses.")
         
-        mlflow.log_metric("MSE", evaluation_metrics["Mean Squared Error"])
-        mlflow.log_metric("R2", evaluation_metrics["R-Squared"])
+            _log_to_mlflow(trained_model, evaluation_metrics, tracker)
+            _log_serving_artifacts(trained_model, df_cleaned, categorical_features, numerical_features, tracker)
         
-        tracking_url_type_store = urlparse(mlflow.get_tracking_uri()).scheme
-        if tracking_url_type_store != "file":
-            mlflow.sklearn.log_model(trained_model, "model", registered_model_name="LinearRegressionModel")
-        else:
-            mlflow.sklearn.log_model(trained_model, "model")
-            
+        if profiler is not None:
+            profiler.log_to_mlflow(tracker)
         return evaluation_metrics
 
     except Exception as e:
         logging.warning(f"Error occur while running training pipeline: {e}")
-        raise e
\ No newline at end of file
+        raise e
+
+
+def select_features(df: pd.DataFrame):
+    numerical_features = df.select_dtypes(include=np.number).columns
+    categorical_features = df.select_dtypes(include=["O", "category"]).columns
+    return numerical_features, categorical_features
+
+
+def training_nodes(cache_dir: str = None) -> list:
+    """
+    Declares the training steps as graph nodes with explicit inputs and outputs.
+
+    Args:
+        cache_dir (str): Directory of the parsed-data cache. Defaults to None.
+
+    Returns:
+        list: The nodes of the training graph, fed by a "file_path" input.
+    """
+    return [
+        Node("ingest", ingest, inputs=["file_path"], outputs=["df"], cache_dir=cache_dir, schema=STUDENT_PERFORMANCE_SCHEMA),
+        Node("clean", clean, inputs=["df"], outputs=["df_cleaned"]),
+        Node("select_features", select_features, inputs=["df_cleaned"], outputs=["numerical_features", "categorical_features"]),
+        Node("transform", transform, inputs={"df": "df_cleaned", "features": "categorical_features"}, outputs=["df_transformed"], strategy="label_encoding"),
+        Node("split", split, inputs=["df_transformed", "numerical_features"], outputs=["X_train", "X_test", "y_train", "y_test"]),
+        Node("train", train, inputs=["X_train", "y_train"], outputs=["trained_model"]),
+        Node("evaluate", evaluate, inputs=["trained_model", "X_test", "y_test"], outputs=["evaluation_metrics"]),
+    ]
+
+
+def train_pipeline_dag(file_path: str, max_workers: int = 4, executor: str = "thread", cache_dir: str = None, nodes: list = None, tracker: MLflowLogger = None):
+    """
+    Runs the training graph with the DAG scheduler.
+
+    Args:
+        file_path (str): Path to the data.
+        max_workers (int): Number of nodes running at the same time. Defaults to 4.
+        executor (str): "thread" or "process". Defaults to "thread".
+        cache_dir (str): Directory of the parsed-data cache. Defaults to None.
+        nodes (list): Extra nodes, e.g. candidate models reading "X_train"/"y_train". Defaults to None.
+        tracker (MLflowLogger): Where to log the run. Defaults to None (synchronous logging to the active run).
+
+    Returns:
+        dict: The evaluation metrics.
+    """
+    try:
+        tracker = tracker or MLflowLogger()
+        scheduler = DAGScheduler(training_nodes(cache_dir) + list(nodes or []), max_workers=max_workers, executor=executor)
+        values = scheduler.run({"file_path": file_path})
+        report = scheduler.report()
+        for name, seconds in report["timings"].items():
+            logging.info(f"Node '{name}': {seconds:.3f}s.")
+        
+        tracker.log_dict(report, "dag_report.json")
+        _log_to_mlflow(values["trained_model"], values["evaluation_metrics"], tracker)
+        return values["evaluation_metrics"]
+
+    except Exception as e:
+        logging.warning(f"Error occur while running training graph: {e}")
+        raise e
+
+
+def sweep_pipeline(file_path: str, grid: dict, max_workers: int = None, metric: str = "R-Squared", cache_dir: str = None, tracker: MLflowLogger = None):
+    """
+    Trains a grid of candidate models on one split and logs the leaderboard.
+
+    Args:
+        file_path (str): Path to the data.
+        grid (dict): Strategy name to hyperparameter lists, e.g. {"ridge": {"alpha": [0.1, 1.0]}}.
+        max_workers (int): Number of worker processes. Defaults to None (one per CPU).
+        metric (str): Ranking metric. Defaults to "R-Squared".
+        cache_dir (str): Directory of the parsed-data cache. Defaults to None.
+        tracker (MLflowLogger): Where to log the run. Defaults to None (synchronous logging to the active run).
+
+    Returns:
+        pd.DataFrame: The leaderboard, best candidate first.
+    """
+    try:
+        tracker = tracker or MLflowLogger()
+        df_cleaned = clean(ingest(file_path, cache_dir=cache_dir, schema=STUDENT_PERFORMANCE_SCHEMA))
+        numerical_features, categorical_features = select_features(df_cleaned)
+        df_transformed = transform(df_cleaned, strategy="label_encoding", features=categorical_features)
+        X_train, X_test, y_train, y_test = split(df_transformed, numerical_features)
+        
+        leaderboard = sweep(X_train, X_test, y_train, y_test, grid, max_workers=max_workers, metric=metric)
+        tracker.log_dict({"leaderboard": leaderboard.astype({"params": str}).to_dict(orient="records")}, "leaderboard.json")
+        if metric in leaderboard and leaderboard[metric].notna().any():
+            tracker.log_metric(f"best_{'R2' if metric == 'R-Squared' else 'MSE'}", leaderboard[metric].iloc[0])
+        return leaderboard
+
+    except Exception as e:
+        logging.warning(f"Error occur while running model sweep: {e}")
+        raise e
+
+
+def batch_train_pipeline(path: str, max_workers: int = None, tracker: MLflowLogger = None):
+    """
+    Trains one model per CSV file in parallel, each in a child run of the active run.
+
+    Args:
+        path (str): Directory or glob pattern of the CSV files.
+        max_workers (int): Number of worker processes. Defaults to None (one per CPU).
+        tracker (MLflowLogger): Where to log the summary. Defaults to None (synchronous logging to the active run).
+
+    Returns:
+        dict: The throughput and timing summary, with one entry per file under "jobs".
+    """
+    try:
+        tracker = tracker or MLflowLogger()
+        trainer = BatchTrainer(max_workers=max_workers)
+        results = trainer.run(find_files(path))
+        summary = trainer.summary(results)
+        logging.info(f"Batch summary: {summary}.")
+        
+        tracker.log_metrics({f"batch.{key}": value for key, value in summary.items() if value is not None})
+        summary["jobs"] = results.astype(object).where(results.notna(), None).to_dict(orient="records")
+        tracker.log_dict(summary, "batch_summary.json")
+        return summary
+
+    except Exception as e:
+        logging.warning(f"Error occur while running batch training: {e}")
+        raise e
+
+
+def incremental_train_pipeline(file_path: str, state_path: str, alpha: float = 0.0, tracker: MLflowLogger = None):
+    try:
+        tracker = tracker or MLflowLogger()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trained_model, report = train_incremental(file_path, state_path, alpha=alpha, artifact_dir=tmp_dir)
+            if not report["new_rows"]:
+                logging.info("No new rows since the last run. Keeping the current model.")
+                return report
+            
+            tracker.log_metric("new_rows", report["new_rows"])
+            tracker.log_metric("total_rows", report["total_rows"])
+            if "R-Squared" in report:
+                # Scores of the previous model on the new rows, before they were learned.
+                tracker.log_metric("prev_model_MSE_on_new_rows", report["Mean Squared Error"])
+                tracker.log_metric("prev_model_R2_on_new_rows", report["R-Squared"])
+            _log_model(trained_model, tracker, registered_model_name="IncrementalLinearRegressionModel")
+            # The category codes follow the order of first appearance, so the
+            # model is only usable with the dictionary it was trained with.
+            tracker.log_artifact(os.path.join(tmp_dir, "transform_state.json"), "transform")
+            tracker.log_artifact(os.path.join(tmp_dir, "incremental_state.json"), "transform")
+        return report
+
+    except Exception as e:
+        logging.warning(f"Error occur while running incremental training pipeline: {e}")
+        raise e
+
+
+def _log_serving_artifacts(trained_model, df_cleaned: pd.DataFrame, categorical_features, target_columns, tracker: MLflowLogger):
+    # The serving side needs the fitted encoders next to the model, and the
+    # compiled NumPy predictor built from both.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        transform_path = os.path.join(tmp_dir, "transform_state.json")
+        save_transform_state(df_cleaned, transform_path, strategy="label_encoding", features=list(categorical_features))
+        tracker.log_artifact(transform_path, "transform")
+        
+        predictor_path = os.path.join(tmp_dir, "predictor.npz")
+        export_predictor(trained_model, predictor_path, transform_path, target_columns=list(target_columns))
+        tracker.log_artifact(predictor_path, "fast_predictor")
+
+
+def _log_to_mlflow(trained_model, evaluation_metrics: dict, tracker: MLflowLogger = None):
+    tracker = tracker or MLflowLogger()
+    tracker.log_metric("MSE", evaluation_metrics["Mean Squared Error"])
+    tracker.log_metric("R2", evaluation_metrics["R-Squared"])
+    _log_model(trained_model, tracker)
+
+
+def _log_model(trained_model, tracker: MLflowLogger, registered_model_name: str = "LinearRegressionModel"):
+    tracking_url_type_store = urlparse(tracker.get_tracking_uri()).scheme
+    if tracking_url_type_store != "file":
+        tracker.log_model(trained_model, "model", registered_model_name=registered_model_name)
+    else:
+        tracker.log_model(trained_model, "model")
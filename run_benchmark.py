@@ -0,0 +1,46 @@
+import os
+import json
+import argparse
+import logging
+
+from src.benchmark import BenchmarkSuite, compare, measure_startup
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the training steps on synthetic data of growing size.")
+    parser.add_argument("--sizes", nargs="*", type=lambda s: int(float(s)), default=[10_000, 100_000, 1_000_000], help="Numbers of rows, e.g. 1e4 1e5 1e6. Pass no size to only measure the startup.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size.")
+    parser.add_argument("--data-dir", default=".cache/benchmark", help="Directory of the generated CSV files.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run of every size.")
+    parser.add_argument("--no-schema", action="store_true", help="Ingest with the parsed dtypes instead of the compact schema.")
+    parser.add_argument("--startup", action="store_true", help="Also measure the import cost of the entry points.")
+    parser.add_argument("--output", default="benchmark_report.json", help="Where to write the JSON report.")
+    parser.add_argument("--compare", help="Baseline report to compare the new report with.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown flagged as a regression.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    suite = BenchmarkSuite(sizes=args.sizes, repeat=args.repeat, data_dir=args.data_dir, measure_memory=not args.no_memory, schema=not args.no_schema)
+    report = suite.run()
+    if args.startup:
+        report["startup"] = measure_startup()
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for result in report["results"]:
+        if result["error"]:
+            print(f"{result['rows']:>12,} rows  failed: {result['error']}")
+            continue
+        steps = "  ".join(f"{name} {step['wall_seconds']:.3f}s {step['bytes_per_row_out'] or 0:.0f}B/row" for name, step in result["steps"].items())
+        print(f"{result['rows']:>12,} rows  {steps}")
+    for module, startup in report.get("startup", {}).items():
+        print(f"import {module:<30} {startup['import_seconds']:.3f}s  loads {', '.join(startup['loaded']) or 'nothing heavy'}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        comparison = compare(baseline, report, threshold=args.threshold)
+        print(comparison.to_string(index=False))
+        if comparison["regression"].any():
+            raise SystemExit(1)
@@ -1,22 +1,79 @@
-import mlflow
+import sys
+import argparse
 import logging
-from pipelines.training_pipeline import train_pipeline
+
+
+SPOOL_DIR = ".cache/mlflow_spool"
 
 
 if __name__ == "__main__":
     remote_server_uri = "http://ec2-13-212-243-180.ap-southeast-1.compute.amazonaws.com:5000/"
-    mlflow.set_tracking_uri(remote_server_uri)
     
-    if not mlflow.active_run():
-        mlflow.start_run()
+    parser = argparse.ArgumentParser(description="Train the student performance model.")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every step instead of loading cached outputs.")
+    parser.add_argument("--incremental", action="store_true", help="Only learn the rows appended since the last incremental run.")
+    parser.add_argument("--tracking-uri", default=remote_server_uri, help="MLflow tracking URI, e.g. file:./mlruns for local testing.")
+    parser.add_argument("--sync-logging", action="store_true", help="Log to MLflow synchronously instead of through the background spool.")
+    parser.add_argument("--profile", metavar="PATH", help="Measure every step and strategy call, write the JSON report to PATH and log it to MLflow.")
+    parser.add_argument("--profile-dumps", metavar="DIR", help="With --profile, also write a cProfile dump per step to DIR.")
+    parser.add_argument("--batch", metavar="DIR_OR_GLOB", help="Train one model per CSV file of a directory or glob pattern, each in a child run, then exit.")
+    parser.add_argument("--max-workers", type=int, default=None, help="With --batch, number of files trained at the same time. Defaults to one per CPU.")
+    parser.add_argument("--replay-spool", action="store_true", help="Deliver the MLflow logs spooled while the server was unreachable, then exit.")
+    args = parser.parse_args()
+    
+    # Imported after parsing so --help and --replay-spool do not load the pipeline.
+    from src.mlflow_logger import MLflowLogger, AsyncMLflowLogger, replay_spool
+    
+    if args.replay_spool:
+        sys.exit(0 if replay_spool(SPOOL_DIR) else 1)
+    
+    if args.batch:
+        import json
+        import mlflow
+        from pipelines.training_pipeline import batch_train_pipeline
+        
+        # The parent run must exist before the workers start their child runs,
+        # and only receives the summary, so it is logged synchronously.
+        mlflow.set_tracking_uri(args.tracking_uri)
+        with mlflow.start_run(run_name="batch"):
+            summary = batch_train_pipeline(args.batch, max_workers=args.max_workers)
+        print(json.dumps({key: value for key, value in summary.items() if key != "jobs"}, indent=2))
+        sys.exit(0 if not summary["failed"] else 1)
+    
+    if args.sync_logging:
+        import mlflow
+        
+        mlflow.set_tracking_uri(args.tracking_uri)
+        if not mlflow.active_run():
+            mlflow.start_run()
+        tracker = MLflowLogger()
+    else:
+        # mlflow is then imported by the logger's worker thread while the steps run.
+        tracker = AsyncMLflowLogger(spool_dir=SPOOL_DIR, tracking_uri=args.tracking_uri)
+    
+    from pipelines.training_pipeline import train_pipeline, incremental_train_pipeline
+    from src.instrumentation import StepProfiler
         
+    profiler = StepProfiler(profile_dir=args.profile_dumps) if args.profile else None
+    status = "FINISHED"
     try:
-        metrics = train_pipeline(r"E:\Project 2\extracted_data\StudentsPerformance.csv")
+        file_path = r"E:\Project 2\extracted_data\StudentsPerformance.csv"
+        if args.incremental:
+            metrics = incremental_train_pipeline(file_path, state_path=".cache/incremental/state.pkl", tracker=tracker)
+        else:
+            cache_dirs = {} if args.no_cache else {"cache_dir": ".cache/ingestion", "step_cache_dir": ".cache/steps"}
+            metrics = train_pipeline(file_path, tracker=tracker, profiler=profiler, **cache_dirs)
         print(metrics)
+        if profiler is not None:
+            profiler.to_json(args.profile)
         
     except Exception as e:
+        status = "FAILED"
         logging.error(f"Error during model training: {e}")
         raise e
     
     finally:
-        mlflow.end_run()
\ No newline at end of file
+        if args.sync_logging:
+            mlflow.end_run(status)
+        else:
+            tracker.close(status=status)
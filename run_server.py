@@ -0,0 +1,30 @@
+import asyncio
+import argparse
+import logging
+
+from src.inference_server import InferenceServer, load_predictor, load_fast_predictor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve student score predictions over HTTP.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--model-uri", help="MLflow model URI, e.g. runs:/<run_id>/model.")
+    group.add_argument("--predictor-uri", help="Compiled predictor, e.g. runs:/<run_id>/fast_predictor/predictor.npz.")
+    parser.add_argument("--transform-uri", help="Transform state logged with the model, e.g. runs:/<run_id>/transform/transform_state.json.")
+    parser.add_argument("--targets", nargs="*", default=["math score", "reading score", "writing score"], help="Names of the predicted targets.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Maximum number of rows per micro-batch.")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Maximum time a micro-batch waits for more rows.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    
+    if args.predictor_uri:
+        predictor = load_fast_predictor(args.predictor_uri)
+    else:
+        predictor = load_predictor(args.model_uri, args.transform_uri, target_columns=args.targets)
+    server = InferenceServer(predictor, host=args.host, port=args.port, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,204 @@
+import os
+import glob
+import time
+import logging
+import statistics
+import multiprocessing
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+
+def find_files(path: str) -> List[str]:
+    """
+    Expands a directory or a glob pattern into the CSV files to train on.
+
+    Args:
+        path (str): A directory (its *.csv files), a glob pattern such as "data/**/*.csv", or one file.
+
+    Returns:
+        List[str]: The files, sorted.
+    """
+    if os.path.isdir(path):
+        files = glob.glob(os.path.join(path, "*.csv"))
+    else:
+        files = glob.glob(path, recursive=True)
+    files = sorted(file for file in files if os.path.isfile(file))
+    if not files:
+        raise FileNotFoundError(f"No CSV files match {path}.")
+    return files
+
+
+def _train_file(file_path: str, tracking_uri: str, experiment_id: str, parent_run_id: str) -> dict:
+    """
+    Trains on one file in its own MLflow child run. Runs in a worker.
+    """
+    row = {"file": file_path, "run_id": None, "rows": None}
+    start = time.perf_counter()
+    try:
+        try:
+            from threadpoolctl import threadpool_limits
+            # One BLAS thread per worker, the pool provides the parallelism.
+            threadpool_limits(1)
+        except ImportError:
+            pass
+
+        import mlflow
+        from pipelines.training_pipeline import train_pipeline
+        from src.mlflow_logger import MLflowLogger
+        from src.instrumentation import StepProfiler
+
+        mlflow.set_tracking_uri(tracking_uri)
+        tags = {"mlflow.parentRunId": parent_run_id, "batch.file": file_path} if parent_run_id else {"batch.file": file_path}
+        profiler = StepProfiler(measure_bytes=False)
+        # The run ends FAILED when the pipeline raises.
+        with mlflow.start_run(experiment_id=experiment_id, run_name=os.path.basename(file_path), tags=tags) as run:
+            row["run_id"] = run.info.run_id
+            row.update(train_pipeline(file_path, tracker=MLflowLogger(), profiler=profiler))
+        for record in profiler.records:
+            if record["name"] == "ingest" and record["parent"] is None:
+                row["rows"] = record["rows_out"]
+    except Exception as e:
+        row["error"] = repr(e)
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+class BatchTrainer:
+    """
+    Trains one model per CSV file on a pool of worker processes.
+
+    Every file runs the whole training pipeline in its own MLflow child run
+    of the parent run, so a batch of files shows up as one run with one
+    child per file. At most max_workers files are in flight. A file that
+    fails is recorded with its error and does not stop the others; when a
+    worker process dies (out of memory, killed), the pool is rebuilt and
+    the files it was running are retried up to max_attempts times.
+
+    The workers are spawned rather than forked, so they do not inherit the
+    parent's active MLflow run, and they behave the same on Windows.
+    """
+    def __init__(self, max_workers: int = None, tracking_uri: str = None, experiment_id: str = None, parent_run_id: str = None, max_attempts: int = 2, mp_context: str = "spawn"):
+        """
+        Initializes the BatchTrainer.
+
+        Args:
+            max_workers (int, optional): Number of worker processes and of files in flight. Defaults to None (one per CPU).
+            tracking_uri (str, optional): MLflow tracking URI of the child runs. Defaults to None (the current one).
+            experiment_id (str, optional): Experiment of the child runs. Defaults to None (the parent's, else the default).
+            parent_run_id (str, optional): Run the child runs are nested under. Defaults to None (the active run, if any).
+            max_attempts (int): Times a file is started when worker processes die under it. Defaults to 2.
+            mp_context (str): Start method of the workers. Defaults to "spawn".
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.tracking_uri = tracking_uri
+        self.experiment_id = experiment_id
+        self.parent_run_id = parent_run_id
+        self.max_attempts = max_attempts
+        self.mp_context = mp_context
+        self.wall_seconds = None
+
+    def run(self, files: List[str]) -> pd.DataFrame:
+        """
+        Trains on every file.
+
+        Args:
+            files (List[str]): The CSV files, see find_files.
+
+        Returns:
+            pd.DataFrame: One row per file, in the given order, with its status, child run, rows, seconds and metrics or error.
+        """
+        import mlflow
+
+        tracking_uri = self.tracking_uri or mlflow.get_tracking_uri()
+        parent_run_id, experiment_id = self.parent_run_id, self.experiment_id
+        active = mlflow.active_run()
+        if parent_run_id is None and active is not None:
+            parent_run_id = active.info.run_id
+        if experiment_id is None and active is not None:
+            experiment_id = active.info.experiment_id
+
+        logging.info(f"Training on {len(files)} files with {self.max_workers} workers.")
+        pending = list(files)
+        attempts = {file: 0 for file in files}
+        rows = {}
+        start = time.perf_counter()
+        while pending:
+            pending = self._run_pool(pending, attempts, rows, tracking_uri, experiment_id, parent_run_id)
+        self.wall_seconds = time.perf_counter() - start
+        logging.info(f"Batch completed in {self.wall_seconds:.2f}s.")
+
+        results = pd.DataFrame([rows[file] for file in files])
+        results.insert(1, "status", results["error"].isna().map({True: "FINISHED", False: "FAILED"}) if "error" in results else "FINISHED")
+        for row in results.itertuples():
+            if row.status == "FAILED":
+                logging.warning(f"Training on {row.file} failed: {row.error}.")
+        return results
+
+    def summary(self, results: pd.DataFrame) -> dict:
+        """
+        Aggregates the throughput and timings of a run.
+
+        Args:
+            results (pd.DataFrame): The output of run.
+
+        Returns:
+            dict: File and row counts, wall time, files and rows per second, and job time percentiles.
+        """
+        succeeded = results[results["status"] == "FINISHED"]
+        seconds = sorted(results["seconds"].dropna())
+        rows = int(succeeded["rows"].fillna(0).sum()) if "rows" in succeeded else 0
+        wall = self.wall_seconds or sum(seconds)
+        return {
+            "files": len(results),
+            "succeeded": len(succeeded),
+            "failed": len(results) - len(succeeded),
+            "workers": self.max_workers,
+            "rows": rows,
+            "wall_seconds": wall,
+            "files_per_second": len(succeeded) / wall if wall > 0 else None,
+            "rows_per_second": rows / wall if wall > 0 else None,
+            "job_seconds_total": sum(seconds),
+            "job_seconds_p50": statistics.median(seconds) if seconds else None,
+            "job_seconds_p95": seconds[min(len(seconds) - 1, int(0.95 * len(seconds)))] if seconds else None,
+            "job_seconds_max": seconds[-1] if seconds else None,
+            # Share of the workers' wall time spent training.
+            "parallel_efficiency": sum(seconds) / (wall * self.max_workers) if wall > 0 else None,
+        }
+
+    def _run_pool(self, files: List[str], attempts: dict, rows: dict, tracking_uri: str, experiment_id: str, parent_run_id: str) -> List[str]:
+        # Runs the files until they are done or the pool breaks; returns the files to run again.
+        queue = list(files)
+        running = {}
+        context = multiprocessing.get_context(self.mp_context)
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as pool:
+            try:
+                while queue or running:
+                    # Submit as workers free up, so a broken pool only loses the files in flight.
+                    while queue and len(running) < self.max_workers:
+                        file = queue.pop(0)
+                        attempts[file] += 1
+                        running[pool.submit(_train_file, file, tracking_uri, experiment_id, parent_run_id)] = file
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        rows[running.pop(future)] = future.result()
+            except BrokenProcessPool as e:
+                retry = []
+                for future, file in running.items():
+                    if future.done() and future.exception() is None:
+                        rows[file] = future.result()
+                    elif attempts[file] < self.max_attempts:
+                        retry.append(file)
+                    else:
+                        rows[file] = {"file": file, "run_id": None, "rows": None, "error": repr(e), "seconds": None}
+                logging.warning(f"A worker process died; retrying {len(retry)} of the files in flight.")
+                return retry + queue
+        return []
+
+
+if __name__ == "__main__":
+    pass
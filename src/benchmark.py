@@ -0,0 +1,267 @@
+import os
+import sys
+import json
+import time
+import logging
+import platform
+import statistics
+import subprocess
+import pandas as pd
+import numpy as np
+
+from datetime import datetime, timezone
+from typing import List
+
+from src.instrumentation import StepProfiler
+from src.synthetic_data import StudentPerformanceGenerator
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA
+from steps.data_ingestion_step import ingest
+from steps.data_cleaning_step import clean
+from steps.data_transforming_step import transform
+from steps.data_splitting_step import split
+from steps.model_training_step import train
+from steps.model_evaluator_step import evaluate
+
+
+STEPS = ["ingest", "clean", "transform", "split", "train", "evaluate"]
+REPORT_VERSION = 1
+
+# Entry points whose import cost is tracked, and the dependencies worth loading lazily.
+STARTUP_MODULES = [
+    "run_pipeline",
+    "pipelines.training_pipeline",
+    "src.mlflow_logger",
+    "src.model_training",
+    "src.inference_server",
+    "src.fast_predictor",
+]
+HEAVY_MODULES = ["pandas", "scipy", "sklearn", "mlflow"]
+_IMPORT_SCRIPT = (
+    "import sys, time, json\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "seconds = time.perf_counter() - start\n"
+    "print(json.dumps({{'seconds': seconds, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))\n"
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_steps(file_path: str, schema: bool = True):
+    df = ingest(file_path, schema=STUDENT_PERFORMANCE_SCHEMA if schema else None)
+    df_cleaned = clean(df)
+    numerical_features = df_cleaned.select_dtypes(include=np.number).columns
+    categorical_features = df_cleaned.select_dtypes(include=["O", "category"]).columns
+    df_transformed = transform(df_cleaned, strategy="label_encoding", features=categorical_features)
+    X_train, X_test, y_train, y_test = split(df_transformed, numerical_features)
+    model = train(X_train, y_train)
+    evaluate(model, X_test, y_test)
+
+
+def _top_level(profiler: StepProfiler) -> dict:
+    return {record["name"]: record for record in profiler.records if record["parent"] is None}
+
+
+def environment() -> dict:
+    """
+    Describes the machine and library versions a report was produced with.
+
+    Returns:
+        dict: Python, platform, CPU count, library versions and git commit.
+    """
+    import sklearn
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scikit-learn": sklearn.__version__,
+        "git_commit": commit,
+    }
+
+
+class BenchmarkSuite:
+    """
+    Times and memory-profiles the training steps on synthetic data of growing size.
+
+    For every size, the synthetic CSV is generated once and kept in
+    data_dir. The steps then run repeat times with a StepProfiler for
+    timings, and once more with tracemalloc for the peak memory of each
+    step, so that tracing never slows down the timed runs.
+    """
+    def __init__(self, sizes: List[int] = (10_000, 100_000, 1_000_000), repeat: int = 3, data_dir: str = ".cache/benchmark", measure_memory: bool = True, source: str = "extracted_data/StudentsPerformance.csv", seed: int = 42, schema: bool = True):
+        """
+        Initializes the BenchmarkSuite.
+
+        Args:
+            sizes (List[int]): Numbers of rows to benchmark. Defaults to 10^4, 10^5 and 10^6.
+            repeat (int): Timed runs per size; the report keeps the median. Defaults to 3.
+            data_dir (str): Directory of the generated CSV files. Defaults to ".cache/benchmark".
+            measure_memory (bool): Add a tracemalloc run per size. Defaults to True.
+            source (str): Real data the generator learns from. Defaults to "extracted_data/StudentsPerformance.csv".
+            seed (int): Seed of the generator. Defaults to 42.
+            schema (bool): Ingest with STUDENT_PERFORMANCE_SCHEMA (compact dtypes). Defaults to True.
+        """
+        self.sizes = [int(size) for size in sizes]
+        self.repeat = repeat
+        self.data_dir = data_dir
+        self.measure_memory = measure_memory
+        self.source = source
+        self.seed = seed
+        self.schema = schema
+
+    def run(self) -> dict:
+        """
+        Runs the benchmark for every size.
+
+        Returns:
+            dict: The machine-readable report.
+        """
+        # The steps import scikit-learn on first use; import it now so the first
+        # timed step does not pay for it. measure_startup reports import costs.
+        import sklearn.linear_model
+        import sklearn.model_selection
+        import sklearn.metrics
+
+        generator = StudentPerformanceGenerator(seed=self.seed).fit(pd.read_csv(self.source))
+        results = []
+        for size in self.sizes:
+            logging.info(f"Benchmarking {size} rows.")
+            result = {"rows": size, "error": None}
+            try:
+                result.update(self._run_size(generator, size))
+            except Exception as e:  # MemoryError at the largest sizes included.
+                logging.warning(f"Benchmark of {size} rows failed: {e!r}.")
+                result["error"] = repr(e)
+            results.append(result)
+        return {
+            "version": REPORT_VERSION,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "environment": environment(),
+            "config": {"sizes": self.sizes, "repeat": self.repeat, "measure_memory": self.measure_memory, "seed": self.seed, "schema": self.schema},
+            "results": results,
+        }
+
+    def _run_size(self, generator: StudentPerformanceGenerator, size: int) -> dict:
+        path = os.path.join(self.data_dir, f"students_{size}_{self.seed}.csv")
+        generate_seconds = None
+        if not os.path.exists(path):
+            start = time.perf_counter()
+            generator.write_csv(path, size)
+            generate_seconds = time.perf_counter() - start
+
+        runs = []
+        for _ in range(self.repeat):
+            profiler = StepProfiler()
+            with profiler.activate():
+                _run_steps(path, self.schema)
+            runs.append(_top_level(profiler))
+
+        steps = {}
+        for name in STEPS:
+            walls = [run[name]["wall_seconds"] for run in runs]
+            cpus = [run[name]["cpu_seconds"] for run in runs]
+            wall = statistics.median(walls)
+            rows = runs[0][name]["rows_out"] or runs[0][name]["rows_in"] or size
+            steps[name] = {
+                "wall_seconds": wall,
+                "wall_seconds_min": min(walls),
+                "cpu_seconds": statistics.median(cpus),
+                "rows_per_second": rows / wall if wall > 0 else None,
+                "peak_rss_delta_bytes": runs[0][name]["peak_rss_delta_bytes"],
+                "bytes_per_row_in": runs[0][name].get("bytes_per_row_in"),
+                "bytes_per_row_out": runs[0][name].get("bytes_per_row_out"),
+            }
+
+        if self.measure_memory:
+            profiler = StepProfiler(trace_memory=True, measure_bytes=False)
+            with profiler.activate():
+                _run_steps(path, self.schema)
+            for name, record in _top_level(profiler).items():
+                if name in steps:
+                    steps[name]["traced_peak_bytes"] = record.get("traced_peak_bytes")
+
+        return {
+            "file_bytes": os.path.getsize(path),
+            "generate_seconds": generate_seconds,
+            "total_wall_seconds": sum(step["wall_seconds"] for step in steps.values()),
+            "steps": steps,
+        }
+
+
+def measure_startup(modules: List[str] = STARTUP_MODULES, repeat: int = 5) -> dict:
+    """
+    Measures the import cost of entry points, each in a fresh interpreter.
+
+    Args:
+        modules (List[str]): Modules to import. Defaults to STARTUP_MODULES.
+        repeat (int): Fresh interpreters per module; the report keeps the median. Defaults to 5.
+
+    Returns:
+        dict: Per module, the import time, the process time (interpreter start included) and the heavy dependencies it loaded.
+    """
+    results = {}
+    for module in modules:
+        script = _IMPORT_SCRIPT.format(module=module, heavy=HEAVY_MODULES)
+        imports, processes = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+            processes.append(time.perf_counter() - start)
+            measured = json.loads(output.strip().splitlines()[-1])
+            imports.append(measured["seconds"])
+        results[module] = {
+            "import_seconds": statistics.median(imports),
+            "process_seconds": statistics.median(processes),
+            "loaded": measured["loaded"],
+        }
+        logging.info(f"Importing {module} took {results[module]['import_seconds']:.3f}s, loading {measured['loaded']}.")
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> pd.DataFrame:
+    """
+    Compares the step timings, memory and import costs of two reports.
+
+    Args:
+        baseline (dict): The reference report.
+        current (dict): The new report.
+        threshold (float): Relative increase flagged as a regression. Defaults to 0.1 (10%).
+
+    Returns:
+        pd.DataFrame: One row per size, step and measure with both values, their ratio and a regression flag.
+    """
+    reference = {result["rows"]: result for result in baseline["results"] if not result.get("error")}
+    rows = []
+    for result in current["results"]:
+        if result.get("error") or result["rows"] not in reference:
+            continue
+        for name, step in result["steps"].items():
+            before = reference[result["rows"]]["steps"].get(name, {})
+            for measure in ("wall_seconds", "traced_peak_bytes", "bytes_per_row_out"):
+                if before.get(measure) and step.get(measure) is not None:
+                    ratio = step[measure] / before[measure]
+                    rows.append({
+                        "rows": result["rows"], "step": name, "measure": measure,
+                        "baseline": before[measure], "current": step[measure],
+                        "ratio": ratio, "regression": ratio > 1 + threshold,
+                    })
+    for module, startup in current.get("startup", {}).items():
+        before = baseline.get("startup", {}).get(module)
+        if before and before["import_seconds"]:
+            ratio = startup["import_seconds"] / before["import_seconds"]
+            rows.append({
+                "rows": None, "step": f"import {module}", "measure": "import_seconds",
+                "baseline": before["import_seconds"], "current": startup["import_seconds"],
+                "ratio": ratio, "regression": ratio > 1 + threshold,
+            })
+    return pd.DataFrame(rows, columns=["rows", "step", "measure", "baseline", "current", "ratio", "regression"])
+
+
+if __name__ == "__main__":
+    pass
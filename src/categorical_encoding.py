@@ -0,0 +1,240 @@
+import logging
+import pandas as pd
+import numpy as np
+import scipy.sparse as sp
+
+from typing import List, Tuple
+
+
+# Code given to categories that are not in the dictionary (and to missing values).
+UNSEEN_CODE = -1
+
+
+class CategoryDictionary:
+    """
+    Per-column category dictionary shared by the categorical encoders.
+
+    Codes are positions in the per-column category index, so a dictionary
+    fitted once can encode any number of later batches with identical codes.
+    """
+    def __init__(self, categories: dict = None):
+        """
+        Initializes the CategoryDictionary.
+
+        Args:
+            categories (dict, optional): Mapping of column to its ordered categories. Defaults to None.
+        """
+        self.categories = {
+            feature: pd.Index(values) for feature, values in (categories or {}).items()
+        }
+
+    def fit(self, df: pd.DataFrame, features: list) -> "CategoryDictionary":
+        """
+        Learns the sorted categories of the features, replacing what was known.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+            features (list): Categorical columns to learn.
+
+        Returns:
+            CategoryDictionary: The fitted dictionary.
+        """
+        for feature in features:
+            self.categories[feature] = pd.Index(_observed(df[feature])).sort_values()
+        return self
+
+    def fit_statistics(self, stats, features: list) -> "CategoryDictionary":
+        """
+        Learns the sorted categories of the features from statistics merged over row shards.
+
+        Categorical and string columns always keep their value counts in the
+        statistics; a numeric feature needs at most stats.max_distinct values.
+
+        Args:
+            stats (ColumnStatistics): Statistics of the whole data.
+            features (list): Categorical columns to learn.
+
+        Returns:
+            CategoryDictionary: The fitted dictionary.
+        """
+        for feature in features:
+            self.categories[feature] = pd.Index(stats.categories(feature)).sort_values()
+        return self
+
+    def update(self, df: pd.DataFrame, features: list) -> "CategoryDictionary":
+        """
+        Appends categories not seen before, keeping the existing codes stable.
+
+        Args:
+            df (pd.DataFrame): The next batch of data.
+            features (list): Categorical columns to learn.
+
+        Returns:
+            CategoryDictionary: The updated dictionary.
+        """
+        for feature in features:
+            seen = self.categories.get(feature)
+            batch = pd.Index(_observed(df[feature])).sort_values()
+            if seen is None:
+                self.categories[feature] = batch
+            else:
+                new = batch.difference(seen, sort=False)
+                if len(new):
+                    logging.info(f"Adding {len(new)} new categories to '{feature}'.")
+                    self.categories[feature] = seen.append(new)
+        return self
+
+    def encode(self, df: pd.DataFrame, features: list, handle_unknown: str = "error") -> np.ndarray:
+        """
+        Converts the features to integer codes in one vectorized pass per column.
+
+        Args:
+            df (pd.DataFrame): The data to encode.
+            features (list): Categorical columns to encode.
+            handle_unknown (str): "error" to raise on unseen categories, "reserve" to map them to UNSEEN_CODE. Defaults to "error".
+
+        Returns:
+            np.ndarray: An (n_rows, n_features) array of codes, in the smallest signed integer type holding them (int8 up to 128 categories).
+        """
+        n_categories = max((len(self._categories(feature)) for feature in features), default=1)
+        codes = np.empty((len(df), len(features)), dtype=np.min_scalar_type(-max(n_categories, 1)))
+        for i, feature in enumerate(features):
+            categories = self._categories(feature)
+            series = df[feature]
+            if isinstance(series.dtype, pd.CategoricalDtype) and series.cat.categories.equals(categories):
+                codes[:, i] = series.cat.codes.to_numpy()
+            elif isinstance(series.dtype, pd.CategoricalDtype):
+                # Only the (small) category index is looked up, then gathered
+                # by code; code -1 (missing) picks the appended UNSEEN_CODE.
+                lookup = np.append(categories.get_indexer(series.cat.categories.astype(categories.dtype)), UNSEEN_CODE)
+                codes[:, i] = lookup[series.cat.codes.to_numpy()]
+            else:
+                # One hash lookup per value; unseen and missing values give -1.
+                codes[:, i] = categories.get_indexer(series)
+            if handle_unknown == "error":
+                unseen = codes[:, i] == UNSEEN_CODE
+                if unseen.any():
+                    values = df[feature].to_numpy()[unseen]
+                    raise ValueError(f"Feature '{feature}' contains previously unseen labels: {list(pd.unique(values))}.")
+        return codes
+
+    def one_hot_layout(self, features: list, drop_first: bool = False) -> Tuple[np.ndarray, List[str]]:
+        """
+        Returns the column offset of every feature in the one-hot matrix and the column names.
+
+        Args:
+            features (list): Encoded columns, in the order used by encode.
+            drop_first (bool): Whether the first category of each feature is dropped. Defaults to False.
+
+        Returns:
+            Tuple[np.ndarray, List[str]]: Per-feature column offsets and the one-hot column names.
+        """
+        start = int(drop_first)
+        widths = [len(self._categories(feature)) - start for feature in features]
+        offsets = np.concatenate([[0], np.cumsum(widths)[:-1]]).astype(np.int64)
+        columns = [
+            f"{feature}_{category}"
+            for feature in features
+            for category in self._categories(feature)[start:]
+        ]
+        return offsets, columns
+
+    def one_hot_indices(self, codes: np.ndarray, features: list, drop_first: bool = False) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        Locates the non-zero cells of the one-hot matrix built from codes.
+
+        Unseen codes (and the first category when drop_first is set) produce
+        an all-zeros block for their feature.
+
+        Args:
+            codes (np.ndarray): Codes returned by encode.
+            features (list): Encoded columns, in the order used by encode.
+            drop_first (bool): Whether the first category of each feature is dropped. Defaults to False.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, List[str]]: Row indices, column indices and the one-hot column names.
+        """
+        offsets, columns = self.one_hot_layout(features, drop_first)
+        shifted = codes - int(drop_first)
+        rows, positions = np.nonzero(shifted >= 0)
+        return rows, shifted[rows, positions] + offsets[positions], columns
+
+    def one_hot(self, codes: np.ndarray, features: list, drop_first: bool = False, dtype=np.float64) -> Tuple[np.ndarray, List[str]]:
+        """
+        Builds the dense one-hot matrix directly from codes.
+
+        Args:
+            codes (np.ndarray): Codes returned by encode.
+            features (list): Encoded columns, in the order used by encode.
+            drop_first (bool): Whether the first category of each feature is dropped. Defaults to False.
+            dtype (np.dtype): dtype of the matrix. Defaults to np.float64.
+
+        Returns:
+            Tuple[np.ndarray, List[str]]: The one-hot matrix and its column names.
+        """
+        rows, cols, columns = self.one_hot_indices(codes, features, drop_first)
+        matrix = np.zeros((len(codes), len(columns)), dtype=dtype)
+        matrix[rows, cols] = 1
+        return matrix, columns
+
+    def one_hot_sparse(self, codes: np.ndarray, features: list, drop_first: bool = False, dtype=np.float64) -> Tuple[sp.csr_matrix, List[str]]:
+        """
+        Builds the one-hot matrix from codes as a CSR matrix without densifying it.
+
+        Args:
+            codes (np.ndarray): Codes returned by encode.
+            features (list): Encoded columns, in the order used by encode.
+            drop_first (bool): Whether the first category of each feature is dropped. Defaults to False.
+            dtype (np.dtype): dtype of the matrix. Defaults to np.float64.
+
+        Returns:
+            Tuple[sp.csr_matrix, List[str]]: The one-hot matrix and its column names.
+        """
+        rows, cols, columns = self.one_hot_indices(codes, features, drop_first)
+        # np.nonzero walks row by row with increasing offsets, so the indices
+        # are already in CSR order.
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=len(codes)))])
+        matrix = sp.csr_matrix(
+            (np.ones(len(rows), dtype=dtype), cols, indptr),
+            shape=(len(codes), len(columns)),
+        )
+        return matrix, columns
+
+    def check_fitted(self, features: list):
+        """
+        Checks that categories were learned for every feature.
+
+        Args:
+            features (list): Categorical columns to check.
+
+        Raises:
+            ValueError: When a feature has no categories.
+        """
+        for feature in features:
+            self._categories(feature)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the dictionary as JSON-serializable lists.
+
+        Returns:
+            dict: Mapping of column to its ordered categories.
+        """
+        return {feature: categories.tolist() for feature, categories in self.categories.items()}
+
+    def _categories(self, feature: str) -> pd.Index:
+        if feature not in self.categories:
+            raise ValueError(f"No categories learned for feature '{feature}'. Call fit before encoding.")
+        return self.categories[feature]
+
+
+def _observed(series: pd.Series):
+    values = series.dropna().unique()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # The observed categories as plain values, like an uncategorized column.
+        values = values.astype(series.cat.categories.dtype)
+    return values
+
+
+if __name__ == "__main__":
+    pass
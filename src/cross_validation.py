@@ -0,0 +1,110 @@
+import os
+import logging
+import pandas as pd
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from src.data_splitting import CrossValidationFolds, fold_frames
+from src.model_training import ModelTrainer, ModelTrainingStrategy, LinearRegressionStrategy
+from src.model_evaluation import ModelEvaluator, ModelEvaluationStrategy, RegressionLinearEvaluationStrategy
+from src.model_sweep import SharedArray
+
+
+def _evaluate_fold(fold: int, X, y, feature_columns, target_columns, train_idx, test_idx, training_strategy, evaluation_strategy) -> dict:
+    X_train, X_test, y_train, y_test = fold_frames(X, y, feature_columns, target_columns, train_idx, test_idx)
+    model = ModelTrainer(training_strategy).train(X_train, y_train)
+    metrics = ModelEvaluator(evaluation_strategy).evaluate(model, X_test, y_test)
+    return {"fold": fold, **metrics}
+
+
+def _evaluate_shared_fold(fold: int, X: SharedArray, y: SharedArray, *args) -> dict:
+    try:
+        return _evaluate_fold(fold, X.open(), y.open(), *args)
+    finally:
+        X.close()
+        y.close()
+
+
+class CrossValidator:
+    """
+    Trains and evaluates every fold of a CrossValidationFolds in parallel.
+
+    With the thread executor the folds read the shared matrices directly;
+    with the process executor the matrices are placed once in shared memory.
+    Each worker gathers the rows of the fold it is working on when it starts
+    it, and drops them when the fold is evaluated. Every fold in progress
+    holds its own copy of its rows, so peak memory grows with max_workers:
+    about the shared matrices plus max_workers copies of them.
+    """
+    def __init__(self, training_strategy: ModelTrainingStrategy = None, evaluation_strategy: ModelEvaluationStrategy = None, max_workers: int = None, executor: str = "thread"):
+        """
+        Initializes the CrossValidator.
+
+        Args:
+            training_strategy (ModelTrainingStrategy, optional): Defaults to LinearRegressionStrategy.
+            evaluation_strategy (ModelEvaluationStrategy, optional): Defaults to RegressionLinearEvaluationStrategy.
+            max_workers (int, optional): Number of folds processed, and held in memory, at the same time. Defaults to None (one per CPU).
+            executor (str): "thread" or "process". Defaults to "thread".
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor: {executor}.")
+        self.training_strategy = training_strategy or LinearRegressionStrategy()
+        self.evaluation_strategy = evaluation_strategy or RegressionLinearEvaluationStrategy()
+        self.max_workers = max_workers
+        self.executor = executor
+
+    def evaluate(self, folds: CrossValidationFolds) -> pd.DataFrame:
+        """
+        Computes the evaluation metrics of every fold.
+
+        Args:
+            folds (CrossValidationFolds): The folds to evaluate.
+
+        Returns:
+            pd.DataFrame: One row of metrics per fold.
+        """
+        logging.info(f"Cross-validating {len(folds)} folds with the {self.executor} executor.")
+        args = (folds.feature_columns, folds.target_columns)
+        strategies = (self.training_strategy, self.evaluation_strategy)
+        if self.executor == "thread":
+            with ThreadPoolExecutor(max_workers=self.max_workers or os.cpu_count()) as pool:
+                futures = [
+                    pool.submit(_evaluate_fold, i, folds.X, folds.y, *args, train_idx, test_idx, *strategies)
+                    for i, (train_idx, test_idx) in enumerate(folds)
+                ]
+                rows = [future.result() for future in futures]
+        else:
+            X, y = SharedArray(folds.X), SharedArray(folds.y)
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers or os.cpu_count()) as pool:
+                    futures = [
+                        pool.submit(_evaluate_shared_fold, i, X, y, *args, train_idx, test_idx, *strategies)
+                        for i, (train_idx, test_idx) in enumerate(folds)
+                    ]
+                    rows = [future.result() for future in futures]
+            finally:
+                X.close()
+                y.close()
+        return pd.DataFrame(rows).set_index("fold")
+
+    @staticmethod
+    def summary(results: pd.DataFrame) -> dict:
+        """
+        Aggregates per-fold metrics.
+
+        Args:
+            results (pd.DataFrame): Output of evaluate.
+
+        Returns:
+            dict: Mean and standard deviation of every metric.
+        """
+        summary = {}
+        for metric in results.columns:
+            summary[metric] = float(results[metric].mean())
+            summary[f"{metric} (std)"] = float(results[metric].std(ddof=1)) if len(results) > 1 else np.nan
+        return summary
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,199 @@
+import time
+import logging
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Tuple, Union
+
+
+class Node:
+    """
+    One step of a pipeline graph with explicit inputs and outputs.
+    """
+    def __init__(self, name: str, func: Callable, inputs: Union[List[str], Dict[str, str]] = None, outputs: List[str] = None, **kwargs):
+        """
+        Initializes the Node.
+
+        Args:
+            name (str): Unique name of the node.
+            func (Callable): The step function. It must be picklable (module level) to run on a process pool.
+            inputs (Union[List[str], Dict[str, str]], optional): Names of the values passed positionally to func, or a mapping of func parameter to value name. Defaults to None.
+            outputs (List[str], optional): Names given to the return value; several names unpack a returned tuple. Defaults to None (the node name).
+            **kwargs: Constant keyword arguments passed to func.
+        """
+        self.name = name
+        self.func = func
+        inputs = inputs or []
+        self.params = list(inputs) if isinstance(inputs, dict) else None
+        self.inputs = list(inputs.values()) if isinstance(inputs, dict) else list(inputs)
+        self.outputs = list(outputs) if outputs is not None else [name]
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return f"Node({self.name!r}, inputs={self.inputs}, outputs={self.outputs})"
+
+
+def _call(func: Callable, args: tuple, kwargs: dict):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class DAGScheduler:
+    """
+    Runs a graph of Nodes, starting every node as soon as its inputs exist.
+
+    Independent nodes run concurrently on a thread or process pool. After a
+    run, timings holds the wall time of every node and critical_path the
+    chain of dependent nodes that bounds the total run time.
+    """
+    def __init__(self, nodes: List[Node], max_workers: int = 4, executor: str = "thread"):
+        """
+        Initializes the DAGScheduler.
+
+        Args:
+            nodes (List[Node]): The nodes of the graph.
+            max_workers (int): Number of nodes running at the same time. Defaults to 4.
+            executor (str): "thread" or "process". Defaults to "thread".
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unsupported executor: {executor}.")
+        self.nodes = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"Duplicate node name: {node.name}.")
+            self.nodes[node.name] = node
+        self.max_workers = max_workers
+        self.executor = executor
+        self.producers = {}
+        for node in nodes:
+            for output in node.outputs:
+                if output in self.producers:
+                    raise ValueError(f"Output '{output}' is produced by both '{self.producers[output]}' and '{node.name}'.")
+                self.producers[output] = node.name
+        self.timings = {}
+        self.critical_path = []
+        self._order = self._topological_order()
+
+    def dependencies(self, name: str) -> List[str]:
+        """
+        Returns the nodes whose outputs the node consumes.
+
+        Args:
+            name (str): Name of the node.
+
+        Returns:
+            List[str]: Names of the upstream nodes.
+        """
+        return sorted({self.producers[i] for i in self.nodes[name].inputs if i in self.producers})
+
+    def run(self, inputs: Dict[str, object] = None) -> Dict[str, object]:
+        """
+        Runs every node of the graph.
+
+        Args:
+            inputs (Dict[str, object], optional): Values not produced by any node. Defaults to None.
+
+        Returns:
+            Dict[str, object]: The given inputs plus every node output, by name.
+        """
+        values = dict(inputs or {})
+        missing = {i for node in self.nodes.values() for i in node.inputs if i not in self.producers and i not in values}
+        if missing:
+            raise ValueError(f"Missing graph inputs: {sorted(missing)}.")
+
+        pending = {name: set(self.dependencies(name)) for name in self.nodes}
+        self.timings = {}
+        pool_class = ThreadPoolExecutor if self.executor == "thread" else ProcessPoolExecutor
+        start = time.perf_counter()
+        with pool_class(max_workers=self.max_workers) as pool:
+            running = {}
+            while pending or running:
+                for name in [n for n, deps in pending.items() if not deps]:
+                    node = self.nodes[name]
+                    args = tuple(values[i] for i in node.inputs)
+                    kwargs = dict(node.kwargs)
+                    if node.params is not None:
+                        kwargs.update(zip(node.params, args))
+                        args = ()
+                    logging.info(f"Starting node '{name}'.")
+                    running[pool.submit(_call, node.func, args, kwargs)] = name
+                    del pending[name]
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        result, elapsed = future.result()
+                    except Exception as e:
+                        logging.warning(f"Node '{name}' failed: {e}.")
+                        for other in running:
+                            other.cancel()
+                        raise
+                    node = self.nodes[name]
+                    if len(node.outputs) == 1:
+                        values[node.outputs[0]] = result
+                    else:
+                        values.update(zip(node.outputs, result))
+                    self.timings[name] = elapsed
+                    logging.info(f"Node '{name}' finished in {elapsed:.3f}s.")
+                    for deps in pending.values():
+                        deps.discard(name)
+
+        self.critical_path, length = self._critical_path()
+        logging.info(
+            f"Graph finished in {time.perf_counter() - start:.3f}s. "
+            f"Critical path ({length:.3f}s): {' -> '.join(self.critical_path)}."
+        )
+        return values
+
+    def report(self) -> dict:
+        """
+        Returns the timings of the last run.
+
+        Returns:
+            dict: Per-node wall time in seconds, the critical path and its length.
+        """
+        return {
+            "timings": dict(self.timings),
+            "critical_path": list(self.critical_path),
+            "critical_path_seconds": sum(self.timings.get(n, 0.0) for n in self.critical_path),
+        }
+
+    def _critical_path(self) -> Tuple[List[str], float]:
+        finish, previous = {}, {}
+        for name in self._order:
+            deps = self.dependencies(name)
+            best = max(deps, key=lambda d: finish[d], default=None)
+            finish[name] = self.timings.get(name, 0.0) + (finish[best] if best else 0.0)
+            previous[name] = best
+        if not finish:
+            return [], 0.0
+        node = max(finish, key=finish.get)
+        length = finish[node]
+        path = []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return path[::-1], length
+
+    def _topological_order(self) -> List[str]:
+        order, state = [], {}
+
+        def visit(name, trail):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"The graph has a cycle: {' -> '.join(trail + [name])}.")
+            state[name] = "visiting"
+            for dep in self.dependencies(name):
+                visit(dep, trail + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.nodes:
+            visit(name, [])
+        return order
+
+
+if __name__ == "__main__":
+    pass
@@ -1,20 +1,30 @@
+import io
 import logging
 import pandas as pd
+import numpy as np
+
+from typing import Iterator, List, Tuple
 
 
 class IngestData:
     """
     Ingesting the data from the file_path.
     """
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, dtype: dict = None, engine: str = None, chunksize: int = 100_000):
         """
         Initializes the IngestData.
 
         Args:
             file_path (str): Path to the data.
+            dtype (dict): Column to dtype mapping applied while parsing. Defaults to None (let pandas infer).
+            engine (str): CSV parser engine, "c", "python" or "pyarrow". Defaults to None (pandas default).
+            chunksize (int): Number of rows per chunk yielded by iter_chunks. Defaults to 100_000.
         """
         self.file_path =file_path
-    
+        self.dtype = dtype
+        self.engine = engine
+        self.chunksize = chunksize
+
     def get_data(self) -> pd.DataFrame:
         """
         Ingesting the data from the file_path.
@@ -23,8 +33,152 @@ class IngestData:
             pd.DataFrame: A DataFrame with ingested data.
         """
         logging.info(f"Ingesting data from {self.file_path}.")
-        return pd.read_csv(self.file_path)
+        if self.engine is None:
+            return pd.read_csv(self.file_path, dtype=self.dtype)
+        return pd.read_csv(self.file_path, dtype=self.dtype, engine=self.engine)
+
+    def iter_chunks(self, chunksize: int = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams the data from the file_path in fixed-size chunks.
+
+        Only one chunk is held in memory at a time. Every chunk has exactly
+        chunksize rows except the last one. Categorical columns get their
+        categories from the chunk they belong to.
+
+        Args:
+            chunksize (int): Number of rows per chunk. Defaults to the value given at initialization.
+
+        Yields:
+            pd.DataFrame: The next chunk of ingested data.
+        """
+        chunksize = self.chunksize if chunksize is None else chunksize
+        if chunksize <= 0:
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}.")
+
+        logging.info(f"Streaming data from {self.file_path} in chunks of {chunksize} rows.")
+        if self.engine == "pyarrow":
+            yield from self._iter_arrow_chunks(chunksize)
+            return
+
+        kwargs = {} if self.engine is None else {"engine": self.engine}
+        with pd.read_csv(self.file_path, dtype=self.dtype, chunksize=chunksize, **kwargs) as reader:
+            for chunk in reader:
+                yield chunk
+
+    def iter_appended(self, offset: int = 0, columns: List[str] = None, block_bytes: int = 8 << 20) -> Iterator[Tuple[pd.DataFrame, int]]:
+        """
+        Streams the rows stored after a byte offset, e.g. rows appended since the last read.
+
+        The file is read in blocks cut at the last newline, so only complete
+        rows are parsed and a row still being written is left for the next
+        read. Quoted fields must not contain newlines.
+
+        Args:
+            offset (int): Byte offset of the first unread row, 0 to read the header and every row. Defaults to 0.
+            columns (List[str], optional): Column names, required when offset is past the header. Defaults to None.
+            block_bytes (int): Number of bytes parsed at a time. Defaults to 8 MiB.
+
+        Yields:
+            Tuple[pd.DataFrame, int]: The next block of rows and the byte offset just after it.
+        """
+        if offset and columns is None:
+            raise ValueError("columns are required to read from an offset past the header.")
+
+        logging.info(f"Reading rows of {self.file_path} appended after byte {offset}.")
+        with open(self.file_path, "rb") as f:
+            f.seek(offset)
+            if offset == 0:
+                header = f.readline()
+                columns = list(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+                offset = f.tell()
+            pending = b""
+            while True:
+                block = f.read(block_bytes)
+                if not block:
+                    break
+                block = pending + block
+                cut = block.rfind(b"\n") + 1
+                pending = block[cut:]
+                if cut == 0:
+                    continue
+                offset += cut
+                yield pd.read_csv(io.BytesIO(block[:cut]), header=None, names=columns, dtype=self.dtype), offset
+
+    def _iter_arrow_chunks(self, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Streams the data with the multithreaded pyarrow CSV reader.
+
+        pandas does not support chunksize together with engine="pyarrow", so the
+        record batches of pyarrow's streaming reader are re-sliced into chunks of
+        exactly chunksize rows.
+
+        Args:
+            chunksize (int): Number of rows per chunk.
+
+        Yields:
+            pd.DataFrame: The next chunk of ingested data.
+        """
+        try:
+            import pyarrow as pa
+            from pyarrow import csv
+        except ImportError as e:
+            raise ImportError("The pyarrow engine requires the 'pyarrow' package.") from e
+
+        pending = []
+        pending_rows = 0
+        # Empty fields are missing values, as for pandas' parsers.
+        convert_options = csv.ConvertOptions(column_types=self._arrow_types(pa), strings_can_be_null=True)
+        for batch in csv.open_csv(self.file_path, convert_options=convert_options):
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= chunksize:
+                table = pa.Table.from_batches(pending)
+                yield self._to_frame(table.slice(0, chunksize))
+                rest = table.slice(chunksize)
+                pending = rest.to_batches()
+                pending_rows = rest.num_rows
+        if pending_rows:
+            yield self._to_frame(pa.Table.from_batches(pending))
+
+    def _arrow_types(self, pa) -> dict:
+        """
+        Maps the configured dtypes to the pyarrow types the CSV is parsed into.
+
+        Categories are parsed as dictionary-encoded strings, which convert to
+        pandas categoricals; numbers are parsed into their NumPy type (or the
+        one under a nullable dtype), so missing values never reach an int.
+
+        Args:
+            pa (module): The pyarrow module.
+
+        Returns:
+            dict: Column to pyarrow type.
+        """
+        types = {}
+        for column, dtype in (self.dtype or {}).items():
+            dtype = pd.api.types.pandas_dtype(dtype)
+            if isinstance(dtype, pd.CategoricalDtype):
+                types[column] = pa.dictionary(pa.int32(), pa.string())
+            elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                types[column] = pa.from_numpy_dtype(np.dtype(getattr(dtype, "numpy_dtype", dtype)))
+        return types
+
+    def _to_frame(self, table) -> pd.DataFrame:
+        """
+        Converts a pyarrow table to a DataFrame with the configured dtypes.
+
+        Args:
+            table (pyarrow.Table): The table to convert.
+
+        Returns:
+            pd.DataFrame: A DataFrame with the configured dtypes applied.
+        """
+        df = table.to_pandas()
+        # Columns already parsed into their dtype are kept as they are; only
+        # nullable and other dtypes pyarrow has no exact type for are cast.
+        dtypes = {column: dtype for column, dtype in (self.dtype or {}).items() if column in df and df[column].dtype != pd.api.types.pandas_dtype(dtype)}
+        return df.astype(dtypes) if dtypes else df
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
@@ -0,0 +1,176 @@
+import logging
+import pandas as pd
+import numpy as np
+
+from typing import List
+
+
+class DataSchema:
+    """
+    Expected columns of a dataset and the compact dtypes they are kept in.
+
+    Categorical columns are stored as pandas categoricals, one small integer
+    code per row instead of one Python string per row. Numeric columns are
+    downcast to the smallest integer type holding their values (int8 for
+    0-100 scores), or to float32 when they have missing values or fractions.
+    The cleaning steps and the feature strategies keep these dtypes: they
+    write float32 results for float32 and small integer inputs.
+    """
+    def __init__(self, categorical: List[str], numeric: List[str], strict: bool = False):
+        """
+        Initializes the DataSchema.
+
+        Args:
+            categorical (List[str]): Columns stored as categoricals.
+            numeric (List[str]): Columns stored as compact numbers.
+            strict (bool): Reject columns that are not in the schema instead of keeping them as they are. Defaults to False.
+        """
+        self.categorical = list(categorical)
+        self.numeric = list(numeric)
+        self.strict = strict
+
+    def __repr__(self) -> str:
+        # Deterministic, so the ingestion and step caches can key on the schema.
+        return f"DataSchema(categorical={self.categorical!r}, numeric={self.numeric!r}, strict={self.strict!r})"
+
+    def read_dtypes(self) -> dict:
+        """
+        Returns the dtypes applied while parsing, before the numeric downcast.
+
+        Returns:
+            dict: Categorical columns to "category".
+        """
+        return {column: "category" for column in self.categorical}
+
+    def chunk_dtypes(self) -> dict:
+        """
+        Returns the dtypes applied while parsing data in chunks.
+
+        The numeric downcast depends on the values, so chunks downcast one by
+        one could disagree; numeric columns are parsed as float32 instead,
+        which holds small whole numbers exactly and missing values.
+
+        Returns:
+            dict: Categorical columns to "category", numeric columns to "float32".
+        """
+        return {**self.read_dtypes(), **{column: "float32" for column in self.numeric}}
+
+    def validate(self, df: pd.DataFrame):
+        """
+        Checks that the frame has every column of the schema with a usable dtype.
+
+        Args:
+            df (pd.DataFrame): The data to check.
+
+        Raises:
+            ValueError: When a column is missing, or unexpected while strict.
+            TypeError: When a numeric column holds non-numeric values.
+        """
+        missing = [column for column in self.categorical + self.numeric if column not in df.columns]
+        if missing:
+            raise ValueError(f"Columns missing from the data: {missing}.")
+        unexpected = [column for column in df.columns if column not in self.categorical and column not in self.numeric]
+        if unexpected:
+            if self.strict:
+                raise ValueError(f"Columns not in the schema: {unexpected}.")
+            logging.warning(f"Keeping columns not in the schema as they are: {unexpected}.")
+        not_numeric = [column for column in self.numeric if not pd.api.types.is_numeric_dtype(df[column])]
+        if not_numeric:
+            raise TypeError(f"Numeric columns hold non-numeric values: {not_numeric}.")
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Validates the frame and converts it to the compact dtypes.
+
+        Args:
+            df (pd.DataFrame): The ingested data.
+
+        Returns:
+            pd.DataFrame: The data with categorical and downcast numeric columns.
+        """
+        self.validate(df)
+        before = bytes_per_row(df)
+        df_compact = df.copy(deep=False)
+        for column in self.categorical:
+            if not isinstance(df_compact[column].dtype, pd.CategoricalDtype):
+                df_compact[column] = df_compact[column].astype("category")
+        for column in self.numeric:
+            df_compact[column] = _downcast(df_compact[column])
+        logging.info(f"Schema applied: {before:.1f} -> {bytes_per_row(df_compact):.1f} bytes per row.")
+        return df_compact
+
+
+def _downcast(series: pd.Series) -> pd.Series:
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any() or not np.array_equal(values, np.round(values)):
+        # NaN needs a float; scores and other small numbers are exact in float32.
+        return pd.Series(values.astype(np.float32), index=series.index, name=series.name)
+    return pd.to_numeric(pd.Series(values, index=series.index, name=series.name), downcast="integer")
+
+
+def compact_float_dtype(dtype) -> np.dtype:
+    """
+    Returns the float dtype a computed numeric column is written back in.
+
+    float32 for float32 and 8/16-bit integer columns (exact for their values),
+    float64 for every other numeric column, None for non-numeric columns.
+
+    Args:
+        dtype: dtype of the input column.
+
+    Returns:
+        np.dtype: The float dtype of the result.
+    """
+    if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return None
+    # Nullable extension dtypes (Int8, Float32, ...) expose their NumPy counterpart.
+    dtype = np.dtype(getattr(dtype, "numpy_dtype", dtype))
+    if (dtype.kind == "f" and dtype.itemsize <= 4) or (dtype.kind in "iu" and dtype.itemsize <= 2):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def restore_compact_dtypes(df: pd.DataFrame, source: pd.DataFrame) -> pd.DataFrame:
+    """
+    Casts float results back to float32 where the source columns were compact.
+
+    pandas upcasts float32 and small integers to float64 in fillna and clip
+    with float64 statistics; this undoes the upcast.
+
+    Args:
+        df (pd.DataFrame): The computed frame.
+        source (pd.DataFrame): The frame it was computed from.
+
+    Returns:
+        pd.DataFrame: df with the compact float dtypes.
+    """
+    dtypes = {}
+    for column in df.columns.intersection(source.columns):
+        target = compact_float_dtype(source[column].dtype)
+        if target == np.float32 and df[column].dtype == np.float64:
+            dtypes[column] = target
+    return df.astype(dtypes) if dtypes else df
+
+
+def bytes_per_row(df: pd.DataFrame) -> float:
+    """
+    Returns the memory of a frame per row, strings and categories included.
+
+    Args:
+        df (pd.DataFrame): The data.
+
+    Returns:
+        float: Bytes per row.
+    """
+    return float(df.memory_usage(deep=True, index=False).sum()) / max(len(df), 1)
+
+
+# Schema of the StudentsPerformance export.
+STUDENT_PERFORMANCE_SCHEMA = DataSchema(
+    categorical=["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"],
+    numeric=["math score", "reading score", "writing score"],
+)
+
+
+if __name__ == "__main__":
+    pass
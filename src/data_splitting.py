@@ -1,9 +1,11 @@
 import logging
 import pandas as pd
+import numpy as np
 
-from typing import Tuple
+from typing import Iterator, List, Tuple
 from abc import ABC, abstractmethod
-from sklearn.model_selection import train_test_split
+from src.sparse_design_matrix import SparseDesignMatrix
+from src.instrumentation import instrumented
 
 
 class DataSplittingStrategy(ABC):
@@ -36,7 +38,17 @@ class SimpleTrainTestSplit(DataSplittingStrategy):
             df (_type_): _description_
             target_column (_type_): _description_
         """
+        from sklearn.model_selection import train_test_split
+
         logging.info("Perform simplet train-test split method.")
+        if isinstance(df, SparseDesignMatrix):
+            # Split row positions so the sparse block is sliced, never densified.
+            train_idx, test_idx = train_test_split(np.arange(len(df)), test_size=self.test_size, random_state=self.random_state)
+            X = df.drop(columns=target_column)
+            y = df[target_column]
+            logging.info("Train-test split completed.")
+            return X.take(train_idx), X.take(test_idx), y.iloc[train_idx], y.iloc[test_idx]
+
         X = df.drop(columns=target_column)
         y = df[target_column]
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=self.test_size, random_state=self.random_state)
@@ -44,6 +56,172 @@ class SimpleTrainTestSplit(DataSplittingStrategy):
         return X_train, X_test, y_train, y_test
 
 
+class CrossValidationFolds:
+    """
+    One shared feature matrix and target matrix plus the index arrays of every fold.
+
+    Folds are materialized one at a time, on demand, so holding all of them
+    costs one copy of the data plus the index arrays.
+    """
+    def __init__(self, X: np.ndarray, y: np.ndarray, feature_columns: list, target_columns: list, folds: List[Tuple[np.ndarray, np.ndarray]]):
+        """
+        Initializes the CrossValidationFolds.
+
+        Args:
+            X (np.ndarray): The feature matrix shared by every fold.
+            y (np.ndarray): The target matrix shared by every fold.
+            feature_columns (list): Names of the columns of X.
+            target_columns (list): Names of the columns of y.
+            folds (List[Tuple[np.ndarray, np.ndarray]]): Train and test row positions of every fold.
+        """
+        self.X = X
+        self.y = y
+        self.feature_columns = list(feature_columns)
+        self.target_columns = list(target_columns)
+        self.folds = folds
+
+    def __len__(self) -> int:
+        return len(self.folds)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        return iter(self.folds)
+
+    def materialize(self, fold: int) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Gathers the rows of one fold.
+
+        Args:
+            fold (int): Position of the fold.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]: X_train, X_test, y_train, y_test.
+        """
+        return fold_frames(self.X, self.y, self.feature_columns, self.target_columns, *self.folds[fold])
+
+
+def fold_frames(X: np.ndarray, y: np.ndarray, feature_columns: list, target_columns: list, train_idx: np.ndarray, test_idx: np.ndarray):
+    """
+    Gathers the train and test rows of a fold into DataFrames.
+
+    The rows are copied once, by the gather; the DataFrames wrap the
+    gathered arrays without copying them again. A materialized fold thus
+    costs about one more copy of X and y, for as long as it is held.
+
+    Args:
+        X (np.ndarray): The shared feature matrix.
+        y (np.ndarray): The shared target matrix.
+        feature_columns (list): Names of the columns of X.
+        target_columns (list): Names of the columns of y.
+        train_idx (np.ndarray): Train row positions.
+        test_idx (np.ndarray): Test row positions.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]: X_train, X_test, y_train, y_test.
+    """
+    return (
+        pd.DataFrame(X.take(train_idx, axis=0), columns=feature_columns, copy=False),
+        pd.DataFrame(X.take(test_idx, axis=0), columns=feature_columns, copy=False),
+        pd.DataFrame(y.take(train_idx, axis=0), columns=target_columns, copy=False),
+        pd.DataFrame(y.take(test_idx, axis=0), columns=target_columns, copy=False),
+    )
+
+
+class KFoldSplit(DataSplittingStrategy):
+    def __init__(self, n_splits=5, shuffle=True, random_state=42):
+        """
+        K-fold cross-validation split.
+
+        Args:
+            n_splits (int): Number of folds. Defaults to 5.
+            shuffle (bool): Shuffle the rows before folding. Defaults to True.
+            random_state (int): Seed of the shuffle. Defaults to 42.
+        """
+        self.n_splits = n_splits
+        self.shuffle = shuffle
+        self.random_state = random_state
+
+    def _splitter(self):
+        from sklearn.model_selection import KFold
+
+        return KFold(n_splits=self.n_splits, shuffle=self.shuffle, random_state=self.random_state if self.shuffle else None)
+
+    def _groups(self, y: np.ndarray):
+        return None
+
+    def split(self, df: pd.DataFrame, target_column) -> CrossValidationFolds:
+        """
+        Builds the folds over one shared copy of the data.
+
+        Args:
+            df (pd.DataFrame): The data, features and targets.
+            target_column: The target column(s).
+
+        Returns:
+            CrossValidationFolds: The shared matrices and the index arrays of every fold.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df must be a pandas DataFrame.")
+        logging.info(f"Perform {type(self).__name__} with {self.n_splits} splits.")
+        target_columns = [target_column] if isinstance(target_column, str) else list(target_column)
+        feature_columns = [column for column in df.columns if column not in target_columns]
+        X = df[feature_columns].to_numpy(dtype=np.float64)
+        y = df[target_columns].to_numpy(dtype=np.float64)
+        rows = np.arange(len(df))
+        folds = [
+            (train_idx, test_idx)
+            for train_idx, test_idx in self._splitter().split(rows, self._groups(y))
+        ]
+        logging.info(f"{len(folds)} folds created.")
+        return CrossValidationFolds(X, y, feature_columns, target_columns, folds)
+
+
+class RepeatedKFoldSplit(KFoldSplit):
+    def __init__(self, n_splits=5, n_repeats=3, random_state=42):
+        """
+        K-fold cross-validation repeated with different shuffles.
+
+        Args:
+            n_splits (int): Number of folds per repetition. Defaults to 5.
+            n_repeats (int): Number of repetitions. Defaults to 3.
+            random_state (int): Seed of the shuffles. Defaults to 42.
+        """
+        super().__init__(n_splits=n_splits, shuffle=True, random_state=random_state)
+        self.n_repeats = n_repeats
+
+    def _splitter(self):
+        from sklearn.model_selection import RepeatedKFold
+
+        return RepeatedKFold(n_splits=self.n_splits, n_repeats=self.n_repeats, random_state=self.random_state)
+
+
+class StratifiedBucketKFoldSplit(KFoldSplit):
+    def __init__(self, n_splits=5, n_buckets=10, shuffle=True, random_state=42):
+        """
+        K-fold split stratified on quantile buckets of the (mean) target.
+
+        Every fold receives the same share of low, middle and high scores,
+        which steadies the CV estimate on skewed targets.
+
+        Args:
+            n_splits (int): Number of folds. Defaults to 5.
+            n_buckets (int): Number of quantile buckets of the target. Defaults to 10.
+            shuffle (bool): Shuffle the rows within each bucket. Defaults to True.
+            random_state (int): Seed of the shuffle. Defaults to 42.
+        """
+        super().__init__(n_splits=n_splits, shuffle=shuffle, random_state=random_state)
+        self.n_buckets = n_buckets
+
+    def _splitter(self):
+        from sklearn.model_selection import StratifiedKFold
+
+        return StratifiedKFold(n_splits=self.n_splits, shuffle=self.shuffle, random_state=self.random_state if self.shuffle else None)
+
+    def _groups(self, y: np.ndarray):
+        target = y.mean(axis=1)
+        edges = np.unique(np.quantile(target, np.linspace(0, 1, self.n_buckets + 1)[1:-1]))
+        return np.searchsorted(edges, target, side="right")
+
+
 class DataSplitter:
     def __init__(self, strategy: DataSplittingStrategy):
         """_summary_
@@ -61,6 +239,7 @@ class DataSplitter:
         """
         self._strategy = strategy
     
+    @instrumented()
     def split(self, df: pd.DataFrame, target_column: str):
         """_summary_
 
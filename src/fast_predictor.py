@@ -0,0 +1,317 @@
+import json
+import logging
+import numpy as np
+
+from typing import TYPE_CHECKING, List
+
+# Loading and predicting only need NumPy; the encoders are imported when compiling.
+if TYPE_CHECKING:
+    from src.feature_engineering import FeatureEngineer
+
+
+class FastLinearPredictor:
+    """
+    A fitted linear model and its encoders compiled into plain NumPy arrays.
+
+    Every categorical input is reduced to a lookup table holding, per
+    category, its whole contribution to the targets (code times coefficient
+    for label encoding, the coefficient of its column for one-hot encoding).
+    Numeric inputs keep an optional affine map and log1p applied before a
+    single matrix product, with the scalers that follow folded into the
+    weights and the intercept. A prediction is therefore a few dictionary
+    lookups, one gather and one small matrix product, with no pandas or
+    scikit-learn validation on the way.
+    """
+    def __init__(self, intercept, numeric_columns, pre_scale, pre_shift, log_mask, weights, categorical_columns, categories, offsets, table, unseen, target_columns=None, single_output=False):
+        """
+        Initializes the FastLinearPredictor. Use compile_predictor or load to build one.
+
+        Args:
+            intercept (np.ndarray): (n_targets,) intercept with the constant contributions folded in.
+            numeric_columns (list): Raw numeric inputs.
+            pre_scale (np.ndarray): Scale applied to the numeric inputs before log1p.
+            pre_shift (np.ndarray): Shift applied to the numeric inputs before log1p.
+            log_mask (np.ndarray): Numeric inputs passed through log1p.
+            weights (np.ndarray): (n_numeric, n_targets) weights of the numeric inputs.
+            categorical_columns (list): Raw categorical inputs.
+            categories (list): Per categorical input, its categories in table order.
+            offsets (np.ndarray): Start row of every categorical input in table.
+            table (np.ndarray): (n_rows, n_targets) contributions; the row after each input's categories holds the unseen contribution.
+            unseen (np.ndarray): Per categorical input, whether unseen categories are accepted.
+            target_columns (list, optional): Names of the targets. Defaults to None.
+            single_output (bool): Return 1-D predictions, like a model fitted on a single target. Defaults to False.
+        """
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.numeric_columns = list(numeric_columns)
+        self.pre_scale = np.asarray(pre_scale, dtype=np.float64)
+        self.pre_shift = np.asarray(pre_shift, dtype=np.float64)
+        self.log_mask = np.asarray(log_mask, dtype=bool)
+        self.weights = np.asarray(weights, dtype=np.float64).reshape(len(self.numeric_columns), len(self.intercept))
+        self.categorical_columns = list(categorical_columns)
+        self.input_columns = self.categorical_columns + self.numeric_columns
+        self.categories = [list(values) for values in categories]
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.table = np.asarray(table, dtype=np.float64).reshape(-1, len(self.intercept))
+        self.unseen = np.asarray(unseen, dtype=bool)
+        self.target_columns = target_columns
+        self.single_output = single_output
+        self._has_log = bool(self.log_mask.any())
+        self._lookups = [
+            {category: offset + i for i, category in enumerate(values)}
+            for values, offset in zip(self.categories, self.offsets)
+        ]
+
+    def predict_one(self, record: dict) -> np.ndarray:
+        """
+        Predicts a single row.
+
+        Args:
+            record (dict): Mapping of raw input to value.
+
+        Returns:
+            np.ndarray: The predicted targets.
+        """
+        rows = [self._row(i, record[column]) for i, column in enumerate(self.categorical_columns)]
+        prediction = self.intercept + self.table[rows].sum(axis=0)
+        if self.numeric_columns:
+            x = np.array([record[column] for column in self.numeric_columns], dtype=np.float64)
+            prediction += self._numeric(x) @ self.weights
+        return prediction[0] if self.single_output else prediction
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts a batch of rows.
+
+        Args:
+            X: A list of records, a mapping of raw input to a column of values, or a DataFrame.
+
+        Returns:
+            np.ndarray: (n_rows, n_targets) predictions, or (n_rows,) for a single-output model.
+        """
+        if isinstance(X, list):
+            columns = {column: [record[column] for record in X] for column in self.input_columns}
+            n_rows = len(X)
+        else:
+            columns = X
+            n_rows = len(X[next(iter(X))]) if len(X) else 0
+
+        prediction = np.broadcast_to(self.intercept, (n_rows, len(self.intercept))).copy()
+        if self.categorical_columns:
+            rows = np.empty((n_rows, len(self.categorical_columns)), dtype=np.int64)
+            for i, column in enumerate(self.categorical_columns):
+                lookup = self._lookups[i]
+                default = self.offsets[i] + len(self.categories[i])
+                rows[:, i] = [lookup.get(_key(value), default) for value in columns[column]]
+                if not self.unseen[i] and (rows[:, i] == default).any():
+                    values = np.asarray(columns[column], dtype=object)[rows[:, i] == default]
+                    raise ValueError(f"Feature '{column}' contains previously unseen labels: {list(dict.fromkeys(values))}.")
+            prediction += self.table[rows].sum(axis=1)
+        if self.numeric_columns:
+            x = np.column_stack([np.asarray(columns[column], dtype=np.float64) for column in self.numeric_columns])
+            prediction += self._numeric(x) @ self.weights
+        return prediction[:, 0] if self.single_output else prediction
+
+    def save(self, path: str):
+        """
+        Saves the compiled arrays as one .npz artifact.
+
+        Args:
+            path (str): Destination file.
+        """
+        meta = {
+            "numeric_columns": self.numeric_columns,
+            "categorical_columns": self.categorical_columns,
+            "categories": self.categories,
+            "target_columns": self.target_columns,
+            "single_output": self.single_output,
+        }
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8),
+                intercept=self.intercept, pre_scale=self.pre_scale, pre_shift=self.pre_shift, log_mask=self.log_mask,
+                weights=self.weights, offsets=self.offsets, table=self.table, unseen=self.unseen,
+            )
+        logging.info(f"Saved compiled predictor to {path}.")
+
+    @classmethod
+    def load(cls, path: str) -> "FastLinearPredictor":
+        """
+        Loads an artifact written by save.
+
+        Args:
+            path (str): Location of the artifact.
+
+        Returns:
+            FastLinearPredictor: The predictor.
+        """
+        with np.load(path) as arrays:
+            meta = json.loads(arrays["meta"].tobytes())
+            return cls(
+                arrays["intercept"], meta["numeric_columns"], arrays["pre_scale"], arrays["pre_shift"], arrays["log_mask"],
+                arrays["weights"], meta["categorical_columns"], meta["categories"], arrays["offsets"], arrays["table"],
+                arrays["unseen"], meta["target_columns"], meta["single_output"],
+            )
+
+    def _row(self, i: int, value) -> int:
+        row = self._lookups[i].get(_key(value))
+        if row is None:
+            if not self.unseen[i]:
+                raise ValueError(f"Feature '{self.categorical_columns[i]}' contains previously unseen labels: {[value]}.")
+            row = self.offsets[i] + len(self.categories[i])
+        return row
+
+    def _numeric(self, x: np.ndarray) -> np.ndarray:
+        x = x * self.pre_scale + self.pre_shift
+        if self._has_log:
+            x[..., self.log_mask] = np.log1p(x[..., self.log_mask])
+        return x
+
+
+def _key(value):
+    # Categories are stored as strings so the artifact stays JSON/NumPy only.
+    return value if isinstance(value, str) else str(value)
+
+
+def _flatten(strategy) -> list:
+    from src.feature_engineering import FeatureEngineeringPipeline
+
+    if isinstance(strategy, FeatureEngineeringPipeline):
+        return [stage for inner in strategy.strategies for stage in _flatten(inner)]
+    return [strategy]
+
+
+def compile_predictor(model, engineer: "FeatureEngineer" = None, target_columns: List[str] = None) -> FastLinearPredictor:
+    """
+    Compiles a fitted linear model and its fitted feature engineering into a FastLinearPredictor.
+
+    Args:
+        model (RegressorMixin): A fitted linear model with coef_, intercept_ and feature_names_in_.
+        engineer (FeatureEngineer, optional): The fitted transform state the model was trained after. Defaults to None.
+        target_columns (List[str], optional): Names of the targets. Defaults to None.
+
+    Returns:
+        FastLinearPredictor: The compiled predictor.
+    """
+    from src.categorical_encoding import UNSEEN_CODE
+    from src.feature_engineering import (
+        LogTransformationStrategy,
+        StandardScalingStrategy,
+        MinMaxScalingStrategy,
+        LabelEncodingStrategy,
+        OneHotEncodingStrategy,
+    )
+
+    if not hasattr(model, "coef_") or not hasattr(model, "feature_names_in_"):
+        raise TypeError("Only linear models fitted on a DataFrame can be compiled.")
+    single_output = np.ndim(model.coef_) == 1
+    coef = np.atleast_2d(np.asarray(model.coef_, dtype=np.float64))
+    intercept = np.atleast_1d(np.asarray(model.intercept_, dtype=np.float64)).copy()
+    stages = _flatten(engineer._strategy) if engineer is not None else []
+
+    # Raw input -> its transform chain. A numeric chain is a list of ("affine", a, b)
+    # and ("log1p",) steps, an encoded input keeps its encoder and the steps after it.
+    chains, encoded = {}, {}
+    for stage in stages:
+        if isinstance(stage, (LabelEncodingStrategy, OneHotEncodingStrategy)):
+            for feature in stage.features:
+                encoded[feature] = {"encoder": stage, "steps": {}}
+            continue
+        for i, feature in enumerate(stage.features):
+            if isinstance(stage, LogTransformationStrategy):
+                step = ("log1p",)
+            elif isinstance(stage, StandardScalingStrategy):
+                step = ("affine", 1 / stage.scale_[i], -stage.mean_[i] / stage.scale_[i])
+            elif isinstance(stage, MinMaxScalingStrategy):
+                step = ("affine", stage.scale_[i], stage.min_[i])
+            else:
+                raise TypeError(f"Cannot compile {type(stage).__name__}.")
+            owner = next((name for name, info in encoded.items() if feature == name or feature in _one_hot_columns(name, info)), None)
+            if owner is not None:
+                encoded[owner]["steps"].setdefault(feature, []).append(step)
+            else:
+                chains.setdefault(feature, []).append(step)
+
+    n_targets = len(intercept)
+    column_index = {column: j for j, column in enumerate(model.feature_names_in_)}
+    used = set()
+
+    categorical_columns, categories, offsets, tables, unseen = [], [], [], [], []
+    offset = 0
+    for feature, info in encoded.items():
+        encoder = info["encoder"]
+        values = list(encoder.dictionary.categories[feature])
+        table = np.zeros((len(values) + 1, n_targets))
+        if isinstance(encoder, LabelEncodingStrategy):
+            if feature in column_index:
+                codes = np.append(np.arange(len(values), dtype=np.float64), UNSEEN_CODE)
+                codes = _apply(info["steps"].get(feature, []), codes)
+                table += np.outer(codes, coef[:, column_index[feature]])
+                used.add(feature)
+        else:
+            # drop_first: the first category and unseen labels get an all-zeros block.
+            for k, column in enumerate(_one_hot_columns(feature, info), start=1):
+                if column not in column_index:
+                    continue
+                off, on = _apply(info["steps"].get(column, []), np.array([0.0, 1.0]))
+                indicator = np.full(len(values) + 1, off)
+                indicator[k] = on
+                table += np.outer(indicator, coef[:, column_index[column]])
+                used.add(column)
+        categorical_columns.append(feature)
+        categories.append([_key(value) for value in values])
+        offsets.append(offset)
+        tables.append(table)
+        unseen.append(encoder.handle_unknown != "error")
+        offset += len(table)
+
+    numeric_columns = [column for column in model.feature_names_in_ if column not in used]
+    pre_scale, pre_shift, log_mask = np.ones(len(numeric_columns)), np.zeros(len(numeric_columns)), np.zeros(len(numeric_columns), dtype=bool)
+    weights = np.zeros((len(numeric_columns), n_targets))
+    for i, column in enumerate(numeric_columns):
+        steps = chains.get(column, [])
+        logs = [k for k, step in enumerate(steps) if step[0] == "log1p"]
+        if len(logs) > 1:
+            raise ValueError(f"Cannot compile more than one log transformation of '{column}'.")
+        split = logs[0] + 1 if logs else 0
+        pre_scale[i], pre_shift[i] = _compose(steps[:logs[0]]) if logs else (1.0, 0.0)
+        log_mask[i] = bool(logs)
+        scale, shift = _compose(steps[split:])
+        # coef * (scale * x + shift) == (coef * scale) * x + coef * shift
+        weights[i] = coef[:, column_index[column]] * scale
+        intercept += coef[:, column_index[column]] * shift
+
+    table = np.vstack(tables) if tables else np.zeros((0, n_targets))
+    logging.info(f"Compiled predictor with {len(categorical_columns)} categorical and {len(numeric_columns)} numeric inputs.")
+    return FastLinearPredictor(
+        intercept, numeric_columns, pre_scale, pre_shift, log_mask, weights,
+        categorical_columns, categories, offsets, table, unseen, target_columns, single_output,
+    )
+
+
+def _one_hot_columns(feature: str, info: dict) -> list:
+    from src.feature_engineering import OneHotEncodingStrategy
+
+    encoder = info["encoder"]
+    if not isinstance(encoder, OneHotEncodingStrategy):
+        return []
+    return [f"{feature}_{category}" for category in encoder.dictionary.categories[feature][1:]]
+
+
+def _compose(steps: list):
+    scale, shift = 1.0, 0.0
+    for step in steps:
+        if step[0] != "affine":
+            raise ValueError("Cannot compile a log transformation after a scaler.")
+        scale, shift = step[1] * scale, step[1] * shift + step[2]
+    return scale, shift
+
+
+def _apply(steps: list, values: np.ndarray) -> np.ndarray:
+    for step in steps:
+        values = np.log1p(values) if step[0] == "log1p" else values * step[1] + step[2]
+    return values
+
+
+if __name__ == "__main__":
+    pass
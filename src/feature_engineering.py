@@ -1,12 +1,36 @@
+import json
 import logging
+import contextlib
+import tracemalloc
 import pandas as pd
 import numpy as np
 
 from abc import ABC, abstractmethod
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, LabelEncoder, OneHotEncoder
+from src.categorical_encoding import CategoryDictionary
+from src.data_schema import compact_float_dtype
+from src.sparse_design_matrix import SparseDesignMatrix
+from src.sharded_execution import ShardedExecutor
+from src.instrumentation import instrumented
 
 
 class FeatureEngineeringStrategy(ABC):
+    # How transform obtains its output frame: "deep" copies the input,
+    # "shallow" shares it under Copy-on-Write and "none" writes into it.
+    # FeatureEngineeringPipeline switches this per run.
+    copy_mode = "deep"
+
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineeringStrategy":
+        """
+        Learns the state needed by transform. Stateless strategies keep this no-op.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+
+        Returns:
+            FeatureEngineeringStrategy: The fitted strategy.
+        """
+        return self
+
     @abstractmethod
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """_summary_
@@ -19,6 +43,81 @@ class FeatureEngineeringStrategy(ABC):
         """
         pass
 
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fits the strategy on df and transforms it.
+
+        Args:
+            df (pd.DataFrame): The data to learn from and transform.
+
+        Returns:
+            pd.DataFrame: The transformed data.
+        """
+        return self.fit(df).transform(df)
+
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        """
+        Returns the columns whose statistics fit_statistics needs when the data is split in row shards.
+
+        Args:
+            df (pd.DataFrame): The whole data.
+
+        Returns:
+            list: The columns, empty for stateless strategies, None when the strategy cannot run on shards.
+        """
+        return None
+
+    def fit_statistics(self, stats) -> "FeatureEngineeringStrategy":
+        """
+        Learns the state needed by transform from statistics merged over row shards.
+
+        Args:
+            stats (ColumnStatistics): Statistics of shard_columns over the whole data, None when no column is needed.
+
+        Returns:
+            FeatureEngineeringStrategy: The fitted strategy.
+        """
+        return self
+
+    def get_params(self) -> dict:
+        """
+        Returns the constructor arguments of the strategy.
+
+        Returns:
+            dict: JSON-serializable keyword arguments.
+        """
+        return {"features": list(self.features)}
+
+    def get_state(self) -> dict:
+        """
+        Returns the fitted state of the strategy.
+
+        Returns:
+            dict: JSON-serializable fitted state.
+        """
+        return {}
+
+    def set_state(self, state: dict) -> "FeatureEngineeringStrategy":
+        """
+        Restores a fitted state returned by get_state.
+
+        Args:
+            state (dict): The fitted state.
+
+        Returns:
+            FeatureEngineeringStrategy: The restored strategy.
+        """
+        return self
+
+    def _output_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.copy_mode == "none":
+            return df
+        return df.copy(deep=self.copy_mode == "deep")
+
+    def _check_fitted(self, *attributes):
+        if any(getattr(self, attribute, None) is None for attribute in attributes):
+            raise ValueError(f"{type(self).__name__} is not fitted. Call fit first.")
+
 
 class LogTransformationStrategy(FeatureEngineeringStrategy):
     def __init__(self, features: list):
@@ -28,18 +127,21 @@ class LogTransformationStrategy(FeatureEngineeringStrategy):
             features (list): _description_
         """
         self.features = features
-        
-    def transform(self, df: pd.DataFrame, features: list):
+
+    def shard_columns(self, df: pd.DataFrame):
+        return []
+
+    def transform(self, df: pd.DataFrame):
         """_summary_
 
         Args:
             df (_type_): _description_
-            features (_type_): _description_
         """
-        logging.info("Applying log transformation to features: {self.features}.")
-        df_transformed = df.copy()
-        for feature in features:
-            df_transformed[feature] = np.log1p(df[feature])
+        logging.info(f"Applying log transformation to features: {self.features}.")
+        df_transformed = self._output_frame(df)
+        for feature in self.features:
+            # NumPy would give float16 for 8-bit integers; compute in the compact float dtype instead.
+            df_transformed[feature] = np.log1p(df[feature].astype(compact_float_dtype(df[feature].dtype)))
         logging.info("Log transformation completed.")
         return df_transformed
 
@@ -52,8 +154,42 @@ class StandardScalingStrategy(FeatureEngineeringStrategy):
             features (list): _description_
         """
         self.features = features
-        self.scaler = StandardScaler()
-    
+        self.scaler = None
+        self.mean_ = None
+        self.scale_ = None
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Learns the mean and scale of the features.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+        """
+        from sklearn.preprocessing import StandardScaler
+
+        self.scaler = StandardScaler().fit(df[self.features])
+        self.mean_ = self.scaler.mean_
+        self.scale_ = self.scaler.scale_
+        return self
+
+    def shard_columns(self, df: pd.DataFrame):
+        return list(self.features)
+
+    def fit_statistics(self, stats):
+        """
+        Learns the mean and scale of the features from the running moments merged over row shards.
+
+        Args:
+            stats (ColumnStatistics): Statistics of the features over the whole data.
+        """
+        stats = stats[self.features]
+        self.scaler = None
+        self.mean_ = stats.mean().to_numpy(dtype=np.float64)
+        scale = stats.std(ddof=0).to_numpy(dtype=np.float64)
+        # Constant features keep a scale of 1, like StandardScaler.
+        self.scale_ = np.where(scale < 10 * np.finfo(np.float64).eps, 1.0, scale)
+        return self
+
     def transform(self, df: pd.DataFrame):
         """_summary_
 
@@ -61,12 +197,23 @@ class StandardScalingStrategy(FeatureEngineeringStrategy):
             df (pd.DataFrame): _description_
             features (list): _description_
         """
-        logging.info("Applying Standard scaler to features: {self.features}.")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        self._check_fitted("mean_", "scale_")
+        logging.info(f"Applying Standard scaler to features: {self.features}.")
+        df_transformed = self._output_frame(df)
+        values = df[self.features].to_numpy(dtype=np.float64)
+        df_transformed[self.features] = ((values - self.mean_) / self.scale_).astype(_result_dtype(df, self.features), copy=False)
         logging.info("Standard scaling completed.")
         return df_transformed
 
+    def get_state(self):
+        self._check_fitted("mean_", "scale_")
+        return {"mean": self.mean_.tolist(), "scale": self.scale_.tolist()}
+
+    def set_state(self, state):
+        self.mean_ = np.asarray(state["mean"], dtype=np.float64)
+        self.scale_ = np.asarray(state["scale"], dtype=np.float64)
+        return self
+
 
 class MinMaxScalingStrategy(FeatureEngineeringStrategy):
     def __init__(self, features, feature_range=(0, 1)):
@@ -76,82 +223,386 @@ class MinMaxScalingStrategy(FeatureEngineeringStrategy):
             features (_type_): _description_
         """
         self.features = features
-        self.scaler = MinMaxScaler(feature_range=feature_range)
-    
+        self.feature_range = tuple(feature_range)
+        self.scaler = None
+        self.min_ = None
+        self.scale_ = None
+
+    def fit(self, df):
+        """
+        Learns the affine map of the features onto feature_range.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+        """
+        from sklearn.preprocessing import MinMaxScaler
+
+        self.scaler = MinMaxScaler(feature_range=self.feature_range).fit(df[self.features])
+        self.min_ = self.scaler.min_
+        self.scale_ = self.scaler.scale_
+        return self
+
+    def shard_columns(self, df):
+        return list(self.features)
+
+    def fit_statistics(self, stats):
+        """
+        Learns the affine map of the features from statistics merged over row shards.
+
+        Args:
+            stats (ColumnStatistics): Statistics of the features over the whole data.
+        """
+        stats = stats[self.features]
+        # MinMaxScaler computes in the float dtype of the data: float32 for compact features.
+        dtype = np.result_type(*(np.dtype(getattr(stats.dtypes[feature], "numpy_dtype", stats.dtypes[feature])) for feature in self.features))
+        dtype = dtype if dtype.kind == "f" else np.dtype(np.float64)
+        low, high = np.asarray(self.feature_range[0], dtype=dtype), np.asarray(self.feature_range[1], dtype=dtype)
+        data_min = stats.min().to_numpy(dtype=dtype)
+        data_range = stats.max().to_numpy(dtype=dtype) - data_min
+        self.scaler = None
+        # The arithmetic of MinMaxScaler, a constant feature keeping a range of 1.
+        self.scale_ = (high - low) / np.where(data_range < 10 * np.finfo(dtype).eps, dtype.type(1), data_range)
+        self.min_ = low - data_min * self.scale_
+        return self
+
     def transform(self, df):
         """_summary_
 
         Args:
             df (_type_): _description_
         """
-        logging.info("Applying Min-Max scaler to features: {self.features} with range: {self.scaler.feature_range}.")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
+        self._check_fitted("min_", "scale_")
+        logging.info(f"Applying Min-Max scaler to features: {self.features} with range: {self.feature_range}.")
+        df_transformed = self._output_frame(df)
+        values = df[self.features].to_numpy(dtype=np.float64)
+        df_transformed[self.features] = (values * self.scale_ + self.min_).astype(_result_dtype(df, self.features), copy=False)
         logging.info("Min-Max scaling completed.")
         return df_transformed
 
+    def get_params(self):
+        return {"features": list(self.features), "feature_range": list(self.feature_range)}
+
+    def get_state(self):
+        self._check_fitted("min_", "scale_")
+        return {"min": self.min_.tolist(), "scale": self.scale_.tolist()}
+
+    def set_state(self, state):
+        self.min_ = np.asarray(state["min"], dtype=np.float64)
+        self.scale_ = np.asarray(state["scale"], dtype=np.float64)
+        return self
+
 
 class LabelEncodingStrategy(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, handle_unknown="error", dictionary: CategoryDictionary = None):
         """_summary_
 
         Args:
             features (_type_): _description_
+            handle_unknown (str): "error" or "reserve" to encode unseen labels as UNSEEN_CODE. Defaults to "error".
+            dictionary (CategoryDictionary, optional): Category dictionary shared with other encoders. Defaults to None.
         """
         self.features = features
-        self.encoder = LabelEncoder()
-    
+        self.handle_unknown = handle_unknown
+        self.dictionary = dictionary if dictionary is not None else CategoryDictionary()
+
+    def fit(self, df):
+        """
+        Learns the sorted classes of every feature.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+        """
+        self.dictionary.fit(df, self.features)
+        return self
+
+    def partial_fit(self, df):
+        """
+        Adds the classes of a new batch, keeping the existing codes.
+
+        Args:
+            df (pd.DataFrame): The next batch of data.
+        """
+        self.dictionary.update(df, self.features)
+        return self
+
+    def shard_columns(self, df):
+        return list(self.features)
+
+    def fit_statistics(self, stats):
+        """
+        Learns the sorted classes of every feature from statistics merged over row shards.
+
+        Args:
+            stats (ColumnStatistics): Statistics of the features over the whole data.
+        """
+        self.dictionary.fit_statistics(stats, self.features)
+        return self
+
     def transform(self, df):
         """_summary_
 
         Args:
             df (_type_): _description_
         """
-        logging.info("Applying label encoder to features: {self.features}.")
-        df_transformed = df.copy()
-        for features in self.features:
-            df_transformed[features] = self.encoder.fit_transform(df[features])
+        logging.info(f"Applying label encoder to features: {self.features}.")
+        df_transformed = self._output_frame(df)
+        codes = self.dictionary.encode(df, self.features, self.handle_unknown)
+        df_transformed[list(self.features)] = codes
         logging.info("Label encoding completed.")
         return df_transformed
 
+    def get_params(self):
+        return {"features": list(self.features), "handle_unknown": self.handle_unknown}
+
+    def get_state(self):
+        self.dictionary.check_fitted(self.features)
+        return {"categories": self.dictionary.to_dict()}
+
+    def set_state(self, state):
+        self.dictionary = CategoryDictionary(state["categories"])
+        return self
+
 
 class OneHotEncodingStrategy(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, handle_unknown="error", dictionary: CategoryDictionary = None, sparse=False):
         """_summary_
 
         Args:
             features (_type_): _description_
+            handle_unknown (str): "error" or "reserve" to encode unseen labels as all zeros. Defaults to "error".
+            dictionary (CategoryDictionary, optional): Category dictionary shared with other encoders. Defaults to None.
+            sparse (bool): Return a SparseDesignMatrix with the encoded block as CSR instead of a dense DataFrame. Defaults to False.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
-    
+        self.handle_unknown = handle_unknown
+        self.sparse = sparse
+        self.dictionary = dictionary if dictionary is not None else CategoryDictionary()
+
+    def fit(self, df):
+        """
+        Learns the sorted categories of every feature.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+        """
+        self.dictionary.fit(df, self.features)
+        return self
+
+    def partial_fit(self, df):
+        """
+        Adds the categories of a new batch, keeping the existing columns.
+
+        Args:
+            df (pd.DataFrame): The next batch of data.
+        """
+        self.dictionary.update(df, self.features)
+        return self
+
+    def shard_columns(self, df):
+        # A sparse result is not a DataFrame, so its shards cannot be concatenated.
+        return None if self.sparse else list(self.features)
+
+    def fit_statistics(self, stats):
+        """
+        Learns the sorted categories of every feature from statistics merged over row shards.
+
+        Args:
+            stats (ColumnStatistics): Statistics of the features over the whole data.
+        """
+        self.dictionary.fit_statistics(stats, self.features)
+        return self
+
     def transform(self, df):
         """_summary_
 
         Args:
             df (_type_): _description_
         """
-        logging.info("Applying One-Hot encoder to features: {self.features}.")
-        df_transformed = df.copy()
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features)
-        )
-        df_transformed = df_transformed.drop(columns=self.features).reset_index(drop=True)
+        logging.info(f"Applying One-Hot encoder to features: {self.features}.")
+        codes = self.dictionary.encode(df, self.features, self.handle_unknown)
+        if self.sparse:
+            encoded, columns = self.dictionary.one_hot_sparse(codes, self.features, drop_first=True)
+            logging.info("One-Hot encoding completed with sparse output.")
+            return SparseDesignMatrix(df.drop(columns=self.features), encoded, columns)
+
+        encoded, columns = self.dictionary.one_hot(codes, self.features, drop_first=True)
+        if self.copy_mode == "none":
+            df.drop(columns=self.features, inplace=True)
+            df.reset_index(drop=True, inplace=True)
+            df[columns] = encoded
+            logging.info("One-Hot encoding completed.")
+            return df
+
+        encoded_df = pd.DataFrame(encoded, columns=columns)
+        df_transformed = df.drop(columns=self.features).reset_index(drop=True)
         df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
         logging.info("One-Hot encoding completed.")
         return df_transformed
 
+    def get_params(self):
+        return {"features": list(self.features), "handle_unknown": self.handle_unknown, "sparse": self.sparse}
+
+    def get_state(self):
+        self.dictionary.check_fitted(self.features)
+        return {"categories": self.dictionary.to_dict()}
+
+    def set_state(self, state):
+        self.dictionary = CategoryDictionary(state["categories"])
+        return self
+
+
+def _result_dtype(df: pd.DataFrame, features: list) -> np.dtype:
+    # float32 when every input is compact (see DataSchema), float64 otherwise.
+    return np.result_type(*(compact_float_dtype(df[feature].dtype) for feature in features))
+
+
+# Strategy registry used to restore persisted FeatureEngineer artifacts.
+STRATEGIES = {
+    strategy.__name__: strategy
+    for strategy in (
+        LogTransformationStrategy,
+        StandardScalingStrategy,
+        MinMaxScalingStrategy,
+        LabelEncodingStrategy,
+        OneHotEncodingStrategy,
+    )
+}
+
+
+def _copy_on_write():
+    """
+    Returns a context enabling pandas Copy-on-Write (always on from pandas 3).
+    """
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return contextlib.nullcontext()
+    return pd.option_context("mode.copy_on_write", True)
+
+
+class FeatureEngineeringPipeline(FeatureEngineeringStrategy):
+    """
+    Runs an ordered list of strategies over a single buffer.
+
+    mode="copy" keeps the behaviour of chaining the strategies by hand (one
+    frame copy per stage). mode="inplace" copies the input once and lets every
+    stage write into that owned buffer. mode="cow" takes no copy at all and
+    relies on pandas Copy-on-Write, so only the columns a stage rewrites get
+    new memory. A sparse one-hot stage returns a SparseDesignMatrix and must
+    therefore come last.
+    """
+    MODES = {"copy": "deep", "inplace": "none", "cow": "shallow"}
+
+    def __init__(self, strategies: list, mode: str = "copy", track_memory: bool = False):
+        """
+        Initializes the FeatureEngineeringPipeline.
+
+        Args:
+            strategies (list): Strategies (or their persisted {"strategy", "params"} specs) in execution order.
+            mode (str): "copy", "inplace" or "cow". Defaults to "copy".
+            track_memory (bool): Measure the peak memory of every transform with tracemalloc. Defaults to False.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported pipeline mode: {mode}.")
+        self.strategies = [
+            strategy if isinstance(strategy, FeatureEngineeringStrategy)
+            else STRATEGIES[strategy["strategy"]](**strategy["params"])
+            for strategy in strategies
+        ]
+        self.mode = mode
+        self.track_memory = track_memory
+        self.peak_memory_ = None
+
+    @property
+    def features(self) -> list:
+        return [feature for strategy in self.strategies for feature in strategy.features]
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Fits every stage on the output of the previous one.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+        """
+        self.fit_transform(df)
+        return self
+
+    def fit_transform(self, df: pd.DataFrame):
+        """
+        Fits every stage on the output of the previous one and returns the last output.
+
+        Args:
+            df (pd.DataFrame): The data to learn from and transform.
+        """
+        return self._run(df, fit=True)
+
+    def transform(self, df: pd.DataFrame):
+        """
+        Applies the fitted stages in order.
+
+        Args:
+            df (pd.DataFrame): The data to transform.
+        """
+        return self._run(df, fit=False)
+
+    def _run(self, df: pd.DataFrame, fit: bool):
+        logging.info(f"Running {len(self.strategies)} feature engineering stages in '{self.mode}' mode.")
+        tracing = self.track_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if self.track_memory:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        copy_mode = self.MODES[self.mode]
+        try:
+            with _copy_on_write() if self.mode == "cow" else contextlib.nullcontext():
+                buffer = df.copy() if self.mode == "inplace" else df
+                for strategy in self.strategies:
+                    strategy.copy_mode = copy_mode
+                    try:
+                        buffer = strategy.fit_transform(buffer) if fit else strategy.transform(buffer)
+                    finally:
+                        del strategy.copy_mode
+        finally:
+            if self.track_memory:
+                self.peak_memory_ = tracemalloc.get_traced_memory()[1] - baseline
+                logging.info(f"Feature engineering pipeline peak memory: {self.peak_memory_ / 2**20:.2f} MiB.")
+            if tracing:
+                tracemalloc.stop()
+        return buffer
+
+    def get_params(self):
+        return {
+            "strategies": [
+                {"strategy": type(strategy).__name__, "params": strategy.get_params()}
+                for strategy in self.strategies
+            ],
+            "mode": self.mode,
+            "track_memory": self.track_memory,
+        }
+
+    def get_state(self):
+        return {"states": [strategy.get_state() for strategy in self.strategies]}
+
+    def set_state(self, state):
+        for strategy, strategy_state in zip(self.strategies, state["states"]):
+            strategy.set_state(strategy_state)
+        return self
+
+
+STRATEGIES[FeatureEngineeringPipeline.__name__] = FeatureEngineeringPipeline
+
 
 class FeatureEngineer:
-    def __init__(self, strategy: FeatureEngineeringStrategy):
+    def __init__(self, strategy: FeatureEngineeringStrategy, executor: ShardedExecutor = None):
         """_summary_
 
         Args:
             strategy (FeatureEngineeringStrategy): _description_
+            executor (ShardedExecutor, optional): Fits from statistics merged over row shards and transforms the shards in parallel. Defaults to None (single process).
         """
         self._strategy = strategy
-    
+        self._executor = executor
+
     def set_strategy(self, strategy: FeatureEngineeringStrategy):
         """_summary_
 
@@ -159,7 +610,42 @@ class FeatureEngineer:
             strategy (FeatureEngineeringStrategy): _description_
         """
         self._strategy = strategy
-    
+
+    @instrumented()
+    def fit(self, df: pd.DataFrame) -> "FeatureEngineer":
+        """
+        Fits the current strategy without transforming the data.
+
+        Args:
+            df (pd.DataFrame): The data to learn from.
+
+        Returns:
+            FeatureEngineer: The fitted engineer.
+        """
+        logging.info("Fitting feature engineering strategy.")
+        if self._sharded(df):
+            self._fit_sharded(df, transform=False)
+        else:
+            self._strategy.fit(df)
+        return self
+
+    @instrumented()
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transforms the data with the already fitted strategy.
+
+        Args:
+            df (pd.DataFrame): The data to transform, e.g. an inference batch.
+
+        Returns:
+            pd.DataFrame: The transformed data.
+        """
+        logging.info("Transforming with fitted feature engineering strategy.")
+        if self._sharded(df):
+            return self._executor.apply(self._strategy.transform, df)
+        return self._strategy.transform(df)
+
+    @instrumented()
     def apply(self, df: pd.DataFrame):
         """_summary_
 
@@ -167,9 +653,63 @@ class FeatureEngineer:
             df (pd.DataFrame): _description_
         """
         logging.info("Applying feature engineering strategy.")
-        return self._strategy.transform(df)
+        if self._sharded(df):
+            return self._fit_sharded(df, transform=True)
+        return self._strategy.fit_transform(df)
+
+    def _stages(self) -> list:
+        if isinstance(self._strategy, FeatureEngineeringPipeline):
+            return self._strategy.strategies
+        return [self._strategy]
+
+    def _sharded(self, df: pd.DataFrame) -> bool:
+        return self._executor is not None and all(stage.shard_columns(df) is not None for stage in self._stages())
+
+    def _fit_sharded(self, df: pd.DataFrame, transform: bool):
+        # Every stage learns from the statistics of the previous stage's output.
+        buffer = df
+        stages = self._stages()
+        for i, stage in enumerate(stages):
+            columns = stage.shard_columns(buffer)
+            stage.fit_statistics(self._executor.statistics(buffer, columns) if columns else None)
+            if transform or i < len(stages) - 1:
+                buffer = self._executor.apply(stage.transform, buffer)
+        return buffer
+
+    def save(self, path: str):
+        """
+        Persists the strategy and its fitted state as a JSON artifact.
+
+        Args:
+            path (str): Destination of the artifact.
+        """
+        artifact = {
+            "strategy": type(self._strategy).__name__,
+            "params": self._strategy.get_params(),
+            "state": self._strategy.get_state(),
+        }
+        with open(path, "w") as f:
+            json.dump(artifact, f)
+        logging.info(f"Saved fitted feature engineering state to {path}.")
+
+    @classmethod
+    def load(cls, path: str) -> "FeatureEngineer":
+        """
+        Restores a FeatureEngineer persisted with save.
+
+        Args:
+            path (str): Location of the artifact.
+
+        Returns:
+            FeatureEngineer: An engineer ready to transform without refitting.
+        """
+        with open(path) as f:
+            artifact = json.load(f)
+        strategy = STRATEGIES[artifact["strategy"]](**artifact["params"])
+        logging.info(f"Loaded fitted feature engineering state from {path}.")
+        return cls(strategy.set_state(artifact["state"]))
 
 
 
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
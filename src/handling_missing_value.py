@@ -1,9 +1,13 @@
+import os
 import logging
 import pandas as pd
 import numpy as np
 
 from abc import ABC, abstractmethod
-from sklearn.impute import SimpleImputer 
+from concurrent.futures import ThreadPoolExecutor
+from src.data_schema import restore_compact_dtypes
+from src.sharded_execution import ShardedExecutor
+from src.instrumentation import instrumented
 
 
 class MissingValueHandlingStrategy(ABC):
@@ -20,6 +24,27 @@ class MissingValueHandlingStrategy(ABC):
         """
         pass
 
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        """
+        Returns the columns whose statistics over the whole data handle needs when run on row shards.
+
+        Args:
+            df (pd.DataFrame): The whole data.
+
+        Returns:
+            list: The columns, empty when every row is handled on its own, None when the strategy cannot run on shards.
+        """
+        return None
+
+    def shard_quantiles(self) -> list:
+        """
+        Returns the quantiles handle reads from the statistics of the shard columns.
+
+        Returns:
+            list: Quantiles in [0, 1], made exact before the shards are handled.
+        """
+        return []
+
 
 class DropMissingValuesStrategy(MissingValueHandlingStrategy):
     def __init__(self, axis=0, threshold=None):
@@ -36,18 +61,29 @@ class DropMissingValuesStrategy(MissingValueHandlingStrategy):
         self.axis = axis
         self.threshold = threshold
     
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        return [] if self.axis in (0, "index") else list(df.columns)
+
+    def handle(self, df: pd.DataFrame, stats=None) -> pd.DataFrame:
         """
         Drops rows or columns with missing value based on the axis and the threshold.
 
         Args:
             df (pd.DataFrame): A DataFrame containing features with missing values.
+            stats (ColumnStatistics, optional): Statistics of the whole data when df is one row shard. Defaults to None.
 
         Returns:
             pd.DataFrame: A DataFrame with missing value handled data.
         """
         logging.info(f"Dropping missing value with axis={self.axis} and thresh={self.threshold}")
-        df_cleaned = df.dropna(self.axis, thresh=self.threshold)
+        if stats is not None and self.axis not in (0, "index"):
+            # A column is dropped on its missing values over every shard.
+            counts = stats.count()
+            df_cleaned = df.drop(columns=counts.index[counts < (self.threshold if self.threshold is not None else stats.n_rows)])
+            logging.info("Missing values dropped.")
+            return df_cleaned
+        # pandas 3 reads an explicit thresh=None as a threshold, dropping everything.
+        df_cleaned = df.dropna(axis=self.axis, thresh=self.threshold) if self.threshold is not None else df.dropna(axis=self.axis)
         logging.info("Missing values dropped.")
         return df_cleaned
 
@@ -64,46 +100,174 @@ class FillMissingValueStrategy(MissingValueHandlingStrategy):
         self.method = method
         self.fill_value = fill_value
     
-    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        if self.method in ("mean", "median"):
+            return list(df.select_dtypes(include=np.number).columns)
+        if self.method == "mode":
+            return list(df.columns)
+        return []
+
+    def shard_quantiles(self) -> list:
+        return [0.5] if self.method == "median" else []
+
+    def handle(self, df: pd.DataFrame, stats=None) -> pd.DataFrame:
         """
         Fills missing value using a specified method or constant value.
 
         Args:
             df (pd.DataFrame): A DataFrame containing features with missing values.
+            stats (ColumnStatistics, optional): Statistics of the whole data when df is one row shard. Defaults to None (df's own).
 
         Returns:
             pd.DataFrame: A DataFrame with missing value handled data.
         """
         logging.info(f"Filling missing values using method: {self.method}")
         
+        stats = df if stats is None else stats
         df_cleaned = df.copy()
         if self.method == "mean":
             numeric_features = df_cleaned.select_dtypes(include=np.number).columns
-            df_cleaned[numeric_features] = df_cleaned[numeric_features].fillna(df[numeric_features].mean())
+            df_cleaned[numeric_features] = df_cleaned[numeric_features].fillna(stats[numeric_features].mean())
         elif self.method == "median":
             numeric_features = df_cleaned.select_dtypes(include=np.number).columns
-            df_cleaned[numeric_features] = df_cleaned[numeric_features].fillna(df[numeric_features].median())
+            df_cleaned[numeric_features] = df_cleaned[numeric_features].fillna(stats[numeric_features].median())
         elif self.method == "mode":
-            for column in df_cleaned.columns:
-                df_cleaned[column].fillna(df[numeric_features].mode().iloc[0], inplace=True)
+            # The most frequent value of every column, the smallest one on ties.
+            df_cleaned = df_cleaned.fillna(stats.mode().iloc[0])
         elif self.method == "constant":
+            for column in df_cleaned.select_dtypes(include="category").columns:
+                # A categorical only accepts one of its categories as fill value.
+                if df_cleaned[column].isna().any() and self.fill_value not in df_cleaned[column].cat.categories:
+                    df_cleaned[column] = df_cleaned[column].cat.add_categories([self.fill_value])
             df_cleaned = df_cleaned.fillna(self.fill_value)
         else:
             logging.info(f"warning method '{self.method}'. No missing value handled.")
         
         logging.info("Missing values filled.")
-        return df_cleaned
+        return restore_compact_dtypes(df_cleaned, df)
+
+
+class KNNImputationStrategy(MissingValueHandlingStrategy):
+    """
+    Fills missing numeric values with the mean of the nearest complete rows.
+
+    Neighbors are searched in a KD-tree (or ball tree) built once over the
+    complete rows, restricted to the columns the incomplete row does have:
+    one tree per pattern of missing columns, three at most for one missing
+    score. Only the rows with gaps are queried, in chunks of chunk_size
+    rows spread over worker threads (the tree queries release the GIL), so
+    the memory beyond the data stays at about chunk_size * n_neighbors
+    values per thread however many rows have gaps. Distances are plain
+    Euclidean distances over the columns the incomplete row has, on the raw
+    unscaled values. scikit-learn's KNNImputer differs: its nan_euclidean
+    distance rescales by the share of present coordinates and it compares
+    with every row, so its fills need not match.
+    """
+    def __init__(self, n_neighbors: int = 5, features: list = None, weights: str = "uniform", algorithm: str = "kd_tree", leaf_size: int = 40, chunk_size: int = 10_000, n_jobs: int = None, max_index_rows: int = None, seed: int = 42):
+        """
+        Initializes the KNNImputationStrategy.
+
+        Args:
+            n_neighbors (int): Number of complete rows averaged. Defaults to 5.
+            features (list, optional): Numeric columns used as coordinates and filled. Defaults to None (every numeric column).
+            weights (str): "uniform" or "distance" (inverse-distance weighted mean). Defaults to "uniform".
+            algorithm (str): "kd_tree" or "ball_tree". Defaults to "kd_tree".
+            leaf_size (int): Leaf size of the trees. Defaults to 40.
+            chunk_size (int): Incomplete rows queried at a time. Defaults to 10_000.
+            n_jobs (int, optional): Number of query threads. Defaults to None (one per CPU).
+            max_index_rows (int, optional): Complete rows sampled into the index, bounding its memory. Defaults to None (all of them).
+            seed (int): Seed of that sample. Defaults to 42.
+        """
+        if weights not in ("uniform", "distance"):
+            raise ValueError(f"Unsupported KNN weights: {weights}.")
+        if algorithm not in ("kd_tree", "ball_tree"):
+            raise ValueError(f"Unsupported KNN index: {algorithm}.")
+        self.n_neighbors = n_neighbors
+        self.features = features
+        self.weights = weights
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.max_index_rows = max_index_rows
+        self.seed = seed
+
+    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills the missing values of the features from the nearest complete rows.
+
+        Args:
+            df (pd.DataFrame): A DataFrame containing features with missing values.
+
+        Returns:
+            pd.DataFrame: A DataFrame with missing value handled data.
+        """
+        from sklearn.neighbors import KDTree, BallTree
+
+        features = list(self.features) if self.features is not None else list(df.select_dtypes(include=np.number).columns)
+        logging.info(f"Filling missing values with {self.n_neighbors} nearest neighbors over {features}.")
+        block = df[features].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        missing = np.isnan(block)
+        incomplete = np.flatnonzero(missing.any(axis=1))
+        if len(incomplete) == 0:
+            return df.copy()
+
+        complete = block[~missing.any(axis=1)]
+        if len(complete) == 0:
+            raise ValueError("No complete rows to use as neighbors.")
+        if self.max_index_rows is not None and len(complete) > self.max_index_rows:
+            rng = np.random.default_rng(self.seed)
+            complete = complete[np.sort(rng.choice(len(complete), self.max_index_rows, replace=False))]
+        k = min(self.n_neighbors, len(complete))
+        tree_class = KDTree if self.algorithm == "kd_tree" else BallTree
+
+        # Group the incomplete rows by their pattern of missing columns.
+        patterns, pattern_of_row = np.unique(missing[incomplete], axis=0, return_inverse=True)
+        with ThreadPoolExecutor(max_workers=self.n_jobs or os.cpu_count()) as pool:
+            for p, pattern in enumerate(patterns):
+                rows = incomplete[pattern_of_row.ravel() == p]
+                if pattern.all():
+                    # Nothing to measure a distance on: the mean of the neighbors' pool.
+                    block[rows] = complete.mean(axis=0)
+                    continue
+                observed = ~pattern
+                tree = tree_class(complete[:, observed], leaf_size=self.leaf_size)
+                targets = complete[:, pattern]
+                chunks = [rows[start:start + self.chunk_size] for start in range(0, len(rows), self.chunk_size)]
+                for chunk, values in zip(chunks, pool.map(lambda chunk: self._impute(tree, targets, block[np.ix_(chunk, observed)], k), chunks)):
+                    block[np.ix_(chunk, pattern)] = values
+        logging.info(f"Filled {int(missing.sum())} values in {len(incomplete)} rows from {len(complete)} complete rows.")
+
+        df_cleaned = df.copy()
+        # Only the columns with gaps are written back, the others keep their dtypes.
+        filled = missing.any(axis=0)
+        df_cleaned[[feature for feature, gap in zip(features, filled) if gap]] = block[:, filled]
+        return restore_compact_dtypes(df_cleaned, df)
+
+    def _impute(self, tree, targets: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+        distances, indices = tree.query(queries, k=k)
+        neighbors = targets[indices]
+        if self.weights == "uniform":
+            return neighbors.mean(axis=1)
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / distances
+        # Exact matches take all the weight, like KNNImputer.
+        exact = np.isinf(weights)
+        weights = np.where(exact.any(axis=1, keepdims=True), exact.astype(np.float64), weights)
+        return np.einsum("nk,nkc->nc", weights, neighbors) / weights.sum(axis=1, keepdims=True)
 
 
 class MissingValueHandler:
-    def __init__(self, strategy: MissingValueHandlingStrategy):
+    def __init__(self, strategy: MissingValueHandlingStrategy, executor: ShardedExecutor = None):
         """
         Initializes the MissingValueHandler with a specific missing values handling strategy.
 
         Args:
             strategy (MissingValueHandlingStrategy): The strategy to be used for handling missing value.
+            executor (ShardedExecutor, optional): Runs the strategy on row shards in parallel. Defaults to None (single process).
         """
         self._strategy = strategy
+        self._executor = executor
     
     def set_strategy(self, strategy: MissingValueHandlingStrategy):
         """
@@ -114,6 +278,7 @@ class MissingValueHandler:
         """
         self._strategy = strategy
     
+    @instrumented()
     def handle(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Executes MissingValueHandler using the current strategy.
@@ -124,8 +289,12 @@ class MissingValueHandler:
         Returns:
             pd.DataFrame: A DataFrame with missing value handled data.
         """
-        logging.info("Executing missing value handler with '{self._strategy}'.")
-        return self._strategy.handle(df)
+        logging.info(f"Executing missing value handler with '{self._strategy}'.")
+        columns = self._strategy.shard_columns(df) if self._executor is not None else None
+        if columns is None:
+            return self._strategy.handle(df)
+        stats = self._executor.statistics(df, columns, quantiles=self._strategy.shard_quantiles()) if columns else None
+        return self._executor.apply(self._strategy.handle, df, stats=stats)
 
 
 if __name__ == "__main__":
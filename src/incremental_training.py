@@ -0,0 +1,231 @@
+import os
+import json
+import pickle
+import hashlib
+import logging
+import pandas as pd
+import numpy as np
+
+from src.data_ingestion import IngestData
+from src.outlier_detection import RunningMoments
+from src.categorical_encoding import CategoryDictionary
+from src.feature_engineering import FeatureEngineer, LabelEncodingStrategy
+from src.model_training import StreamingLinearRegressionStrategy
+
+
+class IncrementalTrainer:
+    """
+    Keeps a linear model up to date with rows appended to a CSV file.
+
+    The trainer remembers the byte offset of the rows already consumed, the
+    running means used to fill missing numbers, the category dictionary and
+    the model's sufficient statistics. An update only reads the new tail of
+    the file, so its cost follows the size of the new data, not of the whole
+    history. Category codes are appended, never re-sorted, so statistics
+    accumulated earlier stay valid. Rows consumed earlier keep the fill
+    values known at the time they were read.
+    """
+    PREFIX_BYTES = 1 << 16
+
+    def __init__(self, target_columns: list = None, alpha: float = 0.0, dtype: dict = None):
+        """
+        Initializes the IncrementalTrainer.
+
+        Args:
+            target_columns (list, optional): Target columns. Defaults to None (every numeric column).
+            alpha (float): Ridge penalty. Defaults to 0.0 (OLS).
+            dtype (dict): Column to dtype mapping applied while parsing. Defaults to None.
+        """
+        self.target_columns = target_columns
+        self.alpha = alpha
+        self.dtype = dtype
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets everything consumed so far.
+        """
+        self.offset = 0
+        self.rows = 0
+        self.columns = None
+        self.prefix_length = 0
+        self.prefix_digest = None
+        self.numerical_features = None
+        self.categorical_features = None
+        self.moments = None
+        self.dictionary = CategoryDictionary()
+        self.strategy = StreamingLinearRegressionStrategy(alpha=self.alpha)
+
+    def update(self, file_path: str, block_bytes: int = 8 << 20) -> dict:
+        """
+        Consumes the rows appended to the file since the last update.
+
+        Before the new rows are folded in, the previous model is scored on
+        them, which measures how well it generalized to the new data. If the
+        beginning of the file changed, or the file shrank, it was rewritten
+        and the trainer starts over from the first row.
+
+        Args:
+            file_path (str): Path to the data.
+            block_bytes (int): Number of bytes parsed at a time. Defaults to 8 MiB.
+
+        Returns:
+            dict: Number of new and total rows, and the previous model's metrics on the new rows when there was a previous model.
+        """
+        if self.offset and not self._same_history(file_path):
+            logging.warning(f"{file_path} was rewritten. Retraining from the first row.")
+            self.reset()
+
+        previous_model = self.model() if self.strategy.stats.n else None
+        scores = _ScoreAccumulator()
+        new_rows = 0
+        for chunk, offset in IngestData(file_path, dtype=self.dtype).iter_appended(self.offset, self.columns, block_bytes):
+            self._learn_schema(chunk)
+            self.moments.update(chunk)
+            self.dictionary.update(chunk, self.categorical_features)
+            X, y = self._prepare(chunk)
+            if previous_model is not None:
+                scores.update(y.to_numpy(dtype=np.float64), previous_model.predict(X))
+            self.strategy.partial_fit(X, y)
+            self.offset = offset
+            new_rows += len(chunk)
+
+        self.rows += new_rows
+        if self.prefix_length < min(self.offset, self.PREFIX_BYTES):
+            self.prefix_length = min(self.offset, self.PREFIX_BYTES)
+            self.prefix_digest = self._prefix_digest(file_path)
+        logging.info(f"Consumed {new_rows} new rows, {self.rows} rows in total.")
+        result = {"new_rows": new_rows, "total_rows": self.rows}
+        result.update(scores.metrics())
+        return result
+
+    def model(self):
+        """
+        Solves the sufficient statistics accumulated so far.
+
+        Returns:
+            RegressorMixin: The fitted LinearRegression, or Ridge when alpha is set.
+        """
+        return self.strategy.to_model()
+
+    def save_serving_state(self, directory: str) -> dict:
+        """
+        Saves what serving needs next to the model.
+
+        Writes transform_state.json, the label encoder over the trainer's
+        category dictionary (codes in order of first appearance, unseen labels
+        reserved), loadable with FeatureEngineer.load, and
+        incremental_state.json with the categories, the fill values of the
+        numeric columns and the feature and target columns.
+
+        Args:
+            directory (str): Destination directory.
+
+        Returns:
+            dict: Artifact name to path.
+        """
+        if self.categorical_features is None:
+            raise ValueError("No rows consumed yet. Call update first.")
+        os.makedirs(directory, exist_ok=True)
+        paths = {
+            "transform_state": os.path.join(directory, "transform_state.json"),
+            "incremental_state": os.path.join(directory, "incremental_state.json"),
+        }
+        engineer = FeatureEngineer(LabelEncodingStrategy(list(self.categorical_features), handle_unknown="reserve", dictionary=self.dictionary))
+        engineer.save(paths["transform_state"])
+        state = {
+            "rows": self.rows,
+            "categories": self.dictionary.to_dict(),
+            "fill_values": {column: float(mean) for column, mean in zip(self.moments.columns, self.moments.mean)},
+            "feature_columns": list(self.strategy.feature_names),
+            "target_columns": list(self.target_columns),
+        }
+        with open(paths["incremental_state"], "w") as f:
+            json.dump(state, f)
+        return paths
+
+    def save(self, path: str):
+        """
+        Saves the trainer state.
+
+        Args:
+            path (str): Destination file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logging.info(f"Saved incremental training state to {path}.")
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "IncrementalTrainer":
+        """
+        Loads a saved trainer state, or creates a new trainer when there is none.
+
+        Args:
+            path (str): File written by save.
+            **kwargs: Arguments of a new trainer.
+
+        Returns:
+            IncrementalTrainer: The trainer.
+        """
+        if not os.path.exists(path):
+            return cls(**kwargs)
+        with open(path, "rb") as f:
+            trainer = pickle.load(f)
+        logging.info(f"Loaded incremental training state from {path} ({trainer.rows} rows).")
+        return trainer
+
+    def _learn_schema(self, chunk: pd.DataFrame):
+        if self.columns is not None and self.moments is not None:
+            return
+        self.columns = list(chunk.columns)
+        self.numerical_features = list(chunk.select_dtypes(include=np.number).columns)
+        self.categorical_features = [column for column in self.columns if column not in self.numerical_features]
+        if self.target_columns is None:
+            self.target_columns = list(self.numerical_features)
+        self.moments = RunningMoments(self.numerical_features)
+
+    def _prepare(self, chunk: pd.DataFrame):
+        fill_values = pd.Series(self.moments.mean, index=self.moments.columns)
+        df = chunk[self.numerical_features].astype(np.float64).fillna(fill_values)
+        codes = self.dictionary.encode(chunk, self.categorical_features, handle_unknown="reserve")
+        for i, feature in enumerate(self.categorical_features):
+            df[feature] = codes[:, i]
+        features = [column for column in df.columns if column not in self.target_columns]
+        return df[features], df[self.target_columns]
+
+    def _same_history(self, file_path: str) -> bool:
+        return os.path.getsize(file_path) >= self.offset and self._prefix_digest(file_path) == self.prefix_digest
+
+    def _prefix_digest(self, file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return hashlib.blake2b(f.read(self.prefix_length), digest_size=16).hexdigest()
+
+
+class _ScoreAccumulator:
+    """
+    Streaming mean squared error and R-squared, averaged over targets like scikit-learn.
+    """
+    def __init__(self):
+        self.sse = None
+        self.moments = RunningMoments()
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray):
+        y_pred = np.asarray(y_pred).reshape(y_true.shape)
+        sse = ((y_true - y_pred) ** 2).sum(axis=0)
+        self.sse = sse if self.sse is None else self.sse + sse
+        self.moments.update(pd.DataFrame(y_true))
+
+    def metrics(self) -> dict:
+        if self.sse is None:
+            return {}
+        n = self.moments.count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = np.where(self.moments.m2 > 0, 1 - self.sse / self.moments.m2, 0.0)
+        return {"Mean Squared Error": float((self.sse / n).mean()), "R-Squared": float(r2.mean())}
+
+
+if __name__ == "__main__":
+    pass
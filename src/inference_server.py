@@ -0,0 +1,333 @@
+import json
+import asyncio
+import logging
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List
+from urllib.parse import urlparse
+
+from src.fast_predictor import FastLinearPredictor
+
+# Serving a compiled predictor needs NumPy only; pandas and the encoders load with a model.
+if TYPE_CHECKING:
+    from src.feature_engineering import FeatureEngineer
+
+
+class BatchPredictor:
+    """
+    Vectorized predictions for a batch of JSON records.
+
+    The fitted transform state and the model run once per batch: the
+    records are pivoted into columns with plain Python, so pandas is only
+    touched once per batch, never per request.
+    """
+    def __init__(self, model, engineer: "FeatureEngineer" = None, target_columns: List[str] = None):
+        """
+        Initializes the BatchPredictor.
+
+        Args:
+            model (RegressorMixin): A fitted model with feature_names_in_.
+            engineer (FeatureEngineer, optional): Fitted transform state applied before predicting. Defaults to None.
+            target_columns (List[str], optional): Names of the predicted targets. Defaults to None.
+        """
+        self.model = model
+        self.engineer = engineer
+        self.feature_columns = list(model.feature_names_in_)
+        self.input_columns = self.feature_columns
+        self.target_columns = target_columns
+
+    def predict(self, records: List[dict]) -> List[list]:
+        """
+        Predicts a batch of records.
+
+        Args:
+            records (List[dict]): One mapping of feature to raw value per row.
+
+        Returns:
+            List[list]: One list of target predictions per row.
+        """
+        import pandas as pd
+
+        columns = {column: [record.get(column) for record in records] for column in self.feature_columns}
+        df = pd.DataFrame(columns)
+        if self.engineer is not None:
+            df = self.engineer.transform(df)
+        predictions = np.asarray(self.model.predict(df[self.feature_columns]))
+        return predictions.reshape(len(records), -1).tolist()
+
+
+def load_predictor(model_uri: str, transform_uri: str = None, target_columns: List[str] = None) -> BatchPredictor:
+    """
+    Loads a logged model and its fitted transform state.
+
+    Args:
+        model_uri (str): MLflow model URI, e.g. "runs:/<run_id>/model", or a local model directory.
+        transform_uri (str, optional): MLflow artifact URI or local path of the transform state JSON. Defaults to None.
+        target_columns (List[str], optional): Names of the predicted targets. Defaults to None.
+
+    Returns:
+        BatchPredictor: The predictor.
+    """
+    import mlflow.sklearn
+    from src.feature_engineering import FeatureEngineer
+
+    model = mlflow.sklearn.load_model(model_uri)
+    engineer = None
+    if transform_uri is not None:
+        if urlparse(transform_uri).scheme in ("runs", "models", "http", "https", "s3", "file"):
+            transform_uri = mlflow.artifacts.download_artifacts(transform_uri)
+        engineer = FeatureEngineer.load(transform_uri)
+    logging.info(f"Loaded model from {model_uri}.")
+    return BatchPredictor(model, engineer, target_columns)
+
+
+def load_fast_predictor(predictor_uri: str) -> FastLinearPredictor:
+    """
+    Loads a compiled predictor, see src.fast_predictor.
+
+    Args:
+        predictor_uri (str): MLflow artifact URI or local path of the .npz artifact.
+
+    Returns:
+        FastLinearPredictor: The predictor.
+    """
+    if urlparse(predictor_uri).scheme in ("runs", "models", "http", "https", "s3", "file"):
+        import mlflow
+
+        predictor_uri = mlflow.artifacts.download_artifacts(predictor_uri)
+    logging.info(f"Loaded compiled predictor from {predictor_uri}.")
+    return FastLinearPredictor.load(predictor_uri)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent requests into micro-batches.
+
+    The first queued request opens a batch, which closes when it holds
+    max_batch_size rows or max_wait_ms after it opened, whichever comes
+    first. Each batch runs as one call of predict_fn on a worker thread, so
+    the event loop keeps accepting requests meanwhile.
+    """
+    def __init__(self, predict_fn: Callable[[List[dict]], List[list]], max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        """
+        Initializes the MicroBatcher.
+
+        Args:
+            predict_fn (Callable[[List[dict]], List[list]]): Predicts a list of records.
+            max_batch_size (int): Maximum number of rows per batch. Defaults to 64.
+            max_wait_ms (float): Maximum time a batch waits for more rows, in milliseconds. Defaults to 2.0.
+        """
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size must be a positive integer, got {max_batch_size}.")
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.rows = 0
+        self._queue = None
+        self._worker = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def start(self):
+        """
+        Starts the batching loop on the running event loop.
+        """
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """
+        Stops the batching loop.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, records: List[dict]) -> List[list]:
+        """
+        Queues the records of one request and waits for their predictions.
+
+        Args:
+            records (List[dict]): The rows of the request.
+
+        Returns:
+            List[list]: The predictions of the rows, in order.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((records, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.max_wait
+            while size < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            records = [record for request, _ in pending for record in request]
+            try:
+                predictions = await loop.run_in_executor(self._executor, self.predict_fn, records)
+            except Exception:
+                # One bad request must not fail its batch mates: retry them one by one.
+                for request, future in pending:
+                    await self._predict_one(request, future)
+                continue
+            if isinstance(predictions, np.ndarray):
+                predictions = predictions.tolist()
+            self.batches += 1
+            self.rows += len(records)
+            start = 0
+            for request, future in pending:
+                if not future.done():
+                    future.set_result(predictions[start:start + len(request)])
+                start += len(request)
+
+    async def _predict_one(self, records: List[dict], future: asyncio.Future):
+        try:
+            predictions = await asyncio.get_running_loop().run_in_executor(self._executor, self.predict_fn, records)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if isinstance(predictions, np.ndarray):
+            predictions = predictions.tolist()
+        self.batches += 1
+        self.rows += len(records)
+        if not future.done():
+            future.set_result(predictions)
+
+
+class InferenceServer:
+    """
+    Minimal HTTP/1.1 JSON prediction service on asyncio streams.
+
+    POST /predict takes {"instances": [record, ...]} or a single record and
+    answers {"predictions": [[...], ...]}; records missing an input of the
+    predictor are rejected with 400 and the names of the missing fields.
+    GET /health reports the batching counters. Connections are kept alive
+    between requests.
+    """
+    def __init__(self, predictor, host: str = "127.0.0.1", port: int = 8080, max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        """
+        Initializes the InferenceServer.
+
+        Args:
+            predictor (BatchPredictor or FastLinearPredictor): The predictor serving the batches.
+            host (str): Interface to bind. Defaults to "127.0.0.1".
+            port (int): Port to bind. Defaults to 8080.
+            max_batch_size (int): Maximum number of rows per batch. Defaults to 64.
+            max_wait_ms (float): Maximum time a batch waits for more rows, in milliseconds. Defaults to 2.0.
+        """
+        self.predictor = predictor
+        self.host = host
+        self.port = port
+        self.batcher = MicroBatcher(predictor.predict, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        self._server = None
+
+    async def start(self):
+        """
+        Starts listening. The bound port is available in self.port.
+        """
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"Serving predictions on http://{self.host}:{self.port}.")
+
+    async def stop(self):
+        """
+        Stops listening and the batching loop.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self):
+        """
+        Starts the server and runs until cancelled.
+        """
+        await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self._route(method, path, body)
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if method == "GET" and path == "/health":
+            return "200 OK", {"status": "ok", "batches": self.batcher.batches, "rows": self.batcher.rows}
+        if method != "POST" or path != "/predict":
+            return "404 Not Found", {"error": f"No route for {method} {path}."}
+        try:
+            payload = json.loads(body)
+            records = payload["instances"] if isinstance(payload, dict) and "instances" in payload else payload
+            if isinstance(records, dict):
+                records = [records]
+            if not isinstance(records, list) or not records:
+                raise ValueError("Expected a record or a non-empty list of records.")
+            if not all(isinstance(record, dict) for record in records):
+                raise ValueError("Every record must be a JSON object.")
+        except (ValueError, TypeError) as e:
+            return "400 Bad Request", {"error": str(e)}
+        missing = [column for column in self.predictor.input_columns if any(column not in record for record in records)]
+        if missing:
+            return "400 Bad Request", {"error": f"Missing required fields: {', '.join(missing)}.", "missing": missing}
+        try:
+            predictions = await self.batcher.submit(records)
+        except Exception as e:
+            logging.warning(f"Prediction failed: {e}.")
+            return "422 Unprocessable Entity", {"error": str(e)}
+        response = {"predictions": predictions}
+        if self.predictor.target_columns:
+            response["targets"] = self.predictor.target_columns
+        return "200 OK", response
+
+
+if __name__ == "__main__":
+    pass
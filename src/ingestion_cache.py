@@ -0,0 +1,187 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import pandas as pd
+
+from typing import Optional
+
+
+class IngestionCache:
+    """
+    Content-addressed on-disk cache of parsed CSV files.
+
+    Entries are keyed by the source path, size, modification time and a hash
+    of the file content (plus the parse options), and stored as Feather files
+    that are memory-mapped on load. A hit is parse-free, not copy-free: the
+    columns are copied once from the memory map into pandas blocks. The least
+    recently used entries are evicted once the cache grows beyond max_bytes.
+    """
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1 << 30):
+        """
+        Initializes the IngestionCache.
+
+        Args:
+            cache_dir (str): Directory where cached frames are stored.
+            max_bytes (int): Upper bound of the total cache size in bytes. Defaults to 1 GiB.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    def key(self, file_path: str, **options) -> str:
+        """
+        Builds the cache key of a source file.
+
+        Args:
+            file_path (str): Path to the source file.
+            **options: Parse options that change the resulting frame (e.g. dtype).
+
+        Returns:
+            str: Hex digest identifying the file content and parse options.
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        stat_key = f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+        # Hashing is far cheaper than parsing, but still skip it while the
+        # file is untouched since the last time it was hashed.
+        content_hash = self._index["hashes"].get(stat_key)
+        if content_hash is None:
+            content_hash = self._hash_file(path)
+            self._index["hashes"] = {
+                k: v for k, v in self._index["hashes"].items() if not k.startswith(f"{path}|")
+            }
+            self._index["hashes"][stat_key] = content_hash
+            self._save_index()
+        payload = json.dumps([stat_key, content_hash, options], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Loads a cached frame.
+
+        Args:
+            key (str): Cache key returned by key().
+
+        Returns:
+            Optional[pd.DataFrame]: The cached frame, or None on a cache miss.
+        """
+        entry = self._index["entries"].get(key)
+        path = self._entry_path(key)
+        if entry is None or not os.path.exists(path):
+            logging.info(f"Ingestion cache miss for key {key}.")
+            return None
+
+        from pyarrow import feather
+        table = feather.read_table(path, memory_map=True)
+        entry["last_access"] = time.time()
+        self._save_index()
+        logging.info(f"Ingestion cache hit for {entry['source']}.")
+        # Zero-copy columns would be read-only views of the memory map, which
+        # pandas' in-place writes downstream reject; the copy keeps them writable.
+        return table.to_pandas()
+
+    def put(self, key: str, df: pd.DataFrame, source: str = None):
+        """
+        Stores a frame in the cache and evicts old entries if needed.
+
+        Args:
+            key (str): Cache key returned by key().
+            df (pd.DataFrame): The parsed frame to store.
+            source (str): Path of the source file, used by invalidate(). Defaults to None.
+        """
+        from pyarrow import feather
+
+        path = self._entry_path(key)
+        tmp_path = f"{path}.tmp"
+        # Uncompressed Feather keeps the buffers memory-mappable.
+        feather.write_feather(df.reset_index(drop=True), tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+        self._index["entries"][key] = {
+            "source": os.path.abspath(source) if source else None,
+            "bytes": os.path.getsize(path),
+            "last_access": time.time(),
+        }
+        logging.info(f"Cached {len(df)} rows under key {key}.")
+        self._evict()
+        self._save_index()
+
+    def invalidate(self, file_path: str = None) -> int:
+        """
+        Removes cached entries.
+
+        Args:
+            file_path (str): Remove only the entries of this source file. Defaults to None (remove everything).
+
+        Returns:
+            int: Number of removed entries.
+        """
+        source = os.path.abspath(file_path) if file_path else None
+        keys = [k for k, e in self._index["entries"].items() if source is None or e["source"] == source]
+        for key in keys:
+            self._remove(key)
+        if source is None:
+            self._index["hashes"] = {}
+        else:
+            self._index["hashes"] = {
+                k: v for k, v in self._index["hashes"].items() if not k.startswith(f"{source}|")
+            }
+        self._save_index()
+        logging.info(f"Invalidated {len(keys)} ingestion cache entries.")
+        return len(keys)
+
+    def size(self) -> int:
+        """
+        Returns the total size of the cached frames in bytes.
+        """
+        return sum(e["bytes"] for e in self._index["entries"].values())
+
+    def _evict(self):
+        entries = self._index["entries"]
+        for key in sorted(entries, key=lambda k: entries[k]["last_access"]):
+            if self.size() <= self.max_bytes:
+                break
+            logging.info(f"Evicting ingestion cache entry {key}.")
+            self._remove(key)
+
+    def _remove(self, key: str):
+        self._index["entries"].pop(key, None)
+        path = self._entry_path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.feather")
+
+    def _load_index(self) -> dict:
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                logging.warning(f"Ingestion cache index {path} is unreadable. Starting with an empty cache.")
+        return {"entries": {}, "hashes": {}}
+
+    def _save_index(self):
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _hash_file(path: str, block_size: int = 1 << 20) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,296 @@
+import os
+import re
+import sys
+import json
+import time
+import logging
+import functools
+import threading
+import tracemalloc
+
+from contextlib import contextmanager
+from typing import Callable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# The profiler receiving the measurements of instrumented calls, if any.
+_active = None
+_local = threading.local()
+
+
+class StepProfiler:
+    """
+    Collects wall time, CPU time, memory, row counts and data sizes of instrumented calls.
+
+    Steps and strategy calls decorated with instrumented report to the
+    profiler activated with activate(); without an active profiler the
+    decorators only cost one global lookup. Calls nested in another call
+    (a strategy inside a step) are recorded with their parent. Calls run
+    on process pools are not measured.
+    """
+    def __init__(self, trace_memory: bool = False, profile_dir: str = None, profiler: str = "cprofile", measure_bytes: bool = True):
+        """
+        Initializes the StepProfiler.
+
+        Args:
+            trace_memory (bool): Measure the peak Python allocations of every call with tracemalloc (slower). Defaults to False.
+            profile_dir (str, optional): Directory receiving one profile dump per top-level call. Defaults to None (no dumps).
+            profiler (str): "cprofile" (.prof files for pstats/snakeviz) or "pyinstrument" (.html). Defaults to "cprofile".
+            measure_bytes (bool): Record the size of the data in and out of every call, outside of its timing. Defaults to True.
+        """
+        if profiler not in ("cprofile", "pyinstrument"):
+            raise ValueError(f"Unsupported profiler: {profiler}.")
+        self.trace_memory = trace_memory
+        self.profile_dir = profile_dir
+        self.profiler = profiler
+        self.measure_bytes = measure_bytes
+        self.records = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this profiler receive the measurements of instrumented calls.
+        """
+        global _active
+        previous = _active
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.profile_dir is not None:
+            os.makedirs(self.profile_dir, exist_ok=True)
+        _active = self
+        try:
+            yield self
+        finally:
+            _active = previous
+            if started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def measure(self, name: str, rows_in: int = None):
+        """
+        Measures a block of code as one call.
+
+        Args:
+            name (str): Name of the call.
+            rows_in (int, optional): Number of input rows. Defaults to None.
+
+        Yields:
+            dict: The record, where rows_out can be set before the block ends.
+        """
+        stack = _stack()
+        record = {"name": name, "parent": stack[-1]["record"]["name"] if stack else None, "rows_in": rows_in, "rows_out": None}
+        frame = {"record": record, "peak": 0}
+        if self.trace_memory and tracemalloc.is_tracing():
+            # tracemalloc has a single peak: carry the enclosing call's peak over the reset.
+            if stack:
+                stack[-1]["peak"] = max(stack[-1]["peak"], tracemalloc.get_traced_memory()[1])
+            frame["start_traced"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        profile = self._start_profile() if not stack and self.profile_dir is not None else None
+
+        stack.append(frame)
+        rss_before = _peak_rss()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_seconds"] = time.perf_counter() - wall_start
+            record["cpu_seconds"] = time.process_time() - cpu_start
+            record["peak_rss_delta_bytes"] = _peak_rss() - rss_before if rss_before is not None else None
+            stack.pop()
+            if "start_traced" in frame:
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                record["traced_peak_bytes"] = peak - frame["start_traced"]
+                if stack:
+                    stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+            rows = record["rows_out"] if record["rows_out"] is not None else record["rows_in"]
+            record["rows_per_second"] = rows / record["wall_seconds"] if rows and record["wall_seconds"] > 0 else None
+            if profile is not None:
+                record["profile"] = self._stop_profile(profile, name)
+            with self._lock:
+                record["call"] = len(self.records)
+                self.records.append(record)
+            logging.info(f"Step '{name}' took {record['wall_seconds']:.3f}s wall, {record['cpu_seconds']:.3f}s CPU.")
+
+    def report(self) -> dict:
+        """
+        Returns every record plus per-name totals.
+
+        Returns:
+            dict: {"calls": [...], "totals": {name: {"calls", "wall_seconds", "cpu_seconds"}}}.
+        """
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record["name"], {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+            total["calls"] += 1
+            total["wall_seconds"] += record["wall_seconds"]
+            total["cpu_seconds"] += record["cpu_seconds"]
+        return {"calls": list(self.records), "totals": totals}
+
+    def to_json(self, path: str):
+        """
+        Writes the report as JSON.
+
+        Args:
+            path (str): Destination file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def log_to_mlflow(self, tracker=None):
+        """
+        Logs the report as profile/steps.json and every top-level call as MLflow metrics.
+
+        Metrics are named "<step>.<measure>"; repeated calls of a step use the call number as the MLflow step.
+
+        Args:
+            tracker (MLflowLogger, optional): Where to log. Defaults to None (synchronous logging to the active run).
+        """
+        from src.mlflow_logger import MLflowLogger
+
+        tracker = tracker or MLflowLogger()
+        tracker.log_dict(self.report(), "profile/steps.json")
+        seen = {}
+        for record in self.records:
+            if record["parent"] is not None:
+                continue
+            step = seen[record["name"]] = seen.get(record["name"], -1) + 1
+            # MLflow metric names only allow letters, digits and "_-. /".
+            name = re.sub(r"[^\w\-. /]", "_", record["name"])
+            for measure in ("wall_seconds", "cpu_seconds", "peak_rss_delta_bytes", "traced_peak_bytes", "rows_per_second", "bytes_per_row_out"):
+                if record.get(measure) is not None:
+                    tracker.log_metric(f"{name}.{measure}", record[measure], step=step)
+            if record.get("profile"):
+                tracker.log_artifact(record["profile"], "profile")
+
+    def _start_profile(self):
+        if self.profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                logging.warning("pyinstrument is not installed. Skipping the profile dump.")
+                return None
+            profile = Profiler()
+            profile.start()
+            return profile
+
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def _stop_profile(self, profile, name: str) -> str:
+        stem = os.path.join(self.profile_dir, f"{len(self.records):03d}_{name.replace('/', '_')}")
+        if self.profiler == "pyinstrument":
+            profile.stop()
+            path = f"{stem}.html"
+            with open(path, "w") as f:
+                f.write(profile.output_html())
+        else:
+            profile.disable()
+            path = f"{stem}.prof"
+            profile.dump_stats(path)
+        return path
+
+
+def _stack() -> list:
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _peak_rss():
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _rows(value):
+    # Duck-typed on shape (frames, arrays, sparse matrices, SparseDesignMatrix) so
+    # that every step can import the decorator without loading the data libraries.
+    shape = getattr(value, "shape", None)
+    if isinstance(shape, tuple) and shape:
+        return shape[0]
+    if isinstance(value, tuple):
+        return next((rows for rows in map(_rows, value) if rows is not None), None)
+    return None
+
+
+def _nbytes(value):
+    # Frames count their strings and categories; arrays and sparse matrices their buffers.
+    if hasattr(value, "memory_usage"):
+        usage = value.memory_usage(deep=True, index=False)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(value, "dense") and hasattr(value, "sparse"):
+        return _nbytes(value.dense) + _nbytes(value.sparse)
+    if hasattr(value, "indptr"):
+        return int(value.data.nbytes + value.indices.nbytes + value.indptr.nbytes)
+    if hasattr(value, "nbytes") and hasattr(value, "shape"):
+        return int(value.nbytes)
+    if isinstance(value, tuple):
+        sizes = [size for size in map(_nbytes, value) if size is not None]
+        return sum(sizes) if sizes else None
+    return None
+
+
+def _record_bytes(record: dict, bytes_in: int, result):
+    record["bytes_in"] = bytes_in
+    record["bytes_out"] = _nbytes(result)
+    # A tuple (e.g. a split) is measured as a whole, per input row.
+    rows_out = record["rows_in"] if isinstance(result, tuple) else record["rows_out"]
+    record["bytes_per_row_in"] = record["bytes_in"] / record["rows_in"] if record["bytes_in"] is not None and record["rows_in"] else None
+    record["bytes_per_row_out"] = record["bytes_out"] / rows_out if record["bytes_out"] is not None and rows_out else None
+
+
+def instrumented(name: str = None) -> Callable:
+    """
+    Decorates a step function or a context-class method so an active StepProfiler measures its calls.
+
+    Rows in are counted on the first data argument, rows out on the result
+    (the first data item of a returned tuple). With measure_bytes, the
+    in-memory size of both, and its value per row, are recorded as well. Methods of classes holding a
+    _strategy are named after the strategy too, e.g. "FeatureEngineer.apply[LabelEncodingStrategy]".
+
+    Args:
+        name (str, optional): Name of the measurements. Defaults to None (the function's qualified name).
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            call_name = label
+            if args and hasattr(args[0], "_strategy"):
+                call_name = f"{label}[{type(args[0]._strategy).__name__}]"
+            data = next((value for value in list(args) + list(kwargs.values()) if _rows(value) is not None), None)
+            # Sized before the call: a step may modify its input in place.
+            bytes_in = _nbytes(data) if profiler.measure_bytes and data is not None else None
+            with profiler.measure(call_name, _rows(data) if data is not None else None) as record:
+                result = func(*args, **kwargs)
+                record["rows_out"] = _rows(result)
+            if profiler.measure_bytes:
+                _record_bytes(record, bytes_in, result)
+            return result
+        return wrapper
+    return decorator
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,431 @@
+import os
+import sys
+import json
+import time
+import uuid
+import queue
+import shutil
+import logging
+import threading
+
+from functools import partial
+
+# mlflow takes seconds to import, so it is imported by the calls that need it:
+# the asynchronous logger only loads it on its worker thread.
+
+
+class MLflowLogger:
+    """
+    Synchronous logging to the active MLflow run through the fluent API.
+
+    This is what the pipelines did before the asynchronous logger existed,
+    and remains the default when no tracker is given.
+    """
+    def get_tracking_uri(self) -> str:
+        import mlflow
+
+        return mlflow.get_tracking_uri()
+
+    def log_metric(self, key: str, value: float, step: int = None):
+        import mlflow
+
+        mlflow.log_metric(key, value, step=step)
+
+    def log_metrics(self, metrics: dict, step: int = None):
+        import mlflow
+
+        mlflow.log_metrics(metrics, step=step)
+
+    def log_param(self, key: str, value):
+        import mlflow
+
+        mlflow.log_param(key, value)
+
+    def log_params(self, params: dict):
+        import mlflow
+
+        mlflow.log_params(params)
+
+    def log_dict(self, dictionary: dict, artifact_file: str):
+        import mlflow
+
+        mlflow.log_dict(dictionary, artifact_file)
+
+    def log_artifact(self, local_path: str, artifact_path: str = None):
+        import mlflow
+
+        mlflow.log_artifact(local_path, artifact_path)
+
+    def log_model(self, model, name: str = "model", registered_model_name: str = None):
+        import mlflow.sklearn
+
+        mlflow.sklearn.log_model(model, name, registered_model_name=registered_model_name)
+
+    def flush(self, timeout: float = None) -> bool:
+        return True
+
+    def close(self, timeout: float = None, status: str = "FINISHED") -> bool:
+        return True
+
+
+class AsyncMLflowLogger(MLflowLogger):
+    """
+    Buffered MLflow logging flushed in batches by a background thread.
+
+    Logging calls only enqueue. Every flush interval the worker writes the
+    queued metrics, params and artifacts as one entry of a local spool
+    directory, then sends the spool oldest first with MlflowClient (one
+    log_batch per entry) and deletes what was delivered. When the tracking
+    server is slow or down, the training run never waits on it: entries
+    stay in the spool, sending is retried every retry_interval seconds, and
+    replay_spool delivers what is left after the process exits. Entries the
+    server rejects for good are moved to the failed/ directory of the spool.
+
+    The run is created on the first successful delivery when no run is
+    active, so training can start while the server is unreachable.
+    """
+    RUNS_FILE = "runs.json"
+    FAILED_DIR = "failed"
+
+    def __init__(self, run_id: str = None, experiment_id: str = None, spool_dir: str = ".cache/mlflow_spool", tracking_uri: str = None, flush_interval: float = 1.0, max_batch_size: int = 1000, retry_interval: float = 30.0):
+        """
+        Initializes the AsyncMLflowLogger and starts its worker.
+
+        Args:
+            run_id (str, optional): Run to log to. Defaults to None (the active run, or a new run created on first delivery).
+            experiment_id (str, optional): Experiment of a run created on first delivery. Defaults to None (the default experiment).
+            spool_dir (str): Directory of the local spool. Defaults to ".cache/mlflow_spool".
+            tracking_uri (str, optional): Tracking URI. Defaults to None (the current mlflow tracking URI).
+            flush_interval (float): Seconds between flushes. Defaults to 1.0.
+            max_batch_size (int): Maximum number of queued calls per spool entry. Defaults to 1000.
+            retry_interval (float): Seconds to wait before retrying an unreachable server. Defaults to 30.0.
+        """
+        # No run can be active before mlflow was imported.
+        if run_id is None and "mlflow" in sys.modules and sys.modules["mlflow"].active_run() is not None:
+            run_id = sys.modules["mlflow"].active_run().info.run_id
+        if tracking_uri is None:
+            import mlflow
+
+            tracking_uri = mlflow.get_tracking_uri()
+        self.run_id = run_id
+        self.experiment_id = experiment_id
+        self.spool_dir = spool_dir
+        self.tracking_uri = tracking_uri
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.retry_interval = retry_interval
+        # Groups the entries of a run that does not exist yet.
+        self.spool_run = uuid.uuid4().hex
+        self._sequence = 0
+        self._retry_at = 0.0
+        self._queue = queue.Queue()
+        self._closed = False
+        os.makedirs(os.path.join(self.spool_dir, "files"), exist_ok=True)
+        self._worker = threading.Thread(target=self._run, name="mlflow-logger", daemon=True)
+        self._worker.start()
+
+    def get_tracking_uri(self) -> str:
+        return self.tracking_uri
+
+    def log_metric(self, key: str, value: float, step: int = None):
+        self._put(("metric", key, float(value), int(time.time() * 1000), step or 0))
+
+    def log_metrics(self, metrics: dict, step: int = None):
+        for key, value in metrics.items():
+            self.log_metric(key, value, step)
+
+    def log_param(self, key: str, value):
+        self._put(("param", key, str(value)))
+
+    def log_params(self, params: dict):
+        for key, value in params.items():
+            self.log_param(key, value)
+
+    def log_dict(self, dictionary: dict, artifact_file: str):
+        staged = self._stage_dir()
+        local_path = os.path.join(staged, os.path.basename(artifact_file))
+        with open(local_path, "w") as f:
+            json.dump(dictionary, f, indent=2)
+        self._put(("artifact", local_path, os.path.dirname(artifact_file) or None))
+
+    def log_artifact(self, local_path: str, artifact_path: str = None):
+        # Copied right away: callers often log files from temporary directories.
+        staged = os.path.join(self._stage_dir(), os.path.basename(local_path))
+        shutil.copy2(local_path, staged)
+        self._put(("artifact", staged, artifact_path))
+
+    def log_model(self, model, name: str = "model", registered_model_name: str = None):
+        import mlflow.sklearn
+
+        # Serialized now so later changes to the model object are not logged.
+        staged = os.path.join(self._stage_dir(), name)
+        mlflow.sklearn.save_model(model, staged)
+        self._put(("model", staged, name, registered_model_name))
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Spools everything logged so far and tries to deliver it.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to None (wait until done).
+
+        Returns:
+            bool: Whether the flush finished in time.
+        """
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0, status: str = "FINISHED") -> bool:
+        """
+        Marks the run terminated, flushes and stops the worker.
+
+        Whatever cannot be delivered within timeout stays in the spool for
+        replay_spool.
+
+        Args:
+            timeout (float): Seconds to wait for the delivery. Defaults to 10.0.
+            status (str): Final status of the run. Defaults to "FINISHED".
+
+        Returns:
+            bool: Whether everything was delivered.
+        """
+        if self._closed:
+            return True
+        self._closed = True
+        self._queue.put(("terminate", status))
+        self._queue.put(None)
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            # The worker is stuck on the server; keep what it has not read yet.
+            items = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None and item[0] != "flush":
+                    items.append(item)
+            if items:
+                self._write_entry(items)
+            logging.warning(f"MLflow server did not answer in {timeout}s. Pending logs are kept in {self.spool_dir}.")
+            return False
+        rejected = self._failed_entries()
+        if rejected:
+            logging.warning(f"The MLflow server rejected {len(rejected)} log entries. They were moved to {os.path.join(self.spool_dir, self.FAILED_DIR)}.")
+        delivered = not self._pending()
+        if not delivered:
+            logging.warning(f"Some MLflow logs could not be delivered yet. They are kept in {self.spool_dir}; replay them with replay_spool.")
+        return delivered and not rejected
+
+    def _put(self, item: tuple):
+        if self._closed:
+            raise RuntimeError("The logger is closed.")
+        self._queue.put(item)
+
+    def _stage_dir(self) -> str:
+        path = os.path.join(self.spool_dir, "files", uuid.uuid4().hex)
+        os.makedirs(path)
+        return path
+
+    def _run(self):
+        stop = False
+        while not stop:
+            items, events = [], []
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                first = ()
+            pending = [first] if first != () else []
+            while len(pending) < self.max_batch_size:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in pending:
+                if item is None:
+                    stop = True
+                elif item[0] == "flush":
+                    events.append(item[1])
+                else:
+                    items.append(item)
+
+            if items:
+                self._write_entry(items)
+            # An explicit flush or close retries at once, otherwise wait out the backoff.
+            if (events or stop or time.monotonic() >= self._retry_at) and self._pending():
+                if not replay_spool(self.spool_dir, self._own_entries()):
+                    self._retry_at = time.monotonic() + self.retry_interval
+            for event in events:
+                event.set()
+
+    def _own_entries(self) -> list:
+        return [path for path in _entries(self.spool_dir) if os.path.basename(path).startswith(self.spool_run)]
+
+    def _pending(self) -> bool:
+        return bool(self._own_entries())
+
+    def _failed_entries(self) -> list:
+        return [path for path in _entries(os.path.join(self.spool_dir, self.FAILED_DIR)) if os.path.basename(path).startswith(self.spool_run)]
+
+    def _write_entry(self, items: list):
+        entry = {
+            "tracking_uri": self.tracking_uri,
+            "run_id": self.run_id,
+            "spool_run": self.spool_run,
+            "experiment_id": self.experiment_id,
+            "metrics": [item[1:] for item in items if item[0] == "metric"],
+            "params": [item[1:] for item in items if item[0] == "param"],
+            "artifacts": [item[1:] for item in items if item[0] == "artifact"],
+            "models": [item[1:] for item in items if item[0] == "model"],
+            "terminate": next((item[1] for item in items if item[0] == "terminate"), None),
+        }
+        self._sequence += 1
+        name = f"{self.spool_run}-{time.time_ns():020d}-{self._sequence:06d}.json"
+        _write_json(os.path.join(self.spool_dir, name), entry)
+
+
+_spool_lock = threading.Lock()
+
+
+def _entries(spool_dir: str) -> list:
+    if not os.path.isdir(spool_dir):
+        return []
+    names = [name for name in os.listdir(spool_dir) if name.endswith(".json") and name != AsyncMLflowLogger.RUNS_FILE]
+    # Entries of one logger sort by time; different loggers replay one after the other.
+    return [os.path.join(spool_dir, name) for name in sorted(names, key=lambda n: n.split("-", 1)[1])]
+
+
+def _write_json(path: str, data: dict):
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(data, f)
+    os.replace(f"{path}.tmp", path)
+
+
+def replay_spool(spool_dir: str = ".cache/mlflow_spool", entries: list = None) -> bool:
+    """
+    Delivers spooled MLflow logs, oldest first, deleting each delivered entry.
+
+    Delivery stops at the first entry the server cannot take right now
+    (connection errors and 5xx answers), so the order of the logs is kept.
+    An entry the server rejects for good (4xx answers, e.g. a changed param
+    value) is moved to the failed/ directory of the spool with its error,
+    and delivery goes on. Every entry records the calls already delivered,
+    so a retried entry resumes where it stopped instead of logging its
+    metrics again.
+
+    Args:
+        spool_dir (str): Directory of the spool. Defaults to ".cache/mlflow_spool".
+        entries (list, optional): Entry files to deliver. Defaults to None (all entries).
+
+    Returns:
+        bool: Whether no entry is left to retry.
+    """
+    with _spool_lock:
+        entries = _entries(spool_dir) if entries is None else entries
+        runs_path = os.path.join(spool_dir, AsyncMLflowLogger.RUNS_FILE)
+        runs = {}
+        if os.path.exists(runs_path):
+            with open(runs_path) as f:
+                runs = json.load(f)
+
+        for path in entries:
+            with open(path) as f:
+                entry = json.load(f)
+            try:
+                run_id = _send(entry, runs, runs_path, path)
+            except Exception as e:
+                if _retryable(e):
+                    logging.warning(f"Could not deliver MLflow logs, keeping them in {spool_dir}: {e}.")
+                    return False
+                failed_path = _set_aside(path, entry, e)
+                logging.warning(f"The MLflow server rejected {os.path.basename(path)}, moved it to {failed_path}: {e}.")
+                continue
+            for staged in [artifact[0] for artifact in entry["artifacts"]] + [model[0] for model in entry["models"]]:
+                shutil.rmtree(os.path.dirname(staged), ignore_errors=True)
+            os.remove(path)
+            logging.info(f"Delivered {len(entry['metrics'])} metrics, {len(entry['params'])} params and {len(entry['artifacts']) + len(entry['models'])} artifacts to run {run_id}.")
+        return True
+
+
+def _send(entry: dict, runs: dict, runs_path: str, path: str) -> str:
+    from mlflow.tracking import MlflowClient
+
+    client = MlflowClient(entry["tracking_uri"])
+    run_id = entry["run_id"] or runs.get(entry["spool_run"])
+    if run_id is None:
+        run_id = client.create_run(entry["experiment_id"] or "0").info.run_id
+        runs[entry["spool_run"]] = run_id
+        _write_json(runs_path, runs)
+
+    calls = _calls(client, run_id, entry)
+    for i in range(entry.get("sent", 0), len(calls)):
+        calls[i]()
+        # Saved after every call, so a retry does not log twice what was delivered.
+        entry["sent"] = i + 1
+        _write_json(path, entry)
+    return run_id
+
+
+def _calls(client, run_id: str, entry: dict) -> list:
+    from mlflow.entities import Metric, Param
+
+    metrics = [Metric(key, value, timestamp, step) for key, value, timestamp, step in entry["metrics"]]
+    params = [Param(key, value) for key, value in entry["params"]]
+    # log_batch accepts at most 1000 metrics and 100 params per call.
+    calls = [partial(client.log_batch, run_id, metrics=metrics[start:start + 1000]) for start in range(0, len(metrics), 1000)]
+    calls += [partial(client.log_batch, run_id, params=params[start:start + 100]) for start in range(0, len(params), 100)]
+    calls += [partial(client.log_artifact, run_id, local_path, artifact_path) for local_path, artifact_path in entry["artifacts"]]
+    for local_dir, name, registered_model_name in entry["models"]:
+        calls.append(partial(client.log_artifacts, run_id, local_dir, name))
+        if registered_model_name:
+            calls.append(partial(_register_model, client, registered_model_name, f"runs:/{run_id}/{name}", run_id))
+    if entry["terminate"]:
+        calls.append(partial(client.set_terminated, run_id, entry["terminate"]))
+    return calls
+
+
+def _register_model(client, name: str, source: str, run_id: str):
+    from mlflow.exceptions import MlflowException
+
+    try:
+        client.create_registered_model(name)
+    except MlflowException as e:
+        if e.error_code != "RESOURCE_ALREADY_EXISTS":
+            raise
+    client.create_model_version(name, source, run_id)
+
+
+def _retryable(error: BaseException) -> bool:
+    """
+    Whether a delivery error is worth retrying: the server could not be reached, was overloaded or failed (5xx).
+    """
+    import requests
+    from mlflow.exceptions import MlflowException
+
+    statuses, seen = [], set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (ConnectionError, TimeoutError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(error, MlflowException):
+            statuses.append(error.get_http_status_code())
+        error = error.__cause__ or error.__context__
+    # Stores wrap rejections (4xx) in INTERNAL_ERROR, so any 4xx in the chain wins.
+    if any(400 <= status < 500 and status != 429 for status in statuses):
+        return False
+    return any(status >= 500 or status == 429 for status in statuses)
+
+
+def _set_aside(path: str, entry: dict, error: Exception) -> str:
+    failed_dir = os.path.join(os.path.dirname(path), AsyncMLflowLogger.FAILED_DIR)
+    os.makedirs(failed_dir, exist_ok=True)
+    entry["error"] = str(error)
+    failed_path = os.path.join(failed_dir, os.path.basename(path))
+    _write_json(failed_path, entry)
+    os.remove(path)
+    return failed_path
+
+
+if __name__ == "__main__":
+    pass
@@ -1,8 +1,10 @@
 import logging
 import pandas as pd
+import scipy.sparse as sp
 
 from abc import ABC, abstractmethod
-from sklearn.metrics import r2_score, mean_squared_error
+from src.sparse_design_matrix import SparseDesignMatrix, to_model_input
+from src.instrumentation import instrumented
 
 
 class ModelEvaluationStrategy(ABC):
@@ -30,13 +32,15 @@ class RegressionLinearEvaluationStrategy(ModelEvaluationStrategy):
             y_test (_type_): _description_
         """
         # Ensure the inputs are the correct type
-        if not isinstance(X_test, pd.DataFrame):
-            raise TypeError("X_test must be a pandas DataFrame.")
+        if not isinstance(X_test, (pd.DataFrame, SparseDesignMatrix)) and not sp.issparse(X_test):
+            raise TypeError("X_test must be a pandas DataFrame, a SparseDesignMatrix or a SciPy sparse matrix.")
         if not isinstance(y_test, pd.DataFrame):
             raise TypeError("y_test must be a pandas Series or DataFrame.")
         
+        from sklearn.metrics import r2_score, mean_squared_error
+
         logging.info("Predicting using the trained model.")
-        y_pred = model.predict(X_test)
+        y_pred = model.predict(to_model_input(X_test))
         
         logging.info("Calculating evaluation metrics.")
         r2 = r2_score(y_test, y_pred)
@@ -64,6 +68,7 @@ class ModelEvaluator:
         """
         self._strategy = strategy
     
+    @instrumented()
     def evaluate(self, model, X_test, y_test):
         """_summary_
 
@@ -0,0 +1,209 @@
+import time
+import logging
+import itertools
+import pandas as pd
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+from src.model_training import ModelTrainer, MODEL_STRATEGIES
+from src.model_evaluation import ModelEvaluator, RegressionLinearEvaluationStrategy
+
+
+class SharedArray:
+    """
+    Picklable handle to a NumPy array placed once in shared memory.
+
+    Pickling the handle only sends the segment name, shape and dtype, so
+    worker processes map the data instead of receiving a copy.
+    """
+    def __init__(self, array: np.ndarray):
+        """
+        Copies the array into a new shared memory segment.
+
+        Args:
+            array (np.ndarray): The array to share.
+        """
+        array = np.ascontiguousarray(array)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._owner = True
+        self.name = self._shm.name
+        self.shape = array.shape
+        self.dtype = array.dtype.str
+        np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)[...] = array
+
+    def __getstate__(self):
+        return {"name": self.name, "shape": self.shape, "dtype": self.dtype}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shm = None
+        self._owner = False
+
+    def open(self) -> np.ndarray:
+        """
+        Maps the shared segment as a read-only array without copying it.
+
+        Returns:
+            np.ndarray: A view of the shared data.
+        """
+        if self._shm is None:
+            # Pool workers share the creator's resource tracker, so attaching
+            # does not hand ownership of the segment to the worker.
+            self._shm = shared_memory.SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        array.flags.writeable = False
+        return array
+
+    def close(self):
+        """
+        Unmaps the segment, and frees it when called by the creating process.
+        """
+        if self._shm is None:
+            return
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+
+def expand_grid(grid: Dict[str, Dict[str, list]]) -> List[Tuple[str, dict]]:
+    """
+    Expands a grid of strategies and hyperparameter lists into candidates.
+
+    Args:
+        grid (Dict[str, Dict[str, list]]): Strategy name (see MODEL_STRATEGIES) to a mapping of hyperparameter to candidate values.
+
+    Returns:
+        List[Tuple[str, dict]]: One (strategy name, hyperparameters) pair per combination.
+    """
+    candidates = []
+    for name, params in grid.items():
+        if name not in MODEL_STRATEGIES:
+            raise ValueError(f"Unsupported training strategy in grid: {name}.")
+        keys = list(params)
+        for values in itertools.product(*(params[key] for key in keys)):
+            candidates.append((name, dict(zip(keys, values))))
+    return candidates
+
+
+def _evaluate_candidate(name: str, params: dict, data: Dict[str, SharedArray], columns: Dict[str, list]) -> dict:
+    """
+    Trains and evaluates one candidate on views of the shared split.
+    """
+    arrays = {key: handle.open() for key, handle in data.items()}
+    X_train = pd.DataFrame(arrays["X_train"], columns=columns["X"], copy=False)
+    X_test = pd.DataFrame(arrays["X_test"], columns=columns["X"], copy=False)
+    y_train = pd.DataFrame(arrays["y_train"], columns=columns["y"], copy=False)
+    y_test = pd.DataFrame(arrays["y_test"], columns=columns["y"], copy=False)
+
+    start = time.perf_counter()
+    model = ModelTrainer(MODEL_STRATEGIES[name](**params)).train(X_train, y_train)
+    results = {"fit_seconds": time.perf_counter() - start}
+    results.update(ModelEvaluator(RegressionLinearEvaluationStrategy()).evaluate(model, X_test, y_test))
+    return results
+
+
+def _fit_candidate(name: str, params: dict, data: Dict[str, SharedArray], columns: Dict[str, list]) -> dict:
+    """
+    Trains and evaluates one candidate on the shared split. Runs in a worker.
+
+    The shared segments are unmapped and the BLAS limits restored even when
+    the candidate fails, so a long-lived worker does not leak either.
+    """
+    row = {"strategy": name, "params": params}
+    try:
+        from threadpoolctl import threadpool_limits
+        # One BLAS thread per worker, the pool provides the parallelism.
+        limits = threadpool_limits(1)
+    except ImportError:
+        limits = None
+
+    try:
+        # The views into the segments live in the helper's frame, so they are
+        # released before the handles are closed.
+        row.update(_evaluate_candidate(name, params, data, columns))
+    except Exception as e:
+        row["error"] = repr(e)
+    finally:
+        for handle in data.values():
+            handle.close()
+        if limits is not None:
+            limits.restore_original_limits()
+    return row
+
+
+class ModelSweep:
+    """
+    Trains a grid of candidate models in parallel and ranks them.
+
+    The split is copied once into shared memory; every worker process maps
+    it read-only, so the cost of a candidate does not include shipping the
+    data.
+    """
+    def __init__(self, grid: Dict[str, Dict[str, list]], max_workers: int = None, metric: str = "R-Squared"):
+        """
+        Initializes the ModelSweep.
+
+        Args:
+            grid (Dict[str, Dict[str, list]]): Strategy name to hyperparameter lists, see expand_grid.
+            max_workers (int, optional): Number of worker processes. Defaults to None (one per CPU).
+            metric (str): Ranking metric, "R-Squared" (higher is better) or "Mean Squared Error". Defaults to "R-Squared".
+        """
+        if metric not in ("R-Squared", "Mean Squared Error"):
+            raise ValueError(f"Unsupported ranking metric: {metric}.")
+        self.candidates = expand_grid(grid)
+        self.max_workers = max_workers
+        self.metric = metric
+
+    def run(self, X_train: pd.DataFrame, X_test: pd.DataFrame, y_train: pd.DataFrame, y_test: pd.DataFrame) -> pd.DataFrame:
+        """
+        Trains and evaluates every candidate.
+
+        Args:
+            X_train (pd.DataFrame): Training features.
+            X_test (pd.DataFrame): Test features.
+            y_train (pd.DataFrame): Training targets.
+            y_test (pd.DataFrame): Test targets.
+
+        Returns:
+            pd.DataFrame: The leaderboard, best candidate first.
+        """
+        for label, frame in (("X_train", X_train), ("X_test", X_test), ("y_train", y_train), ("y_test", y_test)):
+            if not isinstance(frame, pd.DataFrame):
+                raise TypeError(f"{label} must be a pandas DataFrame.")
+
+        logging.info(f"Sweeping {len(self.candidates)} candidates with {self.max_workers or 'all'} workers.")
+        columns = {"X": list(X_train.columns), "y": list(y_train.columns)}
+        data = {
+            "X_train": SharedArray(X_train.to_numpy(dtype=np.float64)),
+            "X_test": SharedArray(X_test.to_numpy(dtype=np.float64)),
+            "y_train": SharedArray(y_train.to_numpy(dtype=np.float64)),
+            "y_test": SharedArray(y_test.to_numpy(dtype=np.float64)),
+        }
+        start = time.perf_counter()
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(_fit_candidate, name, params, data, columns) for name, params in self.candidates]
+                rows = [future.result() for future in futures]
+        finally:
+            for handle in data.values():
+                handle.close()
+        logging.info(f"Sweep completed in {time.perf_counter() - start:.2f}s.")
+
+        for row in rows:
+            if "error" in row:
+                logging.warning(f"Candidate {row['strategy']} {row['params']} failed: {row['error']}.")
+        leaderboard = pd.DataFrame(rows)
+        if self.metric in leaderboard:
+            ascending = self.metric == "Mean Squared Error"
+            leaderboard = leaderboard.sort_values(self.metric, ascending=ascending, na_position="last")
+        leaderboard = leaderboard.reset_index(drop=True)
+        leaderboard.index.name = "rank"
+        return leaderboard
+
+
+if __name__ == "__main__":
+    pass
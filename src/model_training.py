@@ -1,14 +1,22 @@
 import logging
+import importlib
 import pandas as pd
+import numpy as np
+import scipy.sparse as sp
 
 from abc import ABC, abstractmethod
-from sklearn.base import RegressorMixin
-from sklearn.linear_model import LinearRegression
+from typing import TYPE_CHECKING
+from src.sparse_design_matrix import SparseDesignMatrix, to_model_input
+from src.instrumentation import instrumented
+
+# scikit-learn is imported when a model is trained, not when the registry is imported.
+if TYPE_CHECKING:
+    from sklearn.base import RegressorMixin
 
 
 class ModelTrainingStrategy(ABC):
     @abstractmethod
-    def train(self, X_train: pd.DataFrame, y_train) -> RegressorMixin:
+    def train(self, X_train: pd.DataFrame, y_train) -> "RegressorMixin":
         """_summary_
 
         Args:
@@ -29,21 +37,277 @@ class LinearRegressionStrategy(ModelTrainingStrategy):
             X_train (_type_): _description_
             y_train (_type_): _description_
         """
-        # ensure the inputs are the correct type
-        if not isinstance(X_train, pd.DataFrame):
-            raise TypeError("X_train must be a pandas DataFrame.")
-        if not isinstance(y_train, pd.DataFrame):
-            raise TypeError("y_train must be a pandas Series or DataFrame.")
+        from sklearn.linear_model import LinearRegression
+
+        _check_inputs(X_train, y_train)
         
         logging.info("Initializing linear regression model...")
         model = LinearRegression()
         
         logging.info("Training linear regression model.")
-        model.fit(X_train, y_train)
+        model.fit(to_model_input(X_train), y_train)
+        
+        logging.info("Training model completed.")
+        return model
+
+
+class SklearnRegressionStrategy(ModelTrainingStrategy):
+    """
+    Trains the scikit-learn regressor set in the estimator class attribute.
+
+    The estimator is named as "module.Class" and imported on first training.
+    """
+    estimator = None
+
+    def __init__(self, **params):
+        """
+        Initializes the strategy with the estimator's hyperparameters.
+
+        Args:
+            **params: Keyword arguments of the estimator.
+        """
+        self.params = params
+
+    def train(self, X_train, y_train):
+        """
+        Fits the estimator on the training data.
+
+        Args:
+            X_train: A DataFrame, a SparseDesignMatrix or a SciPy sparse matrix.
+            y_train (pd.DataFrame): The targets.
+
+        Returns:
+            RegressorMixin: The fitted estimator.
+        """
+        _check_inputs(X_train, y_train)
+        
+        module, name = self.estimator.rsplit(".", 1)
+        estimator = getattr(importlib.import_module(module), name)
+        logging.info(f"Training {name} with {self.params}.")
+        model = estimator(**self.params)
+        model.fit(to_model_input(X_train), y_train)
         
         logging.info("Training model completed.")
         return model
 
+
+class RidgeRegressionStrategy(SklearnRegressionStrategy):
+    estimator = "sklearn.linear_model.Ridge"
+
+
+class LassoRegressionStrategy(SklearnRegressionStrategy):
+    estimator = "sklearn.linear_model.Lasso"
+
+
+class ElasticNetRegressionStrategy(SklearnRegressionStrategy):
+    estimator = "sklearn.linear_model.ElasticNet"
+
+
+class RandomForestRegressionStrategy(SklearnRegressionStrategy):
+    estimator = "sklearn.ensemble.RandomForestRegressor"
+
+
+class LinearSufficientStatistics:
+    """
+    Mergeable sufficient statistics of a multi-target linear regression.
+
+    Keeps the row count, the feature and target means and the centered
+    cross-products X'X and X'Y. Chunks are folded in with the parallel
+    co-moment update (Chan et al.), which stays numerically stable where raw
+    sums of squares would not, and states built on separate shards merge
+    exactly. Memory is O(p^2 + p*t) whatever the number of rows.
+    """
+    def __init__(self):
+        self.n = 0
+        self.mean_x = None
+        self.mean_y = None
+        self.xx = None
+        self.xy = None
+
+    def update(self, X: np.ndarray, y: np.ndarray) -> "LinearSufficientStatistics":
+        """
+        Folds a chunk of rows into the statistics.
+
+        Args:
+            X (np.ndarray): (n_rows, n_features) chunk of features.
+            y (np.ndarray): (n_rows, n_targets) chunk of targets.
+
+        Returns:
+            LinearSufficientStatistics: The updated statistics.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).reshape(len(X), -1)
+        if len(X) == 0:
+            return self
+        chunk = LinearSufficientStatistics()
+        chunk.n = len(X)
+        chunk.mean_x = X.mean(axis=0)
+        chunk.mean_y = y.mean(axis=0)
+        Xc = X - chunk.mean_x
+        chunk.xx = Xc.T @ Xc
+        chunk.xy = Xc.T @ (y - chunk.mean_y)
+        return self.merge(chunk)
+
+    def merge(self, other: "LinearSufficientStatistics") -> "LinearSufficientStatistics":
+        """
+        Merges the statistics of another shard into this one.
+
+        Args:
+            other (LinearSufficientStatistics): Statistics over the same features and targets.
+
+        Returns:
+            LinearSufficientStatistics: The merged statistics.
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n = other.n
+            self.mean_x, self.mean_y = other.mean_x.copy(), other.mean_y.copy()
+            self.xx, self.xy = other.xx.copy(), other.xy.copy()
+            return self
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.xx = self.xx + other.xx + weight * np.outer(dx, dx)
+        self.xy = self.xy + other.xy + weight * np.outer(dx, dy)
+        self.mean_x = self.mean_x + dx * other.n / n
+        self.mean_y = self.mean_y + dy * other.n / n
+        self.n = n
+        return self
+
+    def solve(self, alpha: float = 0.0):
+        """
+        Solves the normal equations for all targets at once.
+
+        Args:
+            alpha (float): Ridge penalty on the coefficients, the intercept is not penalized. Defaults to 0.0 (OLS).
+
+        Returns:
+            tuple: (n_targets, n_features) coefficients and (n_targets,) intercepts.
+        """
+        if self.n == 0:
+            raise ValueError("Cannot solve a linear regression without data.")
+        gram = self.xx + alpha * np.eye(len(self.xx))
+        try:
+            coef = np.linalg.solve(gram, self.xy)
+        except np.linalg.LinAlgError:
+            # Rank deficient features: fall back to the minimum-norm solution, like LinearRegression.
+            coef = np.linalg.lstsq(gram, self.xy, rcond=None)[0]
+        coef = coef.T
+        intercept = self.mean_y - coef @ self.mean_x
+        return coef, intercept
+
+
+class StreamingLinearRegressionStrategy(ModelTrainingStrategy):
+    def __init__(self, alpha: float = 0.0):
+        """
+        Linear (or ridge) regression trained from sufficient statistics.
+
+        Feed chunks with partial_fit, merge strategies updated on other
+        shards with merge, then build the model with to_model. The result
+        is the exact OLS (alpha=0) or ridge solution.
+
+        Args:
+            alpha (float): Ridge penalty. Defaults to 0.0.
+        """
+        self.alpha = alpha
+        self.stats = LinearSufficientStatistics()
+        self.feature_names = None
+        self.target_names = None
+
+    def partial_fit(self, X_chunk: pd.DataFrame, y_chunk: pd.DataFrame) -> "StreamingLinearRegressionStrategy":
+        """
+        Folds a chunk into the sufficient statistics.
+
+        Args:
+            X_chunk (pd.DataFrame): A chunk of features.
+            y_chunk (pd.DataFrame): The matching chunk of targets.
+
+        Returns:
+            StreamingLinearRegressionStrategy: The updated strategy.
+        """
+        _check_inputs(X_chunk, y_chunk)
+        if isinstance(X_chunk, SparseDesignMatrix) or sp.issparse(X_chunk):
+            raise TypeError("StreamingLinearRegressionStrategy needs dense pandas DataFrames.")
+        if self.feature_names is None:
+            self.feature_names = list(X_chunk.columns)
+            self.target_names = list(y_chunk.columns)
+        self.stats.update(X_chunk[self.feature_names].to_numpy(dtype=np.float64), y_chunk[self.target_names].to_numpy(dtype=np.float64))
+        return self
+
+    def merge(self, other: "StreamingLinearRegressionStrategy") -> "StreamingLinearRegressionStrategy":
+        """
+        Merges the statistics of a strategy updated on another shard.
+
+        Args:
+            other (StreamingLinearRegressionStrategy): Strategy updated on the same columns.
+
+        Returns:
+            StreamingLinearRegressionStrategy: The merged strategy.
+        """
+        if other.feature_names is None:
+            return self
+        if self.feature_names is None:
+            self.feature_names, self.target_names = other.feature_names, other.target_names
+        elif (self.feature_names, self.target_names) != (other.feature_names, other.target_names):
+            raise ValueError("Cannot merge statistics computed over different columns.")
+        self.stats.merge(other.stats)
+        return self
+
+    def to_model(self) -> "RegressorMixin":
+        """
+        Solves the regression and wraps it in a fitted scikit-learn estimator.
+
+        Returns:
+            RegressorMixin: A LinearRegression (alpha=0) or Ridge with the solved coefficients.
+        """
+        from sklearn.linear_model import LinearRegression, Ridge
+
+        logging.info(f"Solving linear regression from sufficient statistics of {self.stats.n} rows.")
+        coef, intercept = self.stats.solve(self.alpha)
+        model = Ridge(alpha=self.alpha) if self.alpha else LinearRegression()
+        model.coef_ = coef
+        model.intercept_ = intercept
+        model.n_features_in_ = len(self.feature_names)
+        model.feature_names_in_ = np.asarray(self.feature_names, dtype=object)
+        return model
+
+    def train(self, X_train: pd.DataFrame, y_train: pd.DataFrame):
+        """
+        Trains on an in-memory split, e.g. through ModelTrainer.
+
+        Args:
+            X_train (pd.DataFrame): Training features.
+            y_train (pd.DataFrame): Training targets.
+        """
+        self.stats = LinearSufficientStatistics()
+        self.feature_names = None
+        self.partial_fit(X_train, y_train)
+        model = self.to_model()
+        logging.info("Training model completed.")
+        return model
+
+
+# Training strategies by name, used by the model sweep.
+MODEL_STRATEGIES = {
+    "linear_regression": LinearRegressionStrategy,
+    "ridge": RidgeRegressionStrategy,
+    "lasso": LassoRegressionStrategy,
+    "elastic_net": ElasticNetRegressionStrategy,
+    "random_forest": RandomForestRegressionStrategy,
+    "streaming_linear_regression": StreamingLinearRegressionStrategy,
+}
+
+
+def _check_inputs(X_train, y_train):
+    # ensure the inputs are the correct type
+    if not isinstance(X_train, (pd.DataFrame, SparseDesignMatrix)) and not sp.issparse(X_train):
+        raise TypeError("X_train must be a pandas DataFrame, a SparseDesignMatrix or a SciPy sparse matrix.")
+    if not isinstance(y_train, pd.DataFrame):
+        raise TypeError("y_train must be a pandas Series or DataFrame.")
+
+
 class ModelTrainer:
     def __init__(self, strategy: ModelTrainingStrategy):
         """_summary_
@@ -61,6 +325,7 @@ class ModelTrainer:
         """
         self._strategy = strategy
     
+    @instrumented()
     def train(self, X_train, y_train):
         """_summary_
 
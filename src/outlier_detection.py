@@ -1,24 +1,67 @@
+import os
+import pickle
 import logging
 import pandas as pd
 import numpy as np
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from src.data_schema import restore_compact_dtypes
+from src.sharded_execution import ShardedExecutor
+from src.instrumentation import instrumented
 
 
 class OutlierDetectionStrategy(ABC):
     @abstractmethod
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+    def detect(self, df: pd.DataFrame, stats=None) -> pd.DataFrame:
         """_summary_
 
         Args:
             df (pd.DataFrame): _description_
-            features (str): _description_
+            stats (ColumnStatistics, optional): Statistics of the whole data when df is one row shard. Defaults to None (df's own).
 
         Returns:
             pd.DataFrame: _description_
         """
         pass
 
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        """
+        Returns the columns whose statistics over the whole data detect needs when run on row shards.
+
+        Args:
+            df (pd.DataFrame): The whole data.
+
+        Returns:
+            list: The columns, empty when no statistics are needed, None when the strategy cannot run on shards.
+        """
+        return None
+
+    def shard_quantiles(self) -> list:
+        """
+        Returns the quantiles detect reads from the statistics of the shard columns.
+
+        Returns:
+            list: Quantiles in [0, 1], made exact before the shards are detected.
+        """
+        return []
+
+    def capping_bounds(self, df: pd.DataFrame, lower: float = 0.01, upper: float = 0.99, stats=None):
+        """
+        Returns the per-column bounds used to cap outliers.
+
+        Args:
+            df (pd.DataFrame): The data to be capped.
+            lower (float): Lower quantile. Defaults to 0.01.
+            upper (float): Upper quantile. Defaults to 0.99.
+            stats (ColumnStatistics, optional): Statistics of the whole data when df is one row shard. Defaults to None (df's own).
+
+        Returns:
+            tuple: The lower and upper bound of each column.
+        """
+        stats = df if stats is None else stats
+        return stats.quantile(lower), stats.quantile(upper)
+
 
 class ZScoreOutlierDetectionStrategy(OutlierDetectionStrategy):
     def __init__(self, threshold=None):
@@ -29,49 +72,586 @@ class ZScoreOutlierDetectionStrategy(OutlierDetectionStrategy):
         """
         self.threshold = threshold
     
-    def detect(self, df: pd.DataFrame):
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        return list(df.columns)
+
+    def detect(self, df: pd.DataFrame, stats=None):
         """_summary_
 
         Args:
             df (pd.DataFrame): _description_
+            stats (ColumnStatistics, optional): Statistics of the whole data when df is one row shard. Defaults to None (df's own).
 
         Returns:
             _type_: _description_
         """
         logging.info("Detecting outlier using Z-Score method.")
-        z_scores = np.abs((df - df.mean()) / df.std())
+        stats = df if stats is None else stats
+        z_scores = np.abs((df - stats.mean()) / stats.std())
         outliers = z_scores > self.threshold
         logging.info(f"Outlier detected with Z-Score threshold: {self.threshold}")
         return outliers
 
 
 class IQROutlierDetectionStrategy(OutlierDetectionStrategy):
-    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        return list(df.columns)
+
+    def shard_quantiles(self) -> list:
+        return [0.25, 0.75]
+
+    def detect(self, df: pd.DataFrame, stats=None) -> pd.DataFrame:
         """_summary_
 
         Args:
             df (pd.DataFrame): _description_
+            stats (ColumnStatistics, optional): Statistics of the whole data when df is one row shard. Defaults to None (df's own).
 
         Returns:
             pd.DataFrame: _description_
         """
         logging.info("Detecting outlier using IQR method.")
-        lower = df.quantile(0.25)
-        upper = df.quantile(0.75)
+        stats = df if stats is None else stats
+        lower = stats.quantile(0.25)
+        upper = stats.quantile(0.75)
         IQR = upper - lower
         outlier = (df > (IQR + 1.5 * upper)) | (df < (IQR - 1.5 * lower))
         logging.info("Outlier detected with IQR method.")
         return outlier.any().any()
 
 
+class RunningMoments:
+    """
+    Mergeable per-column count, mean and variance of a stream of chunks.
+
+    Each chunk is reduced with vectorized NumPy and folded into the running
+    state with the parallel form of Welford's algorithm (Chan et al.), so
+    states computed on separate shards can be merged exactly.
+    """
+    def __init__(self, columns=None):
+        """
+        Initializes the RunningMoments.
+
+        Args:
+            columns (list, optional): Columns to track. Defaults to None (taken from the first chunk).
+        """
+        self.columns = None if columns is None else pd.Index(columns)
+        self.count = None
+        self.mean = None
+        self.m2 = None
+
+    def update(self, df: pd.DataFrame) -> "RunningMoments":
+        """
+        Folds a chunk into the running moments.
+
+        Args:
+            df (pd.DataFrame): The next chunk of numeric data.
+
+        Returns:
+            RunningMoments: The updated moments.
+        """
+        if self.columns is None:
+            self.columns = df.columns
+        values = df[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        count = (~np.isnan(values)).sum(axis=0).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(values, axis=0) / count
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+        return self._combine(count, np.nan_to_num(mean), m2)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Merges the moments of another shard into this one.
+
+        Args:
+            other (RunningMoments): Moments computed over the same columns.
+
+        Returns:
+            RunningMoments: The merged moments.
+        """
+        if other.count is None:
+            return self
+        if self.columns is None:
+            self.columns = other.columns
+        elif not self.columns.equals(other.columns):
+            raise ValueError("Cannot merge moments computed over different columns.")
+        return self._combine(other.count, other.mean, other.m2)
+
+    def _combine(self, count, mean, m2) -> "RunningMoments":
+        if self.count is None:
+            self.count, self.mean, self.m2 = count.copy(), mean.copy(), m2.copy()
+            return self
+        total = self.count + count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = mean - self.mean
+            ratio = np.where(total > 0, count / total, 0.0)
+            self.mean = self.mean + delta * ratio
+            self.m2 = self.m2 + m2 + delta ** 2 * self.count * ratio
+        self.count = total
+        return self
+
+    def std(self, ddof: int = 1) -> pd.Series:
+        """
+        Returns the per-column standard deviation.
+
+        Args:
+            ddof (int): Delta degrees of freedom, 1 matches pandas' DataFrame.std. Defaults to 1.
+
+        Returns:
+            pd.Series: The standard deviation of each column.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+        return pd.Series(np.sqrt(var), index=self.columns)
+
+    def means(self) -> pd.Series:
+        """
+        Returns the per-column mean.
+
+        Returns:
+            pd.Series: The mean of each column.
+        """
+        return pd.Series(np.where(self.count > 0, self.mean, np.nan), index=self.columns)
+
+
+class QuantileSketch:
+    """
+    Bounded-memory, mergeable quantile sketch of one numeric column.
+
+    A KLL-style stack of compactors: level h holds at most k items of weight
+    2**h. A full level is sorted and every other item, starting at a random
+    offset, is promoted to the next level. Memory is O(k * log2(n / k)).
+
+    Error bound: for n values the rank of any returned quantile is off by at
+    most 2 * log2(n / k) / k * n in the worst case; the random offsets make
+    the errors cancel, so in practice the normalized rank error stays around
+    2 / k (about 0.1% for the default k=2048). Until the first compaction the
+    sketch holds every value and quantiles are exact.
+    """
+    def __init__(self, k: int = 2048, seed: int = None):
+        """
+        Initializes the QuantileSketch.
+
+        Args:
+            k (int): Capacity of each compactor level, trades memory for accuracy. Defaults to 2048.
+            seed (int, optional): Seed of the random compaction offsets. Defaults to None.
+        """
+        if k < 2:
+            raise ValueError(f"k must be at least 2, got {k}.")
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values) -> "QuantileSketch":
+        """
+        Adds values to the sketch, NaNs are ignored.
+
+        Args:
+            values (array-like): The next chunk of values.
+
+        Returns:
+            QuantileSketch: The updated sketch.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compact()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merges the sketch of another shard into this one.
+
+        Args:
+            other (QuantileSketch): Sketch built with the same k.
+
+        Returns:
+            QuantileSketch: The merged sketch.
+        """
+        if other.k != self.k:
+            raise ValueError("Cannot merge quantile sketches with different k.")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.count += other.count
+        self._compact()
+        return self
+
+    def quantile(self, q):
+        """
+        Returns the approximate q-quantile(s).
+
+        Args:
+            q (float or array-like): Quantile(s) in [0, 1].
+
+        Returns:
+            float or np.ndarray: The quantile estimate(s), NaN for an empty sketch.
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)[()]
+        if len(self.levels) == 1:
+            return np.quantile(self.levels[0], q)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items_h), 2.0 ** h) for h, items_h in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        ranks = np.asarray(q, dtype=np.float64) * (cumulative[-1] - 1)
+        positions = np.searchsorted(cumulative, ranks + 1, side="left")
+        return items[np.minimum(positions, len(items) - 1)][()]
+
+    def _compact(self):
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) > self.k:
+                items = np.sort(items)
+                # An odd item stays behind so that no weight is lost.
+                keep = items[:1] if len(items) % 2 else items[:0]
+                items = items[len(keep):]
+                promoted = items[self._rng.integers(2)::2]
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h] = keep
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_rng"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rng = np.random.default_rng()
+
+
+class StreamingZScoreOutlierDetectionStrategy(OutlierDetectionStrategy):
+    def __init__(self, threshold=3):
+        """
+        Z-Score outlier detection over data that arrives in chunks.
+
+        Call update() for every chunk (or merge() the states of several
+        shards) before detecting; detect() on a strategy that has seen no
+        data fits it on the given frame first.
+
+        Args:
+            threshold (float): Absolute Z-Score above which a value is an outlier. Defaults to 3.
+        """
+        self.threshold = threshold
+        self.moments = RunningMoments()
+
+    def update(self, df: pd.DataFrame) -> "StreamingZScoreOutlierDetectionStrategy":
+        """
+        Folds a chunk into the running mean and standard deviation.
+
+        Args:
+            df (pd.DataFrame): The next chunk of numeric data.
+
+        Returns:
+            StreamingZScoreOutlierDetectionStrategy: The updated strategy.
+        """
+        self.moments.update(df)
+        return self
+
+    def merge(self, other: "StreamingZScoreOutlierDetectionStrategy") -> "StreamingZScoreOutlierDetectionStrategy":
+        """
+        Merges the state of a strategy updated on another shard.
+
+        Args:
+            other (StreamingZScoreOutlierDetectionStrategy): Strategy updated on the same columns.
+
+        Returns:
+            StreamingZScoreOutlierDetectionStrategy: The merged strategy.
+        """
+        self.moments.merge(other.moments)
+        return self
+
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        # Shards are detected with the fitted moments; fitting on a shard would only see that shard.
+        return [] if self.moments.count is not None else None
+
+    def detect(self, df: pd.DataFrame, stats=None) -> pd.DataFrame:
+        """
+        Flags the values of a chunk whose Z-Score exceeds the threshold.
+
+        Args:
+            df (pd.DataFrame): A chunk of numeric data.
+            stats (ColumnStatistics, optional): Unused, the strategy detects with its own running moments. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Boolean mask of the outliers.
+        """
+        if self.moments.count is None:
+            self.update(df)
+        logging.info("Detecting outlier using streaming Z-Score method.")
+        columns = self.moments.columns
+        z_scores = np.abs((df[columns] - self.moments.means()) / self.moments.std())
+        outliers = z_scores > self.threshold
+        logging.info(f"Outlier detected with Z-Score threshold: {self.threshold}")
+        return outliers
+
+
+class StreamingIQROutlierDetectionStrategy(OutlierDetectionStrategy):
+    def __init__(self, multiplier=1.5, k=2048, seed=None):
+        """
+        IQR outlier detection over data that arrives in chunks.
+
+        Quartiles come from one QuantileSketch per column, see its docstring
+        for the error bound. Values outside [Q1 - multiplier * IQR,
+        Q3 + multiplier * IQR] are flagged per cell.
+
+        Args:
+            multiplier (float): Multiplier of the IQR fences. Defaults to 1.5.
+            k (int): Capacity of the quantile sketches. Defaults to 2048.
+            seed (int, optional): Seed of the sketches' random compaction. Defaults to None.
+        """
+        self.multiplier = multiplier
+        self.k = k
+        self.seed = seed
+        self.sketches = {}
+
+    def update(self, df: pd.DataFrame) -> "StreamingIQROutlierDetectionStrategy":
+        """
+        Adds a chunk to the per-column quantile sketches.
+
+        Args:
+            df (pd.DataFrame): The next chunk of numeric data.
+
+        Returns:
+            StreamingIQROutlierDetectionStrategy: The updated strategy.
+        """
+        for column in df.columns:
+            if column not in self.sketches:
+                self.sketches[column] = QuantileSketch(k=self.k, seed=self.seed)
+            self.sketches[column].update(df[column].to_numpy(dtype=np.float64, na_value=np.nan))
+        return self
+
+    def merge(self, other: "StreamingIQROutlierDetectionStrategy") -> "StreamingIQROutlierDetectionStrategy":
+        """
+        Merges the sketches of a strategy updated on another shard.
+
+        Args:
+            other (StreamingIQROutlierDetectionStrategy): Strategy updated with the same k.
+
+        Returns:
+            StreamingIQROutlierDetectionStrategy: The merged strategy.
+        """
+        for column, sketch in other.sketches.items():
+            if column not in self.sketches:
+                self.sketches[column] = QuantileSketch(k=self.k, seed=self.seed)
+            self.sketches[column].merge(sketch)
+        return self
+
+    def quantile(self, q: float) -> pd.Series:
+        """
+        Returns the approximate q-quantile of every tracked column.
+
+        Args:
+            q (float): Quantile in [0, 1].
+
+        Returns:
+            pd.Series: The quantile estimate of each column.
+        """
+        return pd.Series({column: sketch.quantile(q) for column, sketch in self.sketches.items()}, dtype=np.float64)
+
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        # Shards are detected with the fitted sketches; fitting on a shard would only see that shard.
+        return [] if self.sketches else None
+
+    def detect(self, df: pd.DataFrame, stats=None) -> pd.DataFrame:
+        """
+        Flags the values of a chunk outside the IQR fences.
+
+        Args:
+            df (pd.DataFrame): A chunk of numeric data.
+            stats (ColumnStatistics, optional): Unused, the strategy detects with its own sketches. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Boolean mask of the outliers.
+        """
+        if not self.sketches:
+            self.update(df)
+        logging.info("Detecting outlier using streaming IQR method.")
+        lower = self.quantile(0.25)
+        upper = self.quantile(0.75)
+        IQR = upper - lower
+        columns = list(self.sketches)
+        outlier = (df[columns] > (upper + self.multiplier * IQR)) | (df[columns] < (lower - self.multiplier * IQR))
+        logging.info("Outlier detected with streaming IQR method.")
+        return outlier
+
+    def capping_bounds(self, df: pd.DataFrame, lower: float = 0.01, upper: float = 0.99, stats=None):
+        """
+        Returns the capping bounds from the sketches instead of the chunk.
+
+        Args:
+            df (pd.DataFrame): A chunk of numeric data, used only if no data was seen yet.
+            lower (float): Lower quantile. Defaults to 0.01.
+            upper (float): Upper quantile. Defaults to 0.99.
+            stats (ColumnStatistics, optional): Unused, the bounds come from the sketches. Defaults to None.
+
+        Returns:
+            tuple: The lower and upper bound of each column.
+        """
+        if not self.sketches:
+            self.update(df)
+        return self.quantile(lower), self.quantile(upper)
+
+
+class IsolationForestOutlierDetectionStrategy(OutlierDetectionStrategy):
+    def __init__(self, n_estimators: int = 100, max_samples=256, contamination="auto", max_fit_rows: int = 100_000, batch_size: int = 50_000, n_jobs: int = None, seed: int = 42):
+        """
+        Multivariate outlier detection with an Isolation Forest.
+
+        Rows are flagged as a whole, from all their columns at once, so a
+        row can be an outlier without any of its values being one on its
+        own. The forest is fitted once, on a random sample of at most
+        max_fit_rows rows, and kept: later detect() calls, on training data
+        or on inference traffic, only score. Scoring runs in batches of
+        batch_size rows on a thread pool (the tree traversals release the
+        GIL), so memory stays bounded by the batches in flight. Save the
+        fitted strategy with save() to reuse it in another process.
+
+        Args:
+            n_estimators (int): Number of isolation trees. Defaults to 100.
+            max_samples (int or float): Rows drawn to build each tree. Defaults to 256.
+            contamination (str or float): Expected share of outliers, or "auto" for the threshold of the original paper. Defaults to "auto".
+            max_fit_rows (int): Rows sampled to fit the forest. Defaults to 100_000.
+            batch_size (int): Rows scored at a time. Defaults to 50_000.
+            n_jobs (int, optional): Number of scoring threads. Defaults to None (one per CPU).
+            seed (int): Seed of the sample and the forest. Defaults to 42.
+        """
+        self.n_estimators = n_estimators
+        self.max_samples = max_samples
+        self.contamination = contamination
+        self.max_fit_rows = max_fit_rows
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.seed = seed
+        self.columns = None
+        self.forest = None
+
+    def fit(self, df: pd.DataFrame) -> "IsolationForestOutlierDetectionStrategy":
+        """
+        Fits the forest on a sample of the numeric columns.
+
+        Args:
+            df (pd.DataFrame): The reference data.
+
+        Returns:
+            IsolationForestOutlierDetectionStrategy: The fitted strategy.
+        """
+        from sklearn.ensemble import IsolationForest
+
+        self.columns = list(df.select_dtypes(include=np.number).columns)
+        sample = df[self.columns]
+        if len(sample) > self.max_fit_rows:
+            sample = sample.sample(n=self.max_fit_rows, random_state=self.seed)
+        logging.info(f"Fitting Isolation Forest on {len(sample)} of {len(df)} rows.")
+        self.forest = IsolationForest(n_estimators=self.n_estimators, max_samples=self.max_samples, contamination=self.contamination, random_state=self.seed)
+        self.forest.fit(sample.to_numpy(dtype=np.float32))
+        return self
+
+    def shard_columns(self, df: pd.DataFrame) -> list:
+        # Scoring already runs on threads; worker processes would each unpickle the forest.
+        return None
+
+    def score(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Returns the anomaly score of every row, lower is more abnormal.
+
+        Args:
+            df (pd.DataFrame): Data with the columns the forest was fitted on.
+
+        Returns:
+            pd.Series: The score of each row, the forest's decision function (negative for outliers).
+        """
+        if self.forest is None:
+            self.fit(df)
+        values = df[self.columns].to_numpy(dtype=np.float32)
+        batches = [values[start:start + self.batch_size] for start in range(0, len(values), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=self.n_jobs or os.cpu_count()) as pool:
+            scores = list(pool.map(self.forest.decision_function, batches))
+        return pd.Series(np.concatenate(scores) if scores else np.empty(0), index=df.index, name="anomaly_score")
+
+    def detect(self, df: pd.DataFrame, stats=None) -> pd.Series:
+        """
+        Flags the rows the forest isolates faster than the threshold.
+
+        Args:
+            df (pd.DataFrame): Numeric data; the forest is fitted on it first when it is not fitted yet.
+            stats (ColumnStatistics, optional): Unused, the strategy detects with its fitted forest. Defaults to None.
+
+        Returns:
+            pd.Series: Boolean mask of the outlier rows.
+        """
+        logging.info("Detecting outlier using Isolation Forest method.")
+        outliers = self.score(df) < 0
+        logging.info(f"Outlier detected with Isolation Forest: {int(outliers.sum())} of {len(df)} rows.")
+        return outliers.rename("outlier")
+
+    def save(self, path: str):
+        """
+        Saves the fitted strategy.
+
+        Args:
+            path (str): Destination file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logging.info(f"Saved Isolation Forest outlier detector to {path}.")
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "IsolationForestOutlierDetectionStrategy":
+        """
+        Loads a saved strategy, or creates an unfitted one when there is none.
+
+        Args:
+            path (str): File written by save.
+            **kwargs: Arguments of a new strategy.
+
+        Returns:
+            IsolationForestOutlierDetectionStrategy: The strategy.
+        """
+        if not os.path.exists(path):
+            return cls(**kwargs)
+        with open(path, "rb") as f:
+            strategy = pickle.load(f)
+        logging.info(f"Loaded Isolation Forest outlier detector from {path}.")
+        return strategy
+
+
+def _outlier_rows(outlier) -> pd.Series:
+    # Multivariate strategies flag rows, the others flag values.
+    return outlier if isinstance(outlier, pd.Series) else outlier.any(axis=1)
+
+
+def _cap(df: pd.DataFrame, lower: pd.Series, upper: pd.Series) -> pd.DataFrame:
+    return restore_compact_dtypes(df.clip(lower=lower, upper=upper, axis=1), df)
+
+
+def _remove(df: pd.DataFrame, strategy: OutlierDetectionStrategy, stats) -> pd.DataFrame:
+    outlier = strategy.detect(df, stats)
+    return df[~_outlier_rows(outlier)]
+
+
 class OutlierDetector:
-    def __init__(self, strategy: OutlierDetectionStrategy):
+    def __init__(self, strategy: OutlierDetectionStrategy, executor: ShardedExecutor = None):
         """_summary_
 
         Args:
             strategy (OutlierDetectionStrategy): _description_
+            executor (ShardedExecutor, optional): Runs the strategy on row shards in parallel. Defaults to None (single process).
         """
         self._strategy = strategy
+        self._executor = executor
     
     def set_strategy(self, strategy: OutlierDetectionStrategy):
         """_summary_
@@ -82,6 +662,7 @@ class OutlierDetector:
         logging.info("Switching outlier detection strategy.")
         self._strategy = strategy
     
+    @instrumented()
     def detect(self, df: pd.DataFrame) -> pd.DataFrame:
         """_summary_
 
@@ -91,26 +672,50 @@ class OutlierDetector:
         Returns:
             pd.DataFrame: _description_
         """
-        logging.info("Detecting outlier with {self._strategy}.")
-        return self._strategy.detect(df)
+        logging.info(f"Detecting outlier with {self._strategy}.")
+        columns = self._strategy.shard_columns(df) if self._executor is not None else None
+        if columns is None:
+            return self._strategy.detect(df)
+        stats = self._executor.statistics(df, columns, quantiles=self._strategy.shard_quantiles()) if columns else None
+        outliers = self._executor.map(self._strategy.detect, df, stats=stats)
+        # The IQR strategy answers whether the data has any outlier, the others flag every value.
+        return pd.concat(outliers) if isinstance(outliers[0], pd.DataFrame) else np.any(outliers)
     
-    def handle(self, df: pd.DataFrame, method="remove", **kwargs) -> pd.DataFrame:
-        """_summary_
+    @instrumented()
+    def handle(self, df: pd.DataFrame, method="remove", outliers=None, **kwargs) -> pd.DataFrame:
+        """
+        Removes or caps the outliers of the data.
+
+        Capping clips every value to the 1% and 99% quantiles of its column
+        over all rows. With a multivariate strategy only the flagged rows
+        are capped, to the quantiles of the inlier rows, so the outliers do
+        not widen their own bounds.
 
         Args:
             df (pd.DataFrame): _description_
             method (str, optional): _description_. Defaults to "remove".
+            outliers (optional): The result of detect on df, reused instead of detecting again. Defaults to None.
 
         Returns:
             pd.DataFrame: _description_
         """
-        outlier = self._strategy.detect(df)
+        columns = self._strategy.shard_columns(df) if self._executor is not None else None
+        if columns is not None and method in ("remove", "cap"):
+            return self._handle_sharded(df, method, columns, outliers)
+
+        outlier = self._strategy.detect(df) if outliers is None else outliers
         if method == "remove":
             logging.info("Removing outliers from dataset.")
-            df_cleaned = df[(~outlier).all(axis=1)]
+            df_cleaned = df[~_outlier_rows(outlier)]
         elif method == "cap":
             logging.info("Capping outliers in the dataset.")
-            df_cleaned = df.clip(lower=df.quantile(0.01), upper=df.quantile(0.99), axis=1)
+            if isinstance(outlier, pd.Series):
+                # Only the rows flagged by a multivariate strategy are capped, to the bounds of the inliers.
+                lower, upper = self._strategy.capping_bounds(df[~outlier] if not outlier.all() else df)
+                df_cleaned = _cap(df, lower, upper).where(np.broadcast_to(outlier.to_numpy()[:, None], df.shape), df)
+            else:
+                lower, upper = self._strategy.capping_bounds(df)
+                df_cleaned = _cap(df, lower, upper)
         else:
             logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
             return df   
@@ -118,6 +723,24 @@ class OutlierDetector:
         logging.info("Outlier handling completed.")
         return df_cleaned
 
+    def _handle_sharded(self, df: pd.DataFrame, method: str, columns: list, outliers=None) -> pd.DataFrame:
+        # Statistics and capping bounds of the whole data, then every shard in parallel.
+        if method == "remove":
+            logging.info("Removing outliers from dataset.")
+            if outliers is not None:
+                df_cleaned = df[~_outlier_rows(outliers)]
+            else:
+                stats = self._executor.statistics(df, columns, quantiles=self._strategy.shard_quantiles()) if columns else None
+                df_cleaned = self._executor.apply(_remove, df, self._strategy, stats)
+        else:
+            logging.info("Capping outliers in the dataset.")
+            # The default quantiles of capping_bounds.
+            stats = self._executor.statistics(df, columns, quantiles=[0.01, 0.99]) if columns else None
+            lower, upper = self._strategy.capping_bounds(df, stats=stats)
+            df_cleaned = self._executor.apply(_cap, df, lower, upper)
+        logging.info("Outlier handling completed.")
+        return df_cleaned
+
 
 if __name__ == "__main__":
     pass
\ No newline at end of file
@@ -0,0 +1,470 @@
+import os
+import logging
+import functools
+import multiprocessing
+import pandas as pd
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List
+
+
+class ColumnStatistics:
+    """
+    Mergeable per-column statistics of row shards.
+
+    Every shard is reduced on its own to partials of bounded size, and
+    merging the partials of all shards gives the statistics of the whole
+    frame. Numeric columns keep their non-missing count, mean and sum of
+    squared deviations (RunningMoments), their min/max and a QuantileSketch.
+    Categorical, string and boolean columns keep their value counts, and so
+    do numeric columns of at most max_distinct distinct values, like the
+    scores of this data; a numeric column outgrowing that drops them.
+
+    Counts, min/max, modes and category sets equal pandas' on the whole
+    frame exactly. Means and standard deviations agree with pandas up to
+    floating-point rounding. Medians and quantiles are interpolated like
+    pandas between the values at the two closest ranks, read off the value
+    counts when a column has them. For the other columns those values are
+    found by resolve_quantiles in a second pass over the shards: the merged
+    sketch bounds a narrow value range around each rank, and only the
+    values in it are collected. Order statistics are thus exact; with
+    approximate_quantiles they come from the sketch alone instead, within
+    its rank error, without a second pass. Modes and category sets need
+    the value counts.
+
+    The methods mirror pandas' reductions, so strategies take either a
+    DataFrame or a ColumnStatistics as the source of their statistics.
+    """
+    def __init__(self, max_distinct: int = 1024, k: int = 2048, approximate_quantiles: bool = False):
+        """
+        Initializes an empty ColumnStatistics; fill it with update and merge.
+
+        Args:
+            max_distinct (int): Most distinct values of a numeric column whose value counts are kept. Defaults to 1024.
+            k (int): Capacity of the compactor levels of the quantile sketches. Defaults to 2048.
+            approximate_quantiles (bool): Answer the quantiles of columns without value counts from their sketches. Defaults to False (exact, see resolve_quantiles).
+        """
+        self.max_distinct = max_distinct
+        self.k = k
+        self.approximate_quantiles = approximate_quantiles
+        self.n_rows = 0
+        self.dtypes = {}
+        self.non_missing = {}
+        self.moments = {}
+        self.sketches = {}
+        self.minimum = {}
+        self.maximum = {}
+        self.counts = {}
+        self.ranks = {}
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index(list(self.dtypes))
+
+    def update(self, df: pd.DataFrame) -> "ColumnStatistics":
+        """
+        Folds a shard into the statistics.
+
+        Args:
+            df (pd.DataFrame): The next shard.
+
+        Returns:
+            ColumnStatistics: The updated statistics.
+        """
+        from src.outlier_detection import RunningMoments, QuantileSketch
+
+        partial = ColumnStatistics(self.max_distinct, self.k)
+        partial.n_rows = len(df)
+        for column in df.columns:
+            series = df[column]
+            partial.dtypes[column] = series.dtype
+            partial.non_missing[column] = int(series.count())
+            if _is_numeric(series.dtype):
+                partial.moments[column] = RunningMoments([column]).update(df[[column]])
+                partial.sketches[column] = QuantileSketch(self.k, seed=0).update(series.to_numpy(dtype=np.float64, na_value=np.nan))
+                partial.minimum[column] = series.min()
+                partial.maximum[column] = series.max()
+                counts = series.value_counts(sort=False)
+                partial.counts[column] = counts.sort_index() if len(counts) <= self.max_distinct else None
+            else:
+                counts = series.value_counts(sort=False)
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    # Observed categories as plain values, like CategoryDictionary.
+                    counts = counts[counts > 0]
+                    counts.index = pd.Index(counts.index.astype(series.cat.categories.dtype))
+                partial.counts[column] = counts.sort_index()
+        return self.merge(partial)
+
+    def merge(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        """
+        Merges the statistics of another shard into these.
+
+        Args:
+            other (ColumnStatistics): Statistics of a shard with the same columns.
+
+        Returns:
+            ColumnStatistics: The merged statistics.
+        """
+        from src.outlier_detection import RunningMoments, QuantileSketch
+
+        self.n_rows += other.n_rows
+        for column, dtype in other.dtypes.items():
+            if column not in self.dtypes:
+                self.dtypes[column] = dtype
+                self.non_missing[column] = other.non_missing[column]
+                self.counts[column] = other.counts[column]
+                if column in other.moments:
+                    # Own copies, so that merging into them leaves the partials untouched.
+                    self.moments[column] = RunningMoments([column]).merge(other.moments[column])
+                    self.sketches[column] = QuantileSketch(self.k, seed=0).merge(other.sketches[column])
+                    self.minimum[column] = other.minimum[column]
+                    self.maximum[column] = other.maximum[column]
+                continue
+            self.non_missing[column] += other.non_missing[column]
+            # Resolved ranks are those of the data seen so far.
+            self.ranks.pop(column, None)
+            if column in other.moments:
+                self.moments[column].merge(other.moments[column])
+                self.sketches[column].merge(other.sketches[column])
+                self.minimum[column] = _extreme(min, self.minimum[column], other.minimum[column])
+                self.maximum[column] = _extreme(max, self.maximum[column], other.maximum[column])
+            counts = self.counts[column]
+            if counts is not None and other.counts[column] is not None:
+                counts = pd.concat([counts, other.counts[column]]).groupby(level=0, sort=True).sum()
+                counts = counts if column not in self.moments or len(counts) <= self.max_distinct else None
+            else:
+                counts = None
+            self.counts[column] = counts
+        return self
+
+    def __getitem__(self, columns) -> "ColumnStatistics":
+        subset = ColumnStatistics(self.max_distinct, self.k, self.approximate_quantiles)
+        subset.n_rows = self.n_rows
+        for column in columns:
+            subset.dtypes[column] = self.dtypes[column]
+            subset.non_missing[column] = self.non_missing[column]
+            subset.counts[column] = self.counts[column]
+            if column in self.ranks:
+                subset.ranks[column] = self.ranks[column]
+            if column in self.moments:
+                subset.moments[column] = self.moments[column]
+                subset.sketches[column] = self.sketches[column]
+                subset.minimum[column] = self.minimum[column]
+                subset.maximum[column] = self.maximum[column]
+        return subset
+
+    def count(self) -> pd.Series:
+        return pd.Series(self.non_missing, index=self.columns, dtype=np.int64)
+
+    def mean(self) -> pd.Series:
+        return pd.Series({column: self.moments[column].means().iloc[0] for column in self._numeric_columns()}, index=self.columns, dtype=np.float64)
+
+    def median(self) -> pd.Series:
+        return self._order_statistics(0.5, median=True)
+
+    def quantile(self, q: float) -> pd.Series:
+        return self._order_statistics(q)
+
+    def std(self, ddof: int = 1) -> pd.Series:
+        return pd.Series({column: self.moments[column].std(ddof=ddof).iloc[0] for column in self._numeric_columns()}, index=self.columns, dtype=np.float64)
+
+    def min(self) -> pd.Series:
+        return pd.Series({column: self.minimum[column] if column in self.minimum else self._extreme_category(column, 0) for column in self.dtypes}, index=self.columns)
+
+    def max(self) -> pd.Series:
+        return pd.Series({column: self.maximum[column] if column in self.maximum else self._extreme_category(column, -1) for column in self.dtypes}, index=self.columns)
+
+    def mode(self) -> pd.DataFrame:
+        # One row holding the smallest mode of each column, the first row of pandas' mode().
+        modes = {}
+        for column in self.dtypes:
+            counts = self._counts(column, "mode")
+            modes[column] = counts.idxmax() if len(counts) else np.nan
+        return pd.DataFrame([modes], columns=self.columns)
+
+    def categories(self, column: str) -> pd.Index:
+        """
+        Returns the sorted observed values of a column.
+
+        Args:
+            column (str): The column.
+
+        Returns:
+            pd.Index: Its distinct non-missing values.
+        """
+        return self._counts(column, "category set").index
+
+    def resolve_quantiles(self, quantiles: list, scan: Callable) -> "ColumnStatistics":
+        """
+        Finds the exact values at the ranks of the quantiles in the columns without value counts.
+
+        Each round asks scan for the value ranges the merged sketches put
+        around the pending ranks. The count of values below a range and the
+        values inside it, summed over the shards, place every rank that
+        falls in the range; ranges that miss their rank are widened for the
+        next round, up to the whole column.
+
+        Args:
+            quantiles (list): Quantiles in [0, 1] that strategies will ask for.
+            scan (Callable): Maps {column: [(low, high), ...]} to the _scan_ranges result of every shard.
+
+        Returns:
+            ColumnStatistics: The statistics, with those quantiles exact.
+        """
+        pending = {}
+        for column, n in self.non_missing.items():
+            if column in self.moments and self.counts[column] is None and n:
+                resolved = self.ranks.setdefault(column, {})
+                ranks = sorted({rank for q in quantiles for rank in _ranks(q, n)} - set(resolved))
+                if ranks:
+                    pending[column] = ranks
+        margin = 4 / self.k
+        while pending:
+            ranges = {column: self._rank_ranges(column, ranks, margin) for column, ranks in pending.items()}
+            partials = scan(ranges)
+            for column, bounds in ranges.items():
+                for i in range(len(bounds)):
+                    below = sum(partial[column][i][0] for partial in partials)
+                    inside = np.sort(np.concatenate([partial[column][i][1] for partial in partials]))
+                    for rank in pending[column]:
+                        if below <= rank < below + len(inside):
+                            self.ranks[column][rank] = inside[rank - below]
+            pending = {column: [rank for rank in ranks if rank not in self.ranks[column]] for column, ranks in pending.items()}
+            pending = {column: ranks for column, ranks in pending.items() if ranks}
+            margin *= 8
+        return self
+
+    def _rank_ranges(self, column: str, ranks: list, margin: float) -> list:
+        # Value ranges around the sketch's estimate of each rank, margin wider
+        # on both sides than its rank error; overlapping ranges merge into one.
+        n = self.non_missing[column]
+        sketch = self.sketches[column]
+        bounds = []
+        for rank in ranks:
+            fraction = rank / max(n - 1, 1)
+            low = float(sketch.quantile(fraction - margin)) if fraction - margin > 0 else -np.inf
+            high = float(sketch.quantile(fraction + margin)) if fraction + margin < 1 else np.inf
+            if bounds and low <= bounds[-1][1]:
+                bounds[-1] = (bounds[-1][0], max(bounds[-1][1], high))
+            else:
+                bounds.append((low, high))
+        return bounds
+
+    def _order_statistics(self, q: float, median: bool = False) -> pd.Series:
+        results = {}
+        for column in self._numeric_columns():
+            n = self.non_missing[column]
+            if n == 0:
+                results[column] = np.nan
+            elif self.counts[column] is None and self.approximate_quantiles:
+                results[column] = float(self.sketches[column].quantile(q))
+            else:
+                position = (n - 1) * q
+                lower = np.floor(position)
+                low, high = self._value_at(column, int(lower)), self._value_at(column, int(np.ceil(position)))
+                dtype = np.dtype(getattr(self.dtypes[column], "numpy_dtype", self.dtypes[column]))
+                results[column] = _midpoint(low, high, dtype) if median else _lerp(low, high, position - lower, dtype)
+        return pd.Series(results, index=self.columns, dtype=np.float64)
+
+    def _value_at(self, column: str, rank: int):
+        counts = self.counts[column]
+        if counts is not None:
+            return counts.index[np.searchsorted(np.cumsum(counts.to_numpy(dtype=np.int64)), rank, side="right")]
+        if rank not in self.ranks.get(column, {}):
+            raise ValueError(f"Column '{column}' has more than {self.max_distinct} distinct values and its value at rank {rank} was not resolved; pass the quantile to ShardedExecutor.statistics or use approximate_quantiles.")
+        return self.ranks[column][rank]
+
+    def _numeric_columns(self) -> list:
+        for column in self.dtypes:
+            if column not in self.moments:
+                raise TypeError(f"Column '{column}' of dtype {self.dtypes[column]} is not numeric.")
+        return list(self.dtypes)
+
+    def _counts(self, column: str, statistic: str) -> pd.Series:
+        if self.counts[column] is None:
+            raise ValueError(f"Column '{column}' has more than {self.max_distinct} distinct values, its {statistic} is not kept.")
+        return self.counts[column]
+
+    def _extreme_category(self, column: str, position: int):
+        counts = self.counts[column]
+        return counts.index[position] if len(counts) else np.nan
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _extreme(func: Callable, left, right):
+    # The min or max of two shard extremes, either NaN when its shard had no value.
+    if pd.isna(left):
+        return right
+    if pd.isna(right):
+        return left
+    return func(left, right)
+
+
+def _ranks(q: float, n: int) -> set:
+    # The zero-based ranks a linear quantile of n values interpolates between.
+    position = (n - 1) * q
+    return {int(np.floor(position)), int(np.ceil(position))}
+
+
+def _lerp(low, high, gamma: float, dtype: np.dtype) -> float:
+    # numpy's linear interpolation, which pandas' quantile calls, on the two
+    # values alone: over [low, high] the virtual index is gamma itself.
+    return float(np.quantile(np.array([low, high], dtype=dtype), np.array([gamma]))[0])
+
+
+def _midpoint(low, high, dtype: np.dtype) -> float:
+    # pandas' median averages the middle values, float columns in their own precision.
+    if dtype.kind == "f":
+        return float((dtype.type(low) + dtype.type(high)) / 2)
+    return (float(low) + float(high)) / 2
+
+
+def _call(func: Callable, shard: pd.DataFrame, args: tuple, kwargs: dict):
+    return func(shard, *args, **kwargs)
+
+
+def _statistics(shard: pd.DataFrame) -> ColumnStatistics:
+    return ColumnStatistics().update(shard)
+
+
+def _scan_ranges(shard: pd.DataFrame, ranges: dict) -> dict:
+    # Per column and value range: how many values lie below it, and the values inside it.
+    scanned = {}
+    for column, bounds in ranges.items():
+        values = shard[column].dropna().to_numpy()
+        scanned[column] = [(int((values < low).sum()), values[(values >= low) & (values <= high)]) for low, high in bounds]
+    return scanned
+
+
+class ShardedExecutor:
+    """
+    Runs strategies over row shards of a frame on a pool of worker processes.
+
+    Strategies run in two phases. The global statistics they need are
+    computed as a map-reduce: each shard is reduced to a ColumnStatistics
+    partial in a worker, and the partials are merged. The strategy is then
+    applied to every shard in parallel with those statistics, and the
+    shards are concatenated back in order. Each row is handled with the
+    statistics of the whole frame, so the output equals a single-core run,
+    up to the rounding of means and standard deviations noted in
+    ColumnStatistics. The quantiles a strategy reads are made exact by a
+    second pass over the shards, unless approximate_quantiles trades that
+    pass for the sketches' rank error.
+
+    Frames below 2 * min_shard_rows rows, or a single worker, run in the
+    calling process. Use the executor as a context manager to keep its pool
+    open across several strategies; otherwise every call starts its own.
+    """
+    def __init__(self, max_workers: int = None, n_shards: int = None, min_shard_rows: int = 250_000, mp_context: str = "spawn", approximate_quantiles: bool = False):
+        """
+        Initializes the ShardedExecutor.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to None (one per CPU).
+            n_shards (int, optional): Number of row shards. Defaults to None (one per worker, of at least min_shard_rows rows).
+            min_shard_rows (int): Smallest shard worth sending to a worker. Defaults to 250_000.
+            mp_context (str): Start method of the workers. Defaults to "spawn".
+            approximate_quantiles (bool): Take the quantiles of high-cardinality columns from the merged sketches, skipping the exact second pass. Defaults to False.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.n_shards = n_shards
+        self.min_shard_rows = min_shard_rows
+        self.mp_context = mp_context
+        self.approximate_quantiles = approximate_quantiles
+        self._pool = None
+
+    def __enter__(self) -> "ShardedExecutor":
+        if self.max_workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context(self.mp_context))
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def shards(self, df: pd.DataFrame) -> List[pd.DataFrame]:
+        """
+        Splits a frame into contiguous row shards.
+
+        Args:
+            df (pd.DataFrame): The frame.
+
+        Returns:
+            List[pd.DataFrame]: The shards, in row order.
+        """
+        n_shards = self.n_shards or min(self.max_workers, len(df) // self.min_shard_rows)
+        bounds = np.linspace(0, len(df), max(1, min(n_shards, len(df))) + 1).astype(int)
+        return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def map(self, func: Callable, df: pd.DataFrame, *args, **kwargs) -> list:
+        """
+        Calls func(shard, *args, **kwargs) on every shard.
+
+        Args:
+            func (Callable): A picklable function or bound method of a picklable strategy.
+            df (pd.DataFrame): The frame to shard.
+
+        Returns:
+            list: The results, in shard order.
+        """
+        shards = self.shards(df)
+        if len(shards) == 1 or self.max_workers == 1:
+            return [func(shard, *args, **kwargs) for shard in shards]
+        if self._pool is not None:
+            return self._submit(self._pool, func, shards, args, kwargs)
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context(self.mp_context)) as pool:
+            return self._submit(pool, func, shards, args, kwargs)
+
+    def apply(self, func: Callable, df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
+        """
+        Applies a frame-to-frame function to every shard and concatenates the results.
+
+        Args:
+            func (Callable): A picklable function or bound method returning a DataFrame.
+            df (pd.DataFrame): The frame to shard.
+
+        Returns:
+            pd.DataFrame: The shard results, in row order.
+        """
+        shards = self.shards(df)
+        parts = self.map(func, df, *args, **kwargs)
+        if len(parts) == 1:
+            return parts[0]
+        # Strategies resetting the index (one-hot) number the rows of the whole frame again.
+        keep_index = all(part.index.isin(shard.index).all() for part, shard in zip(parts, shards))
+        return pd.concat(parts, ignore_index=not keep_index)
+
+    def statistics(self, df: pd.DataFrame, columns: list = None, quantiles: list = ()) -> ColumnStatistics:
+        """
+        Computes the statistics of the whole frame from per-shard partials.
+
+        Args:
+            df (pd.DataFrame): The frame.
+            columns (list, optional): Columns to describe. Defaults to None (every column).
+            quantiles (list): Quantiles to make exact for the columns without value counts. Defaults to () (none).
+
+        Returns:
+            ColumnStatistics: The merged statistics.
+        """
+        frame = df if columns is None else df[list(columns)]
+        partials = self.map(_statistics, frame)
+        logging.info(f"Merged statistics of {len(partials)} shards.")
+        stats = functools.reduce(lambda merged, partial: merged.merge(partial), partials, ColumnStatistics(approximate_quantiles=self.approximate_quantiles))
+        if quantiles and not self.approximate_quantiles:
+            stats.resolve_quantiles(quantiles, lambda ranges: self.map(_scan_ranges, frame, ranges))
+        return stats
+
+    def _submit(self, pool: ProcessPoolExecutor, func: Callable, shards: List[pd.DataFrame], args: tuple, kwargs: dict) -> list:
+        futures = [pool.submit(_call, func, shard, args, kwargs) for shard in shards]
+        return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,105 @@
+import pandas as pd
+import numpy as np
+import scipy.sparse as sp
+
+from typing import List
+
+
+class SparseDesignMatrix:
+    """
+    Numeric columns kept as a DataFrame next to a sparse CSR block.
+
+    Produced by the sparse one-hot encoder so that high-cardinality
+    categorical features are never densified. Rows are positional: the dense
+    part is re-indexed from 0 to match the rows of the sparse block.
+    """
+    def __init__(self, dense: pd.DataFrame, sparse, sparse_columns: List[str]):
+        """
+        Initializes the SparseDesignMatrix.
+
+        Args:
+            dense (pd.DataFrame): The dense (numeric and target) columns.
+            sparse (scipy.sparse matrix): The sparse block, one row per row of dense.
+            sparse_columns (List[str]): Names of the sparse block's columns.
+        """
+        self.dense = dense.reset_index(drop=True)
+        self.sparse = sp.csr_matrix(sparse)
+        self.sparse_columns = list(sparse_columns)
+        if self.sparse.shape != (len(self.dense), len(self.sparse_columns)):
+            raise ValueError(
+                f"Sparse block of shape {self.sparse.shape} does not match "
+                f"{len(self.dense)} rows and {len(self.sparse_columns)} columns."
+            )
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.dense.columns) + self.sparse_columns
+
+    @property
+    def shape(self):
+        return len(self.dense), len(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.dense)
+
+    def __getitem__(self, key):
+        """
+        Selects dense columns, e.g. the targets.
+        """
+        return self.dense[key]
+
+    def drop(self, columns) -> "SparseDesignMatrix":
+        """
+        Drops dense columns, the sparse block is shared.
+
+        Args:
+            columns: Dense columns to drop.
+
+        Returns:
+            SparseDesignMatrix: The matrix without the columns.
+        """
+        return SparseDesignMatrix(self.dense.drop(columns=columns), self.sparse, self.sparse_columns)
+
+    def take(self, indices) -> "SparseDesignMatrix":
+        """
+        Selects rows by position.
+
+        Args:
+            indices (array-like): Positions of the rows to keep.
+
+        Returns:
+            SparseDesignMatrix: The selected rows.
+        """
+        return SparseDesignMatrix(self.dense.iloc[indices], self.sparse[indices], self.sparse_columns)
+
+    def to_csr(self, dtype=np.float64) -> sp.csr_matrix:
+        """
+        Stacks the dense columns in front of the sparse block as one CSR matrix.
+
+        Args:
+            dtype (np.dtype): dtype of the result. Defaults to np.float64.
+
+        Returns:
+            sp.csr_matrix: The full design matrix, still sparse.
+        """
+        dense = sp.csr_matrix(self.dense.to_numpy(dtype=dtype))
+        return sp.hstack([dense, self.sparse.astype(dtype, copy=False)], format="csr")
+
+
+def to_model_input(X):
+    """
+    Converts a SparseDesignMatrix to the CSR matrix the estimators accept.
+
+    Args:
+        X: A DataFrame, a SciPy sparse matrix or a SparseDesignMatrix.
+
+    Returns:
+        The input unchanged, or its CSR matrix for a SparseDesignMatrix.
+    """
+    if isinstance(X, SparseDesignMatrix):
+        return X.to_csr()
+    return X
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,285 @@
+import os
+import sys
+import json
+import time
+import pickle
+import inspect
+import hashlib
+import logging
+import functools
+import pandas as pd
+import numpy as np
+
+from typing import Any, Callable
+
+from src.sparse_design_matrix import SparseDesignMatrix
+
+
+class StepCache:
+    """
+    Content-addressed on-disk memoization of pipeline step outputs.
+
+    A step's key is the hash of its name, the fingerprints of its arguments
+    bound to its signature (defaults included), the source code it runs
+    (see code_fingerprint) and an optional extra configuration. Changing an
+    argument, a default or the code of a step or of the repository modules
+    it uses therefore misses the cache. Outputs produced or loaded by the cache
+    remember their own key, so downstream steps fingerprint them without
+    re-hashing the data. The least recently used entries are evicted once
+    the cache grows beyond max_bytes.
+    """
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 << 30):
+        """
+        Initializes the StepCache.
+
+        Args:
+            cache_dir (str): Directory where step outputs are stored.
+            max_bytes (int): Upper bound of the total cache size in bytes. Defaults to 2 GiB.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # id(output) -> (key, output); holding the output keeps its id valid.
+        self._lineage = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    def run(self, name: str, step: Callable, *args, config: dict = None, **kwargs) -> Any:
+        """
+        Returns the cached output of a step, running it on a miss.
+
+        Args:
+            name (str): Name of the step, part of the key.
+            step (Callable): The step function.
+            *args: Positional inputs of the step.
+            config (dict, optional): Extra configuration that changes the output but is neither an argument nor code, e.g. a data version. Defaults to None.
+            **kwargs: Keyword inputs of the step.
+
+        Returns:
+            Any: The step output.
+        """
+        key = self.key(name, step, args, kwargs, config)
+        path = self._entry_path(key)
+        if key in self._index["entries"] and os.path.exists(path):
+            with open(path, "rb") as f:
+                output = pickle.load(f)
+            self.hits += 1
+            self._index["entries"][key]["last_access"] = time.time()
+            self._save_index()
+            logging.info(f"Step cache hit for '{name}' (key {key}).")
+        else:
+            self.misses += 1
+            logging.info(f"Step cache miss for '{name}' (key {key}). Running step.")
+            output = step(*args, **kwargs)
+            self._put(key, name, output)
+        self._lineage[id(output)] = (key, output)
+        if isinstance(output, tuple):
+            # Steps such as split return several outputs consumed separately.
+            for i, item in enumerate(output):
+                self._lineage[id(item)] = (f"{key}:{i}", item)
+        return output
+
+    def key(self, name: str, step: Callable, args: tuple, kwargs: dict, config: dict = None) -> str:
+        """
+        Builds the cache key of a step invocation.
+
+        Args:
+            name (str): Name of the step.
+            step (Callable): The step function.
+            args (tuple): Positional inputs.
+            kwargs (dict): Keyword inputs.
+            config (dict, optional): Extra configuration. Defaults to None.
+
+        Returns:
+            str: Hex digest of the step invocation.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(name.encode())
+        digest.update(code_fingerprint(step).encode())
+        for arg_name, value in _bound_arguments(step, args, kwargs):
+            digest.update(arg_name.encode())
+            digest.update(self.fingerprint(value).encode())
+        digest.update(json.dumps(config or {}, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def fingerprint(self, value: Any) -> str:
+        """
+        Returns a content fingerprint of a step input.
+
+        Paths of existing files are fingerprinted by their size and
+        modification time, frames and arrays by their content.
+
+        Args:
+            value (Any): A step input.
+
+        Returns:
+            str: The fingerprint.
+        """
+        if id(value) in self._lineage and self._lineage[id(value)][1] is value:
+            return f"step:{self._lineage[id(value)][0]}"
+        if isinstance(value, (str, os.PathLike)) and os.path.isfile(value):
+            stat = os.stat(value)
+            return f"file:{os.path.abspath(value)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+            frame = value.to_frame() if isinstance(value, pd.Series) else value
+            digest.update(repr(list(zip(frame.columns, map(str, frame.dtypes)))).encode())
+        elif isinstance(value, SparseDesignMatrix):
+            digest.update(self.fingerprint(value.dense).encode())
+            for array in (value.sparse.data, value.sparse.indices, value.sparse.indptr):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            digest.update(repr(value.sparse_columns).encode())
+        elif isinstance(value, np.ndarray):
+            digest.update(f"{value.dtype}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, pd.Index):
+            digest.update(repr(value.tolist()).encode())
+        else:
+            digest.update(repr(value).encode())
+        return digest.hexdigest()
+
+    def invalidate(self, name: str = None) -> int:
+        """
+        Removes cached step outputs.
+
+        Args:
+            name (str, optional): Remove only the outputs of this step. Defaults to None (remove everything).
+
+        Returns:
+            int: Number of removed entries.
+        """
+        keys = [k for k, e in self._index["entries"].items() if name is None or e["step"] == name]
+        for key in keys:
+            self._remove(key)
+        self._save_index()
+        logging.info(f"Invalidated {len(keys)} step cache entries.")
+        return len(keys)
+
+    def size(self) -> int:
+        """
+        Returns the total size of the cached outputs in bytes.
+        """
+        return sum(e["bytes"] for e in self._index["entries"].values())
+
+    def _put(self, key: str, name: str, output: Any):
+        path = self._entry_path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._index["entries"][key] = {"step": name, "bytes": os.path.getsize(path), "last_access": time.time()}
+        self._evict()
+        self._save_index()
+
+    def _evict(self):
+        entries = self._index["entries"]
+        for key in sorted(entries, key=lambda k: entries[k]["last_access"]):
+            if self.size() <= self.max_bytes:
+                break
+            logging.info(f"Evicting step cache entry {key} of step '{entries[key]['step']}'.")
+            self._remove(key)
+
+    def _remove(self, key: str):
+        self._index["entries"].pop(key, None)
+        path = self._entry_path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _load_index(self) -> dict:
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                logging.warning(f"Step cache index {path} is unreadable. Starting with an empty cache.")
+        return {"entries": {}}
+
+    def _save_index(self):
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _bound_arguments(step: Callable, args: tuple, kwargs: dict) -> list:
+    # Every parameter of the step with the value it runs with, defaults included.
+    try:
+        bound = inspect.signature(step).bind(*args, **kwargs)
+    except (TypeError, ValueError):
+        return [(str(i), value) for i, value in enumerate(args)] + sorted(kwargs.items())
+    bound.apply_defaults()
+    arguments = []
+    for arg_name, value in bound.arguments.items():
+        kind = bound.signature.parameters[arg_name].kind
+        if kind == inspect.Parameter.VAR_POSITIONAL:
+            arguments.extend((f"{arg_name}[{i}]", item) for i, item in enumerate(value))
+        elif kind == inspect.Parameter.VAR_KEYWORD:
+            arguments.extend(sorted(value.items()))
+        else:
+            arguments.append((arg_name, value))
+    return arguments
+
+
+def code_fingerprint(step: Callable) -> str:
+    """
+    Returns a hash of the source code a step runs.
+
+    The source files of the step's module and of every repository module it
+    references, transitively through module globals, are hashed. Library
+    code outside the repository is not. Fingerprints are computed once per
+    module and process.
+
+    Args:
+        step (Callable): The step function.
+
+    Returns:
+        str: Hex digest of the source files, empty for steps defined outside a module file.
+    """
+    module = getattr(inspect.unwrap(step), "__module__", None)
+    return _module_fingerprint(module) if module else ""
+
+
+@functools.lru_cache(maxsize=None)
+def _module_fingerprint(module_name: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for name, path in sorted(_repository_modules(module_name).items()):
+        digest.update(name.encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _repository_modules(module_name: str) -> dict:
+    modules, visited, pending = {}, set(), [module_name]
+    while pending:
+        name = pending.pop()
+        if name in visited:
+            continue
+        visited.add(name)
+        module = sys.modules.get(name)
+        path = getattr(module, "__file__", None)
+        if path is None or not os.path.abspath(path).startswith(ROOT + os.sep):
+            continue
+        modules[name] = path
+        for value in vars(module).values():
+            reference = value.__name__ if inspect.ismodule(value) else getattr(value, "__module__", None)
+            if isinstance(reference, str) and reference not in visited:
+                pending.append(reference)
+    return modules
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,156 @@
+import os
+import logging
+import pandas as pd
+import numpy as np
+
+from typing import Iterator, List
+
+
+CATEGORICAL_COLUMNS = ["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"]
+SCORE_COLUMNS = ["math score", "reading score", "writing score"]
+
+
+class StudentPerformanceGenerator:
+    """
+    Generates synthetic rows with the StudentsPerformance schema.
+
+    The demographic columns are drawn from their empirical joint
+    distribution, so every category frequency and every association between
+    categories is kept. The scores are a linear function of the categories
+    plus residuals drawn from a multivariate normal with the empirical
+    residual covariance, which keeps the score-score and category-score
+    correlations. Missing values and outliers are then injected at the
+    requested rates so the cleaning steps have work to do.
+    """
+    def __init__(self, missing_rate: float = 0.01, outlier_rate: float = 0.005, missing_columns: List[str] = None, seed: int = 42):
+        """
+        Initializes the StudentPerformanceGenerator.
+
+        Args:
+            missing_rate (float): Fraction of cells of missing_columns set to missing. Defaults to 0.01.
+            outlier_rate (float): Fraction of rows whose scores are replaced by outliers. Defaults to 0.005.
+            missing_columns (List[str], optional): Columns receiving missing values. Defaults to None (the scores, which the cleaning step fills).
+            seed (int): Seed of the random generator. Defaults to 42.
+        """
+        self.missing_rate = missing_rate
+        self.outlier_rate = outlier_rate
+        self.missing_columns = list(missing_columns) if missing_columns is not None else list(SCORE_COLUMNS)
+        self.seed = seed
+        self.combinations = None
+        self.weights = None
+        self.levels = None
+        self.coef = None
+        self.cholesky = None
+        self.score_mean = None
+        self.score_std = None
+
+    def fit(self, df: pd.DataFrame) -> "StudentPerformanceGenerator":
+        """
+        Learns the category distribution and the score model from real data.
+
+        Args:
+            df (pd.DataFrame): Data with the StudentsPerformance schema.
+
+        Returns:
+            StudentPerformanceGenerator: The fitted generator.
+        """
+        data = df[CATEGORICAL_COLUMNS + SCORE_COLUMNS].dropna()
+        counts = data.groupby(CATEGORICAL_COLUMNS, observed=True).size()
+        self.combinations = counts.index.to_frame(index=False)
+        self.weights = (counts / counts.sum()).to_numpy()
+        self.levels = {column: sorted(data[column].unique()) for column in CATEGORICAL_COLUMNS}
+
+        design = self._design(data[CATEGORICAL_COLUMNS])
+        scores = data[SCORE_COLUMNS].to_numpy(dtype=np.float64)
+        self.coef = np.linalg.lstsq(design, scores, rcond=None)[0]
+        residuals = scores - design @ self.coef
+        covariance = np.cov(residuals, rowvar=False) + 1e-9 * np.eye(len(SCORE_COLUMNS))
+        self.cholesky = np.linalg.cholesky(covariance)
+        self.score_mean = scores.mean(axis=0)
+        self.score_std = scores.std(axis=0)
+        logging.info(f"Fitted synthetic data generator on {len(data)} rows and {len(self.combinations)} category combinations.")
+        return self
+
+    def generate(self, n_rows: int, seed: int = None) -> pd.DataFrame:
+        """
+        Generates one frame of synthetic rows.
+
+        Args:
+            n_rows (int): Number of rows.
+            seed (int, optional): Seed of this frame. Defaults to None (the generator seed).
+
+        Returns:
+            pd.DataFrame: Rows with the StudentsPerformance schema.
+        """
+        if self.combinations is None:
+            raise ValueError("The generator is not fitted. Call fit before generate.")
+        rng = np.random.default_rng(self.seed if seed is None else seed)
+        picks = rng.choice(len(self.combinations), size=n_rows, p=self.weights)
+        df = self.combinations.iloc[picks].reset_index(drop=True)
+
+        noise = rng.standard_normal((n_rows, len(SCORE_COLUMNS))) @ self.cholesky.T
+        scores = np.clip(np.rint(self._design(df) @ self.coef + noise), 0, 100)
+
+        # Outlier rows sit 4 to 8 standard deviations away from the mean, beyond the
+        # 0-100 range, in the same direction for the three scores like a data entry error.
+        outliers = rng.random(n_rows) < self.outlier_rate
+        shift = rng.choice([-1.0, 1.0], size=(outliers.sum(), 1)) * rng.uniform(4, 8, size=(outliers.sum(), 1))
+        scores[outliers] = np.rint(self.score_mean + shift * self.score_std)
+
+        for i, column in enumerate(SCORE_COLUMNS):
+            df[column] = scores[:, i]
+        for column in self.missing_columns:
+            missing = rng.random(n_rows) < self.missing_rate
+            if missing.any():
+                df[column] = df[column].where(~missing)
+        for column in SCORE_COLUMNS:
+            # Whole numbers like the real export; nullable when missing values were injected.
+            df[column] = df[column].astype("Int64" if df[column].isna().any() else "int64")
+        return df
+
+    def iter_chunks(self, n_rows: int, chunksize: int = 1_000_000) -> Iterator[pd.DataFrame]:
+        """
+        Generates n_rows rows as a stream of chunks, each with its own seed.
+
+        Args:
+            n_rows (int): Total number of rows.
+            chunksize (int): Number of rows per chunk. Defaults to 1_000_000.
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+        """
+        for i, start in enumerate(range(0, n_rows, chunksize)):
+            yield self.generate(min(chunksize, n_rows - start), seed=self.seed + i)
+
+    def write_csv(self, path: str, n_rows: int, chunksize: int = 1_000_000) -> str:
+        """
+        Writes n_rows synthetic rows to a CSV file in constant memory.
+
+        Args:
+            path (str): Destination file.
+            n_rows (int): Total number of rows.
+            chunksize (int): Number of rows generated at a time. Defaults to 1_000_000.
+
+        Returns:
+            str: The path.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", newline="") as f:
+            for i, chunk in enumerate(self.iter_chunks(n_rows, chunksize)):
+                chunk.to_csv(f, header=i == 0, index=False)
+        os.replace(tmp_path, path)
+        logging.info(f"Wrote {n_rows} synthetic rows to {path}.")
+        return path
+
+    def _design(self, categories: pd.DataFrame) -> np.ndarray:
+        # Intercept plus one indicator per non-reference category.
+        columns = [np.ones(len(categories))]
+        for column, levels in self.levels.items():
+            values = categories[column].to_numpy()
+            columns.extend((values == level).astype(np.float64) for level in levels[1:])
+        return np.column_stack(columns)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,30 @@
+import logging
+import pandas as pd
+
+from src.data_splitting import DataSplitter, KFoldSplit, RepeatedKFoldSplit, StratifiedBucketKFoldSplit
+from src.cross_validation import CrossValidator
+from src.instrumentation import instrumented
+
+
+@instrumented("cross_validate")
+def cross_validate(df: pd.DataFrame, target_column, strategy="kfold", n_splits=5, max_workers=None, executor="thread", **kwargs) -> dict:
+    try:
+        if strategy == "kfold":
+            splitter = DataSplitter(KFoldSplit(n_splits=n_splits, **kwargs))
+        elif strategy == "repeated_kfold":
+            splitter = DataSplitter(RepeatedKFoldSplit(n_splits=n_splits, **kwargs))
+        elif strategy == "stratified_bucket_kfold":
+            splitter = DataSplitter(StratifiedBucketKFoldSplit(n_splits=n_splits, **kwargs))
+        else:
+            raise ValueError(f"Unsupported cross-validation strategy: {strategy}.")
+        
+        folds = splitter.split(df, target_column)
+        validator = CrossValidator(max_workers=max_workers, executor=executor)
+        results = validator.evaluate(folds)
+        summary = validator.summary(results)
+        print(summary)
+        return summary
+    
+    except Exception as e:
+        logging.warning(f"Error occur while cross-validating: {e}.")
+        raise e
@@ -3,17 +3,28 @@ import pandas as pd
 import numpy as np
 
 from src.handling_missing_value import MissingValueHandler, FillMissingValueStrategy
-from src.outlier_detection import OutlierDetector, IQROutlierDetectionStrategy
+from src.outlier_detection import OutlierDetector, OutlierDetectionStrategy, IQROutlierDetectionStrategy
+from src.fused_cleaning import FusedCleaningEngine
+from src.sharded_execution import ShardedExecutor
+from src.instrumentation import instrumented
 
-def clean(df: pd.DataFrame) -> pd.DataFrame:
+@instrumented("clean")
+def clean(df: pd.DataFrame, fused: bool = True, executor: ShardedExecutor = None, outlier_strategy: OutlierDetectionStrategy = None) -> pd.DataFrame:
     try:
-        handler = MissingValueHandler(FillMissingValueStrategy(method="mean"))
+        # The fused engine runs in one process with IQR capping; an executor
+        # shards the handlers instead, and any other outlier strategy runs on its own.
+        if fused and executor is None and outlier_strategy is None:
+            return FusedCleaningEngine(method="mean").clean(df)
+
+        handler = MissingValueHandler(FillMissingValueStrategy(method="mean"), executor=executor)
         df_cleaned = handler.handle(df)
         numerical_features = df_cleaned.select_dtypes(include=np.number).columns
-        detector = OutlierDetector(IQROutlierDetectionStrategy())
+        detector = OutlierDetector(outlier_strategy or IQROutlierDetectionStrategy(), executor=executor)
         outlier_found = detector.detect(df_cleaned[numerical_features])
-        if outlier_found:
-            df_cleaned[numerical_features] = detector.handle(df_cleaned[numerical_features], method="cap")
+        # One boolean for IQR, a mask of rows or values for the other strategies,
+        # handed on so that capping does not detect a second time.
+        if np.any(outlier_found):
+            df_cleaned[numerical_features] = detector.handle(df_cleaned[numerical_features], method="cap", outliers=outlier_found)
         else:
             logging.info("No outliers detected.")
         
@@ -1,23 +1,79 @@
 import logging
 from src.data_ingestion import IngestData
+from src.ingestion_cache import IngestionCache
+from src.data_schema import DataSchema
+from src.instrumentation import instrumented
 
 import pandas as pd
+from typing import Iterator
 
 
-def ingest(file_path: str) -> pd.DataFrame:
+@instrumented("ingest")
+def ingest(file_path: str, dtype: dict = None, engine: str = None, cache_dir: str = None, schema: DataSchema = None) -> pd.DataFrame:
     """
     Ingesting the data from the file_path.
 
     Args:
         file_path (str): Path to the data.
+        dtype (dict): Column to dtype mapping applied while parsing. Defaults to None.
+        engine (str): CSV parser engine, e.g. "pyarrow". Defaults to None.
+        cache_dir (str): Directory of the parsed-data cache. Defaults to None (no caching).
+        schema (DataSchema): Validates the columns and stores them in compact dtypes. Defaults to None (dtypes as parsed).
 
     Returns:
         pd.DataFrame: A DataFrame with ingested data.
     """
     try:
-        ingest = IngestData(file_path)
-        df = ingest.get_data()
+        if schema is not None:
+            # Categoricals are built while parsing, so the strings are never all held at once.
+            dtype = {**schema.read_dtypes(), **(dtype or {})}
+        ingest = IngestData(file_path, dtype=dtype, engine=engine)
+
+        def load() -> pd.DataFrame:
+            df = ingest.get_data()
+            return schema.apply(df) if schema is not None else df
+
+        if cache_dir is None:
+            return load()
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logging.warning("pyarrow is not installed. Ingesting without cache.")
+            return load()
+
+        cache = IngestionCache(cache_dir)
+        options = {"dtype": dtype} if schema is None else {"dtype": dtype, "schema": schema}
+        key = cache.key(file_path, **options)
+        df = cache.get(key)
+        if df is None:
+            df = load()
+            cache.put(key, df, source=file_path)
         return df
     except Exception as e:
         logging.warning(f" Error while ingesting data: {e}.")
-        raise e
\ No newline at end of file
+        raise e
+
+
+def ingest_chunks(file_path: str, chunksize: int = 100_000, dtype: dict = None, engine: str = None, schema: DataSchema = None) -> Iterator[pd.DataFrame]:
+    """
+    Streaming the data from the file_path in fixed-size chunks.
+
+    Args:
+        file_path (str): Path to the data.
+        chunksize (int): Number of rows per chunk. Defaults to 100_000.
+        dtype (dict): Column to dtype mapping applied while parsing. Defaults to None.
+        engine (str): CSV parser engine, e.g. "pyarrow". Defaults to None.
+        schema (DataSchema): Parses the chunks with the schema's chunk dtypes, so every chunk has the same dtypes. Defaults to None (dtypes as parsed).
+
+    Yields:
+        pd.DataFrame: The next chunk of ingested data.
+    """
+    try:
+        if schema is not None:
+            dtype = {**schema.chunk_dtypes(), **(dtype or {})}
+        ingest = IngestData(file_path, dtype=dtype, engine=engine, chunksize=chunksize)
+        yield from ingest.iter_chunks()
+    except Exception as e:
+        logging.warning(f" Error while streaming data: {e}.")
+        raise e
@@ -3,8 +3,10 @@ import pandas as pd
 from typing import Tuple
 
 from src.data_splitting import DataSplitter, SimpleTrainTestSplit
+from src.instrumentation import instrumented
 
 
+@instrumented("split")
 def split(df: pd.DataFrame, target_column: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     try:
         splitter = DataSplitter(SimpleTrainTestSplit())
@@ -4,35 +4,109 @@ import numpy as np
 
 from src.feature_engineering import (
     FeatureEngineer,
+    FeatureEngineeringPipeline,
     LabelEncodingStrategy,
     StandardScalingStrategy,
     LogTransformationStrategy,
     MinMaxScalingStrategy,
     OneHotEncodingStrategy
 )
+from src.sharded_execution import ShardedExecutor
+from src.instrumentation import instrumented
 
-def transform(df: pd.DataFrame, strategy="log", features: list=None) -> pd.DataFrame:
+
+def _build_strategy(strategy: str, features: list):
+    # Ensure the features
+    if features is None:
+        raise ValueError(f"Features are {features}. Input specific list of features.")
+    
+    if strategy == "log":
+        return LogTransformationStrategy(features)
+    elif strategy == "standard_scaling":
+        return StandardScalingStrategy(features)
+    elif strategy == "min_max_scaling":
+        return MinMaxScalingStrategy(features)
+    elif strategy == "label_encoding":
+        return LabelEncodingStrategy(features)
+    elif strategy == "one_hot_encoding":
+        return OneHotEncodingStrategy(features)
+    elif strategy == "sparse_one_hot_encoding":
+        return OneHotEncodingStrategy(features, sparse=True)
+    else:
+        raise ValueError(f"Unsupported feature engineering strategy: {strategy}.")
+
+
+@instrumented("transform")
+def transform(df: pd.DataFrame, strategy="log", features: list=None, artifact_path: str=None, mode: str="copy", track_memory: bool=False, executor: ShardedExecutor=None) -> pd.DataFrame:
+    """
+    Applies one feature engineering strategy, or a chain of them.
+
+    Args:
+        df (pd.DataFrame): The data to transform.
+        strategy (str or list): Strategy name, or a list of names / (name, features) pairs run in order. Defaults to "log".
+        features (list): Features of the strategy, and of chained stages given without their own. Defaults to None.
+        artifact_path (str): Where to persist the fitted state. Defaults to None.
+        mode (str): Buffer handling of a chain, "copy", "inplace" or "cow". Defaults to "copy".
+        track_memory (bool): Log the peak memory of a chain. Defaults to False.
+        executor (ShardedExecutor): Fits from statistics merged over row shards and transforms the shards in parallel. Defaults to None (single process).
+
+    Returns:
+        pd.DataFrame: The transformed data.
+    """
     try:
-        # Ensure the features
-        if features is None:
-            raise ValueError("Features are {Features}. Input specific list of features.")
-        
-        if strategy == "log":
-            engineer = FeatureEngineer(LogTransformationStrategy(features))
-        elif strategy == "standard_scaling":
-            engineer = FeatureEngineer(StandardScalingStrategy(features))
-        elif strategy == "min_max_scaling":
-            engineer = FeatureEngineer(MinMaxScalingStrategy(features))
-        elif strategy == "label_encoding":
-            engineer = FeatureEngineer(LabelEncodingStrategy(features))
-        elif strategy == "one_hot_encoding":
-            engineer = FeatureEngineer(OneHotEncodingStrategy(features))
+        if isinstance(strategy, (list, tuple)):
+            stages = [
+                _build_strategy(*stage) if isinstance(stage, tuple) else _build_strategy(stage, features)
+                for stage in strategy
+            ]
+            engineer = FeatureEngineer(FeatureEngineeringPipeline(stages, mode=mode, track_memory=track_memory), executor=executor)
         else:
-            raise ValueError(f"Unsupported feature engineering strategy: {strategy}.")
+            engineer = FeatureEngineer(_build_strategy(strategy, features), executor=executor)
         
         df_transformed = engineer.apply(df)
+        if artifact_path is not None:
+            engineer.save(artifact_path)
         return df_transformed
     
     except Exception as e:
-        logging.warning("Error occur while transforming data: {e}.")
-        raise e
\ No newline at end of file
+        logging.warning(f"Error occur while transforming data: {e}.")
+        raise e
+
+
+@instrumented("save_transform_state")
+def save_transform_state(df: pd.DataFrame, artifact_path: str, strategy="label_encoding", features: list=None) -> str:
+    """
+    Fits the transform state without transforming the data, and persists it for serving.
+
+    Args:
+        df (pd.DataFrame): The data to learn from.
+        artifact_path (str): Where to persist the fitted state.
+        strategy (str or list): Strategy name, or a chain as accepted by transform. Defaults to "label_encoding".
+        features (list): Features of the strategy. Defaults to None.
+
+    Returns:
+        str: The artifact path.
+    """
+    try:
+        if isinstance(strategy, (list, tuple)):
+            # Later stages of a chain learn from the output of earlier ones.
+            transform(df, strategy=strategy, features=features, artifact_path=artifact_path)
+            return artifact_path
+        engineer = FeatureEngineer(_build_strategy(strategy, features)).fit(df)
+        engineer.save(artifact_path)
+        return artifact_path
+    
+    except Exception as e:
+        logging.warning(f"Error occur while saving transform state: {e}.")
+        raise e
+
+
+@instrumented("transform_with_fitted")
+def transform_with_fitted(df: pd.DataFrame, artifact_path: str) -> pd.DataFrame:
+    try:
+        engineer = FeatureEngineer.load(artifact_path)
+        return engineer.transform(df)
+    
+    except Exception as e:
+        logging.warning(f"Error occur while transforming data with fitted state: {e}.")
+        raise e
@@ -0,0 +1,37 @@
+import logging
+from typing import TYPE_CHECKING, Tuple
+
+from src.incremental_training import IncrementalTrainer
+from src.instrumentation import instrumented
+
+if TYPE_CHECKING:
+    from sklearn.base import RegressorMixin
+
+
+@instrumented("train_incremental")
+def train_incremental(file_path: str, state_path: str, alpha: float = 0.0, artifact_dir: str = None) -> Tuple["RegressorMixin", dict]:
+    """
+    Updates the saved model with the rows appended to file_path since the last run.
+
+    Args:
+        file_path (str): Path to the data.
+        state_path (str): File holding the incremental training state.
+        alpha (float): Ridge penalty, used when the state is created. Defaults to 0.0.
+        artifact_dir (str): Where to save the transform state and category dictionary of the refreshed model. Defaults to None (not saved).
+
+    Returns:
+        Tuple[RegressorMixin, dict]: The refreshed model (None when no rows were ever consumed) and the update report.
+    """
+    try:
+        trainer = IncrementalTrainer.load(state_path, alpha=alpha)
+        report = trainer.update(file_path)
+        trainer.save(state_path)
+        trained_model = trainer.model() if trainer.rows else None
+        if artifact_dir is not None and trained_model is not None:
+            trainer.save_serving_state(artifact_dir)
+        print(report)
+        return trained_model, report
+
+    except Exception as e:
+        logging.warning(f"Error occur while training incrementally: {e}.")
+        raise e
@@ -2,7 +2,9 @@ import logging
 import pandas as pd
 
 from src.model_evaluation import ModelEvaluator, RegressionLinearEvaluationStrategy
+from src.instrumentation import instrumented
 
+@instrumented("evaluate")
 def evaluate(model, X_test, y_test) -> dict:
     try:
         evaluator = ModelEvaluator(RegressionLinearEvaluationStrategy())
@@ -0,0 +1,30 @@
+import logging
+
+from src.fast_predictor import compile_predictor
+from src.feature_engineering import FeatureEngineer
+from src.instrumentation import instrumented
+
+
+@instrumented("export_predictor")
+def export_predictor(model, artifact_path: str, transform_path: str = None, target_columns: list = None) -> str:
+    """
+    Compiles the fitted model and transform state into a NumPy-only predictor artifact.
+
+    Args:
+        model (RegressorMixin): The fitted linear model.
+        artifact_path (str): Destination of the .npz artifact.
+        transform_path (str): Transform state saved by the transform step. Defaults to None (raw model inputs).
+        target_columns (list): Names of the targets. Defaults to None.
+
+    Returns:
+        str: The artifact path.
+    """
+    try:
+        engineer = FeatureEngineer.load(transform_path) if transform_path is not None else None
+        predictor = compile_predictor(model, engineer, target_columns=target_columns)
+        predictor.save(artifact_path)
+        return artifact_path
+    
+    except Exception as e:
+        logging.warning(f"Error occur while exporting predictor: {e}.")
+        raise e
@@ -0,0 +1,18 @@
+import logging
+import pandas as pd
+
+from src.model_sweep import ModelSweep
+from src.instrumentation import instrumented
+
+
+@instrumented("sweep")
+def sweep(X_train, X_test, y_train, y_test, grid: dict, max_workers: int = None, metric: str = "R-Squared") -> pd.DataFrame:
+    try:
+        model_sweep = ModelSweep(grid, max_workers=max_workers, metric=metric)
+        leaderboard = model_sweep.run(X_train, X_test, y_train, y_test)
+        print(leaderboard)
+        return leaderboard
+    
+    except Exception as e:
+        logging.warning(f"Error occur while sweeping models: {e}.")
+        raise e
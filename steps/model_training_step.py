@@ -1,10 +1,17 @@
 import logging
 import pandas as pd
 
+from typing import TYPE_CHECKING
+
 from src.model_training import ModelTrainer, LinearRegressionStrategy
-from sklearn.base import RegressorMixin
+from src.instrumentation import instrumented
+
+if TYPE_CHECKING:
+    from sklearn.base import RegressorMixin
+
 
-def train(X_train, y_train) -> RegressorMixin:
+@instrumented("train")
+def train(X_train, y_train) -> "RegressorMixin":
     try:
         trainer = ModelTrainer(LinearRegressionStrategy())
         trained_model = trainer.train(X_train, y_train)
@@ -0,0 +1,105 @@
+import logging
+import pandas as pd
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from steps.data_ingestion_step import ingest_chunks
+from src.outlier_detection import RunningMoments
+from src.categorical_encoding import CategoryDictionary
+from src.model_training import StreamingLinearRegressionStrategy
+from src.instrumentation import instrumented
+
+if TYPE_CHECKING:
+    from sklearn.base import RegressorMixin
+
+
+def _prepare_chunk(chunk: pd.DataFrame, fill_values: pd.Series, dictionary: CategoryDictionary, categorical_features: list) -> pd.DataFrame:
+    """
+    Fills missing numbers with the streamed means and label-encodes the categorical columns of a chunk.
+    """
+    numerical_features = list(fill_values.index)
+    df = chunk[numerical_features].astype(np.float64).fillna(fill_values)
+    codes = dictionary.encode(chunk, categorical_features, handle_unknown="reserve")
+    for i, feature in enumerate(categorical_features):
+        df[feature] = codes[:, i]
+    return df
+
+
+def _accumulate_chunk(chunk: pd.DataFrame, fill_values: pd.Series, dictionary: CategoryDictionary, categorical_features: list, target_columns: list, alpha: float) -> StreamingLinearRegressionStrategy:
+    """
+    Returns the sufficient statistics of one chunk. Runs in a worker.
+    """
+    df = _prepare_chunk(chunk, fill_values, dictionary, categorical_features)
+    features = [column for column in df.columns if column not in target_columns]
+    return StreamingLinearRegressionStrategy(alpha=alpha).partial_fit(df[features], df[target_columns])
+
+
+@instrumented("train_streaming")
+def train_streaming(file_path: str, target_columns: list = None, chunksize: int = 100_000, alpha: float = 0.0, max_workers: int = None, engine: str = None, dtype: dict = None) -> "RegressorMixin":
+    """
+    Trains a linear regression on a CSV of any size in two streaming passes.
+
+    The first pass learns the fill values of the numeric columns and the
+    categories of the others, the second pass label-encodes every chunk and
+    folds it into the X'X and X'Y statistics, which are solved once at the
+    end for all targets. With max_workers, chunks are accumulated on a
+    process pool and the partial statistics merged; at most two chunks per
+    worker are in flight, so memory stays bounded by the chunk size.
+
+    Args:
+        file_path (str): Path to the data.
+        target_columns (list, optional): Target columns. Defaults to None (every numeric column, like the batch pipeline).
+        chunksize (int): Number of rows per chunk. Defaults to 100_000.
+        alpha (float): Ridge penalty. Defaults to 0.0 (OLS).
+        max_workers (int, optional): Number of worker processes. Defaults to None (accumulate in this process).
+        engine (str): CSV parser engine, e.g. "pyarrow". Defaults to None.
+        dtype (dict): Column to dtype mapping applied while parsing. Defaults to None.
+
+    Returns:
+        RegressorMixin: The fitted LinearRegression, or Ridge when alpha is set.
+    """
+    try:
+        moments = RunningMoments()
+        dictionary = CategoryDictionary()
+        categorical_features = None
+        for chunk in ingest_chunks(file_path, chunksize=chunksize, dtype=dtype, engine=engine):
+            if categorical_features is None:
+                numerical_features = list(chunk.select_dtypes(include=np.number).columns)
+                categorical_features = [column for column in chunk.columns if column not in numerical_features]
+                moments = RunningMoments(numerical_features)
+            moments.update(chunk)
+            dictionary.update(chunk, categorical_features)
+        if categorical_features is None:
+            raise ValueError(f"No rows found in {file_path}.")
+
+        # Sorted categories give the same codes as the batch label encoder.
+        dictionary = CategoryDictionary({feature: sorted(dictionary.categories[feature]) for feature in categorical_features})
+        fill_values = pd.Series(moments.mean, index=moments.columns)
+        target_columns = list(target_columns) if target_columns is not None else list(moments.columns)
+        logging.info(f"Learned fill values and categories from {int(moments.count.max())} rows.")
+
+        strategy = StreamingLinearRegressionStrategy(alpha=alpha)
+        chunks = ingest_chunks(file_path, chunksize=chunksize, dtype=dtype, engine=engine)
+        args = (fill_values, dictionary, categorical_features, target_columns, alpha)
+        if max_workers is None:
+            for chunk in chunks:
+                strategy.merge(_accumulate_chunk(chunk, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                running = []
+                for chunk in chunks:
+                    running.append(pool.submit(_accumulate_chunk, chunk, *args))
+                    if len(running) >= 2 * max_workers:
+                        strategy.merge(running.pop(0).result())
+                for future in running:
+                    strategy.merge(future.result())
+
+        trained_model = strategy.to_model()
+        logging.info("Training model completed.")
+        return trained_model
+
+    except Exception as e:
+        logging.warning(f"Error occur while training streaming model: {e}.")
+        raise e
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The modules are imported as in the entry points, from the repository root.
+sys.path.insert(0, ROOT)
+
+DATA_PATH = os.path.join(ROOT, "extracted_data", "StudentsPerformance.csv")
+
+
+@pytest.fixture
+def data_path() -> str:
+    return DATA_PATH
+
+
+@pytest.fixture
+def students() -> pd.DataFrame:
+    return pd.read_csv(DATA_PATH)
+
+
+@pytest.fixture
+def students_with_gaps(tmp_path) -> str:
+    # The real data with a few missing scores and categories, written to a CSV.
+    df = pd.read_csv(DATA_PATH)
+    rng = np.random.default_rng(0)
+    for column in ["math score", "reading score", "gender"]:
+        df.loc[rng.choice(len(df), 25, replace=False), column] = np.nan
+    path = tmp_path / "students_with_gaps.csv"
+    df.to_csv(path, index=False)
+    return str(path)
@@ -0,0 +1,81 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import src.batch_training as batch_training
+from src.batch_training import BatchTrainer, find_files
+
+
+@pytest.fixture
+def files(tmp_path, data_path, students):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in ("a.csv", "b.csv"):
+        shutil.copy(data_path, data_dir / name)
+    students.drop(columns="math score").to_csv(data_dir / "broken.csv", index=False)
+    (data_dir / "notes.txt").write_text("not data")
+    return data_dir
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    monkeypatch.setenv("MLFLOW_DISABLE_AGENT_HINT", "1")
+    return (tmp_path / "mlruns").as_uri()
+
+
+def test_find_files_expands_directories_and_patterns(files):
+    names = [os.path.basename(file) for file in find_files(str(files))]
+
+    assert names == ["a.csv", "b.csv", "broken.csv"]
+    assert find_files(str(files / "[ab].csv")) == [str(files / "a.csv"), str(files / "b.csv")]
+    with pytest.raises(FileNotFoundError):
+        find_files(str(files / "*.parquet"))
+
+
+def test_every_file_trains_in_a_child_run(files, store):
+    from mlflow.tracking import MlflowClient
+
+    client = MlflowClient(store)
+    parent = client.create_run("0")
+    trainer = BatchTrainer(max_workers=2, tracking_uri=store, experiment_id="0", parent_run_id=parent.info.run_id)
+
+    results = trainer.run(find_files(str(files)))
+
+    assert results["status"].tolist() == ["FINISHED", "FINISHED", "FAILED"]
+    assert results.loc[0, "Mean Squared Error"] == pytest.approx(197.37779267360932)
+    assert results.loc[1, "R-Squared"] == pytest.approx(0.16604314438282994)
+    assert results["rows"].tolist()[:2] == [1000, 1000]
+    for run_id in results["run_id"].dropna():
+        assert client.get_run(run_id).data.tags["mlflow.parentRunId"] == parent.info.run_id
+    assert client.get_run(results.loc[2, "run_id"]).info.status == "FAILED"
+    summary = trainer.summary(results)
+    assert (summary["files"], summary["succeeded"], summary["failed"], summary["rows"]) == (3, 2, 1, 2000)
+
+
+def _dying(file_path, tracking_uri, experiment_id, parent_run_id):
+    # Kills its worker on the first attempt, the marker survives the process.
+    marker = f"{file_path}.started"
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return {"file": file_path, "run_id": None, "rows": 1, "seconds": 0.0}
+
+
+@pytest.mark.parametrize("max_attempts, status", [(2, "FINISHED"), (1, "FAILED")])
+def test_dead_workers_are_retried(files, store, monkeypatch, max_attempts, status):
+    monkeypatch.setattr(batch_training, "_train_file", _dying)
+    trainer = BatchTrainer(max_workers=1, tracking_uri=store, max_attempts=max_attempts, mp_context="fork")
+
+    results = trainer.run([str(files / "a.csv")])
+
+    assert results["status"].tolist() == [status]
+    if status == "FAILED":
+        assert "BrokenProcessPool" in results.loc[0, "error"]
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        BatchTrainer(max_workers=0)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.categorical_encoding import CategoryDictionary, UNSEEN_CODE
+from src.feature_engineering import LabelEncodingStrategy, OneHotEncodingStrategy
+
+FEATURES = ["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"]
+
+
+def test_codes_match_scikit_learn_label_encoder(students):
+    from sklearn.preprocessing import LabelEncoder
+
+    codes = CategoryDictionary().fit(students, FEATURES).encode(students, FEATURES)
+
+    assert codes.dtype == np.int8
+    for i, feature in enumerate(FEATURES):
+        np.testing.assert_array_equal(codes[:, i], LabelEncoder().fit_transform(students[feature]))
+
+
+def test_categorical_columns_encode_like_strings(students):
+    dictionary = CategoryDictionary().fit(students, FEATURES)
+    as_categories = students.astype({feature: "category" for feature in FEATURES})
+
+    np.testing.assert_array_equal(dictionary.encode(as_categories, FEATURES), dictionary.encode(students, FEATURES))
+    assert CategoryDictionary().fit(as_categories, FEATURES).to_dict() == dictionary.to_dict()
+
+
+def test_dense_and_sparse_one_hot_match_get_dummies(students):
+    dictionary = CategoryDictionary().fit(students, FEATURES)
+    codes = dictionary.encode(students, FEATURES)
+    expected = pd.get_dummies(students[FEATURES], drop_first=True, prefix_sep="_", dtype=np.float64)
+
+    dense, columns = dictionary.one_hot(codes, FEATURES, drop_first=True)
+    sparse, sparse_columns = dictionary.one_hot_sparse(codes, FEATURES, drop_first=True)
+
+    assert columns == sparse_columns == list(expected.columns)
+    np.testing.assert_array_equal(dense, expected.to_numpy())
+    np.testing.assert_array_equal(sparse.toarray(), dense)
+
+
+@pytest.mark.parametrize("dtype", [object, "category"])
+def test_unseen_labels_raise_or_are_reserved(students, dtype):
+    dictionary = CategoryDictionary().fit(students.iloc[:10], ["gender"])
+    batch = pd.DataFrame({"gender": ["male", "other", None, "female"]}, dtype=dtype)
+
+    with pytest.raises(ValueError, match="unseen"):
+        dictionary.encode(batch, ["gender"])
+    np.testing.assert_array_equal(dictionary.encode(batch, ["gender"], handle_unknown="reserve")[:, 0], [1, UNSEEN_CODE, UNSEEN_CODE, 0])
+
+
+def test_update_appends_new_categories_keeping_codes():
+    dictionary = CategoryDictionary().fit(pd.DataFrame({"c": ["b", "a"]}), ["c"])
+    dictionary.update(pd.DataFrame({"c": ["c", "a", "0"]}), ["c"])
+
+    assert dictionary.to_dict() == {"c": ["a", "b", "0", "c"]}
+    np.testing.assert_array_equal(dictionary.encode(pd.DataFrame({"c": ["a", "b", "c"]}), ["c"])[:, 0], [0, 1, 3])
+
+
+def test_shared_dictionary_is_used_by_both_encoders(students):
+    dictionary = CategoryDictionary()
+    label = LabelEncodingStrategy(FEATURES, dictionary=dictionary).fit(students)
+    one_hot = OneHotEncodingStrategy(FEATURES, dictionary=dictionary)
+
+    encoded = one_hot.transform(students)
+
+    assert label.dictionary is one_hot.dictionary
+    assert list(encoded.columns[-3:]) == ["parental level of education_some high school", "lunch_standard", "test preparation course_none"]
+    assert encoded.shape == (len(students), 3 + sum(students[feature].nunique() - 1 for feature in FEATURES))
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_splitting import KFoldSplit, RepeatedKFoldSplit, StratifiedBucketKFoldSplit
+from src.cross_validation import CrossValidator
+from steps.cross_validation_step import cross_validate
+
+TARGETS = ["math score"]
+
+
+@pytest.fixture
+def scores(students):
+    return students[["math score", "reading score", "writing score"]].astype(np.float64)
+
+
+@pytest.mark.parametrize("strategy, n_folds", [
+    (KFoldSplit(n_splits=5), 5),
+    (RepeatedKFoldSplit(n_splits=4, n_repeats=2), 8),
+    (StratifiedBucketKFoldSplit(n_splits=5, n_buckets=4), 5),
+])
+def test_test_folds_partition_the_rows(scores, strategy, n_folds):
+    folds = strategy.split(scores, TARGETS)
+
+    assert len(folds) == n_folds
+    for repeat in range(0, n_folds, strategy.n_splits):
+        test_rows = np.concatenate([test_idx for _, test_idx in folds.folds[repeat:repeat + strategy.n_splits]])
+        np.testing.assert_array_equal(np.sort(test_rows), np.arange(len(scores)))
+    for train_idx, test_idx in folds:
+        assert len(np.intersect1d(train_idx, test_idx)) == 0
+        assert len(train_idx) + len(test_idx) == len(scores)
+
+
+def test_folds_share_one_matrix_and_materialize_the_right_rows(scores):
+    folds = KFoldSplit(n_splits=3).split(scores, TARGETS)
+    train_idx, test_idx = folds.folds[1]
+
+    X_train, X_test, y_train, y_test = folds.materialize(1)
+
+    assert folds.X.shape == (len(scores), 2) and folds.y.shape == (len(scores), 1)
+    np.testing.assert_array_equal(X_test.to_numpy(), scores.iloc[test_idx][["reading score", "writing score"]].to_numpy())
+    np.testing.assert_array_equal(y_train.to_numpy(), scores.iloc[train_idx][TARGETS].to_numpy())
+    assert list(X_train.columns) == folds.feature_columns
+
+
+def test_stratified_buckets_spread_evenly(scores):
+    strategy = StratifiedBucketKFoldSplit(n_splits=5, n_buckets=4)
+    folds = strategy.split(scores, TARGETS)
+    buckets = strategy._groups(folds.y)
+
+    shares = [np.bincount(buckets[test_idx], minlength=4) / len(test_idx) for _, test_idx in folds]
+    assert np.ptp(shares, axis=0).max() < 0.02
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_fold_metrics_match_scikit_learn(scores, executor):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.model_selection import KFold, cross_val_score
+
+    folds = KFoldSplit(n_splits=5).split(scores, TARGETS)
+    results = CrossValidator(max_workers=2, executor=executor).evaluate(folds)
+
+    X, y = scores[["reading score", "writing score"]], scores[TARGETS]
+    expected = cross_val_score(LinearRegression(), X, y, cv=KFold(5, shuffle=True, random_state=42), scoring="r2")
+    np.testing.assert_allclose(results["R-Squared"].to_numpy(), expected)
+
+
+def test_step_summarizes_folds_and_rejects_unknown_strategy(scores):
+    summary = cross_validate(scores, TARGETS, strategy="repeated_kfold", n_splits=3, n_repeats=2)
+
+    assert set(summary) == {"Mean Squared Error", "Mean Squared Error (std)", "R-Squared", "R-Squared (std)"}
+    assert summary["Mean Squared Error (std)"] > 0
+    with pytest.raises(ValueError):
+        cross_validate(scores, TARGETS, strategy="leave_one_out")
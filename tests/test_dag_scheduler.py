@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from src.dag_scheduler import Node, DAGScheduler
+from pipelines.training_pipeline import training_nodes, select_features
+from steps.data_ingestion_step import ingest
+from steps.data_cleaning_step import clean
+from steps.data_transforming_step import transform
+from steps.data_splitting_step import split
+from steps.model_training_step import train
+from steps.model_evaluator_step import evaluate
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA
+
+
+def add(a, b):
+    return a + b
+
+
+def split_pair(x):
+    return x, 2 * x
+
+
+def test_nodes_run_in_dependency_order_and_unpack_outputs():
+    scheduler = DAGScheduler([
+        Node("total", add, inputs=["left", "right"]),
+        Node("pair", split_pair, inputs=["x"], outputs=["left", "right"]),
+        Node("shifted", add, inputs={"b": "total", "a": "x"}, outputs=["result"]),
+    ])
+
+    values = scheduler.run({"x": 5})
+
+    assert (values["left"], values["right"], values["total"], values["result"]) == (5, 10, 15, 20)
+    assert scheduler.dependencies("shifted") == ["total"]
+    assert scheduler.report()["critical_path"] == ["pair", "total", "shifted"]
+
+
+def test_independent_nodes_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_sibling(x):
+        # Deadlocks (and times out) unless both nodes run at the same time.
+        barrier.wait()
+        return x
+
+    scheduler = DAGScheduler([
+        Node("a", wait_for_sibling, inputs=["x"]),
+        Node("b", wait_for_sibling, inputs=["x"]),
+        Node("c", add, inputs=["a", "b"]),
+    ], max_workers=2)
+
+    assert scheduler.run({"x": 1})["c"] == 2
+
+
+def test_critical_path_follows_the_slowest_chain():
+    def slow(x):
+        time.sleep(0.2)
+        return x
+
+    scheduler = DAGScheduler([
+        Node("fast", add, inputs=["x", "x"]),
+        Node("slow", slow, inputs=["x"]),
+        Node("join", add, inputs=["fast", "slow"]),
+    ])
+    scheduler.run({"x": 1})
+
+    report = scheduler.report()
+    assert report["critical_path"] == ["slow", "join"]
+    assert report["critical_path_seconds"] >= 0.2
+
+
+def test_process_executor_runs_module_level_steps():
+    scheduler = DAGScheduler([Node("pair", split_pair, inputs=["x"], outputs=["left", "right"])], executor="process", max_workers=1)
+    assert scheduler.run({"x": 3})["right"] == 6
+
+
+def test_failing_node_raises():
+    def fail(x):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        DAGScheduler([Node("fail", fail, inputs=["x"]), Node("after", add, inputs=["fail", "x"])]).run({"x": 1})
+
+
+@pytest.mark.parametrize("nodes, message", [
+    ([Node("a", add, inputs=["b", "x"]), Node("b", add, inputs=["a", "x"])], "cycle"),
+    ([Node("a", add), Node("a", add)], "Duplicate"),
+    ([Node("a", add, outputs=["v"]), Node("b", add, outputs=["v"])], "produced by both"),
+])
+def test_invalid_graphs_are_rejected(nodes, message):
+    with pytest.raises(ValueError, match=message):
+        DAGScheduler(nodes)
+
+
+def test_missing_graph_input_is_reported():
+    with pytest.raises(ValueError, match="Missing graph inputs"):
+        DAGScheduler([Node("a", add, inputs=["x", "y"])]).run({"x": 1})
+
+
+def test_training_graph_matches_the_sequential_steps(data_path):
+    df_cleaned = clean(ingest(data_path, schema=STUDENT_PERFORMANCE_SCHEMA))
+    numerical_features, categorical_features = select_features(df_cleaned)
+    df_transformed = transform(df_cleaned, strategy="label_encoding", features=categorical_features)
+    X_train, X_test, y_train, y_test = split(df_transformed, numerical_features)
+    expected = evaluate(train(X_train, y_train), X_test, y_test)
+
+    values = DAGScheduler(training_nodes(), max_workers=2).run({"file_path": data_path})
+
+    assert values["evaluation_metrics"] == expected
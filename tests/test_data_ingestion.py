@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_ingestion import IngestData
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA
+
+
+@pytest.mark.parametrize("engine", [None, "c", "python"])
+def test_iter_chunks_have_fixed_size_and_cover_every_row(data_path, engine):
+    chunks = list(IngestData(data_path, engine=engine).iter_chunks(chunksize=300))
+
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), pd.read_csv(data_path))
+
+
+def test_iter_chunks_rejects_non_positive_chunksize(data_path):
+    with pytest.raises(ValueError):
+        next(IngestData(data_path).iter_chunks(chunksize=0))
+
+
+@pytest.mark.parametrize("engine", [None, "pyarrow"])
+def test_iter_chunks_apply_dtypes_with_missing_scores(students_with_gaps, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    ingest = IngestData(students_with_gaps, dtype=STUDENT_PERFORMANCE_SCHEMA.chunk_dtypes(), engine=engine)
+
+    chunks = list(ingest.iter_chunks(chunksize=400))
+
+    df = pd.concat(chunks, ignore_index=True)
+    expected = pd.read_csv(students_with_gaps)
+    assert [len(chunk) for chunk in chunks] == [400, 400, 200]
+    for chunk in chunks:
+        assert chunk["math score"].dtype == np.float32
+        assert isinstance(chunk["gender"].dtype, pd.CategoricalDtype)
+    assert df["math score"].isna().sum() == expected["math score"].isna().sum() == 25
+    np.testing.assert_array_equal(df["reading score"].to_numpy(dtype=np.float64), expected["reading score"].to_numpy())
+    pd.testing.assert_series_equal(df["gender"].astype(object), expected["gender"].astype(object))
+
+
+def test_iter_appended_reads_only_complete_new_rows(tmp_path, data_path):
+    path = tmp_path / "growing.csv"
+    lines = open(data_path).read().splitlines(keepends=True)
+    path.write_text("".join(lines[:11]))
+    ingest = IngestData(str(path))
+
+    blocks = list(ingest.iter_appended(block_bytes=64))
+    columns = list(blocks[0][0].columns)
+    offset = blocks[-1][1]
+    assert sum(len(block) for block, _ in blocks) == 10
+
+    # A row still being written is left for the next read.
+    with open(path, "a") as f:
+        f.write("".join(lines[11:13]) + lines[13][:10])
+    appended = list(ingest.iter_appended(offset, columns=columns))
+    assert sum(len(block) for block, _ in appended) == 2
+    assert appended[-1][1] == offset + len("".join(lines[11:13]).encode())
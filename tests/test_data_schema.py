@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA, DataSchema, bytes_per_row, compact_float_dtype, restore_compact_dtypes
+from steps.data_ingestion_step import ingest, ingest_chunks
+
+SCORES = STUDENT_PERFORMANCE_SCHEMA.numeric
+
+
+def test_schema_stores_compact_dtypes_with_the_same_values(students):
+    df = STUDENT_PERFORMANCE_SCHEMA.apply(students)
+
+    assert all(df[column].dtype == np.int8 for column in SCORES)
+    assert all(isinstance(df[column].dtype, pd.CategoricalDtype) for column in STUDENT_PERFORMANCE_SCHEMA.categorical)
+    pd.testing.assert_frame_equal(df.astype(students.dtypes.to_dict()), students)
+    assert bytes_per_row(df) < bytes_per_row(students) / 5
+
+
+def test_missing_values_and_fractions_become_float32(students_with_gaps):
+    df = ingest(students_with_gaps, schema=STUDENT_PERFORMANCE_SCHEMA)
+    fractions = STUDENT_PERFORMANCE_SCHEMA.apply(pd.read_csv(students_with_gaps).fillna({"math score": 0.5, "gender": "female"}))
+
+    assert df["math score"].dtype == np.float32 and df["math score"].isna().sum() == 25
+    assert fractions["math score"].dtype == np.float32 and fractions["writing score"].dtype == np.int8
+
+
+def test_chunks_parsed_with_the_schema_agree_on_dtypes(students_with_gaps):
+    chunks = list(ingest_chunks(students_with_gaps, chunksize=300, schema=STUDENT_PERFORMANCE_SCHEMA))
+
+    assert len({tuple(map(str, chunk.dtypes)) for chunk in chunks}) == 1
+    assert STUDENT_PERFORMANCE_SCHEMA.chunk_dtypes() == {
+        **{column: "category" for column in STUDENT_PERFORMANCE_SCHEMA.categorical},
+        **{column: "float32" for column in SCORES},
+    }
+    assert sum(chunk["math score"].isna().sum() for chunk in chunks) == 25
+
+
+def test_validation_errors(students):
+    with pytest.raises(ValueError, match="missing"):
+        STUDENT_PERFORMANCE_SCHEMA.validate(students.drop(columns="lunch"))
+    with pytest.raises(ValueError, match="not in the schema"):
+        DataSchema(["gender"], SCORES, strict=True).validate(students)
+    with pytest.raises(TypeError):
+        STUDENT_PERFORMANCE_SCHEMA.validate(students.astype({"math score": str}))
+    assert repr(DataSchema(["a"], ["b"])) == repr(DataSchema(["a"], ["b"]))
+
+
+@pytest.mark.parametrize("dtype, expected", [
+    (np.int8, np.float32), ("Int16", np.float32), (np.float32, np.float32),
+    (np.int32, np.float64), (np.float64, np.float64), (object, None), (bool, None),
+])
+def test_compact_float_dtype(dtype, expected):
+    assert compact_float_dtype(pd.Series([1], dtype=dtype).dtype) == (np.dtype(expected) if expected else None)
+
+
+def test_restore_compact_dtypes_undoes_float64_upcasts():
+    source = pd.DataFrame({"small": np.array([1, 2], dtype=np.int8), "wide": np.array([1, 2], dtype=np.int64)})
+    computed = source.astype(np.float64) / 2
+
+    restored = restore_compact_dtypes(computed, source)
+
+    assert restored["small"].dtype == np.float32 and restored["wide"].dtype == np.float64
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fast_predictor import FastLinearPredictor, compile_predictor
+from src.feature_engineering import (
+    FeatureEngineer,
+    FeatureEngineeringPipeline,
+    FeatureEngineeringStrategy,
+    LabelEncodingStrategy,
+    LogTransformationStrategy,
+    MinMaxScalingStrategy,
+    OneHotEncodingStrategy,
+    StandardScalingStrategy,
+)
+
+CATEGORIES = ["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"]
+NUMBERS = ["reading score", "writing score"]
+TARGETS = ["math score"]
+
+
+def _fit(students, strategy):
+    from sklearn.linear_model import LinearRegression
+
+    engineer = FeatureEngineer(strategy).fit(students)
+    model = LinearRegression().fit(engineer.transform(students).drop(columns=TARGETS), students[TARGETS])
+    return engineer, model
+
+
+CHAINS = {
+    "label": lambda: LabelEncodingStrategy(CATEGORIES, handle_unknown="reserve"),
+    "one_hot_scaled": lambda: FeatureEngineeringPipeline([
+        LogTransformationStrategy(NUMBERS), StandardScalingStrategy(NUMBERS), OneHotEncodingStrategy(CATEGORIES),
+    ]),
+    "min_max_label": lambda: FeatureEngineeringPipeline([
+        MinMaxScalingStrategy(NUMBERS), LabelEncodingStrategy(CATEGORIES), StandardScalingStrategy(CATEGORIES[:2]),
+    ]),
+    "scaled_before_log": lambda: FeatureEngineeringPipeline([
+        MinMaxScalingStrategy(NUMBERS), LogTransformationStrategy(NUMBERS), StandardScalingStrategy(NUMBERS), LabelEncodingStrategy(CATEGORIES),
+    ]),
+}
+
+
+@pytest.mark.parametrize("chain", list(CHAINS))
+def test_compiled_predictions_match_the_model(students, tmp_path, chain):
+    engineer, model = _fit(students, CHAINS[chain]())
+    expected = model.predict(engineer.transform(students).drop(columns=TARGETS))
+    records = students.drop(columns=TARGETS).to_dict(orient="records")
+
+    predictor = compile_predictor(model, engineer, target_columns=TARGETS)
+    path = str(tmp_path / "predictor.npz")
+    predictor.save(path)
+    loaded = FastLinearPredictor.load(path)
+
+    np.testing.assert_allclose(predictor.predict(records), expected, rtol=1e-6)
+    np.testing.assert_allclose(loaded.predict({column: students[column].tolist() for column in loaded.input_columns}), expected, rtol=1e-6)
+    np.testing.assert_allclose(loaded.predict_one(records[7]), expected[7], rtol=1e-6)
+
+
+def test_single_target_models_predict_one_dimension(students):
+    from sklearn.linear_model import LinearRegression
+
+    engineer = FeatureEngineer(LabelEncodingStrategy(CATEGORIES)).fit(students)
+    X = engineer.transform(students)[CATEGORIES + NUMBERS]
+    model = LinearRegression().fit(X, students["math score"])
+
+    prediction = compile_predictor(model, engineer).predict(students[CATEGORIES + NUMBERS].to_dict(orient="records"))
+
+    assert prediction.shape == (len(students),)
+    np.testing.assert_allclose(prediction, model.predict(X), rtol=1e-6)
+
+
+def test_unseen_labels_follow_the_encoder(students):
+    record = dict(students.drop(columns=TARGETS).iloc[0].to_dict(), gender="other")
+    reserving = compile_predictor(*reversed(_fit(students, LabelEncodingStrategy(CATEGORIES, handle_unknown="reserve"))))
+    strict = compile_predictor(*reversed(_fit(students, LabelEncodingStrategy(CATEGORIES))))
+
+    assert np.isfinite(reserving.predict([record])).all()
+    with pytest.raises(ValueError, match="unseen"):
+        strict.predict([record])
+    with pytest.raises(ValueError, match="unseen"):
+        strict.predict_one(record)
+
+
+def test_chains_with_two_log_transformations_are_value_errors(students):
+    strategy = FeatureEngineeringPipeline([LogTransformationStrategy(NUMBERS), LogTransformationStrategy(NUMBERS)])
+    engineer, model = _fit(students.drop(columns=CATEGORIES), strategy)
+
+    with pytest.raises(ValueError):
+        compile_predictor(model, engineer)
+
+
+def test_unsupported_models_and_stages_are_type_errors(students):
+    from sklearn.ensemble import RandomForestRegressor
+
+    class Clip(FeatureEngineeringStrategy):
+        features = NUMBERS
+
+        def fit(self, df):
+            return self
+
+        def transform(self, df):
+            return df.clip(upper=90)
+
+    engineer, model = _fit(students.drop(columns=CATEGORIES), LogTransformationStrategy(NUMBERS))
+    with pytest.raises(TypeError):
+        compile_predictor(model, FeatureEngineer(Clip()))
+    with pytest.raises(TypeError):
+        compile_predictor(RandomForestRegressor(n_estimators=2).fit(students[NUMBERS], students["math score"]))
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import (
+    FeatureEngineer,
+    FeatureEngineeringPipeline,
+    LogTransformationStrategy,
+    StandardScalingStrategy,
+    OneHotEncodingStrategy,
+)
+
+SCORES = ["math score", "reading score", "writing score"]
+CATEGORIES = ["gender", "lunch"]
+
+
+def _stages():
+    return [LogTransformationStrategy(SCORES), StandardScalingStrategy(SCORES), OneHotEncodingStrategy(CATEGORIES)]
+
+
+def _by_hand(df: pd.DataFrame) -> pd.DataFrame:
+    for stage in _stages():
+        df = stage.fit_transform(df)
+    return df
+
+
+@pytest.mark.parametrize("mode", ["copy", "inplace", "cow"])
+def test_every_mode_equals_chaining_by_hand(students, mode):
+    before = students.copy()
+
+    result = FeatureEngineeringPipeline(_stages(), mode=mode).fit_transform(students)
+
+    pd.testing.assert_frame_equal(result, _by_hand(students))
+    # Even the in-place mode writes into its own copy of the input.
+    pd.testing.assert_frame_equal(students, before)
+
+
+def test_fitted_pipeline_transforms_new_data_with_the_train_state(students):
+    train, test = students.iloc[:700], students.iloc[700:]
+    pipeline = FeatureEngineeringPipeline(_stages(), mode="cow").fit(train)
+
+    expected = test
+    for stage in pipeline.strategies:
+        expected = stage.transform(expected)
+    pd.testing.assert_frame_equal(pipeline.transform(test), expected)
+    # The stages go back to their own copy mode after a run.
+    assert all(stage.copy_mode == "deep" for stage in pipeline.strategies)
+
+
+def test_pipeline_round_trips_through_save_and_load(tmp_path, students):
+    engineer = FeatureEngineer(FeatureEngineeringPipeline(_stages(), mode="inplace"))
+    engineer.fit(students.iloc[:700])
+    path = str(tmp_path / "pipeline.json")
+    engineer.save(path)
+
+    loaded = FeatureEngineer.load(path)
+
+    pd.testing.assert_frame_equal(loaded.transform(students.iloc[700:]), engineer.transform(students.iloc[700:]))
+
+
+def test_track_memory_reports_a_peak(students):
+    pipeline = FeatureEngineeringPipeline(_stages(), mode="copy", track_memory=True)
+    pipeline.fit_transform(students)
+
+    assert pipeline.peak_memory_ > 0
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        FeatureEngineeringPipeline(_stages(), mode="zero-copy")
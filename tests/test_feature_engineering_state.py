@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import (
+    FeatureEngineer,
+    StandardScalingStrategy,
+    MinMaxScalingStrategy,
+    LabelEncodingStrategy,
+    OneHotEncodingStrategy,
+    LogTransformationStrategy,
+)
+
+SCORES = ["math score", "reading score", "writing score"]
+CATEGORIES = ["gender", "race/ethnicity", "lunch"]
+
+
+def _strategies():
+    return {
+        "standard": lambda: StandardScalingStrategy(SCORES),
+        "minmax": lambda: MinMaxScalingStrategy(SCORES, feature_range=(-1, 1)),
+        "label": lambda: LabelEncodingStrategy(CATEGORIES),
+        "one_hot": lambda: OneHotEncodingStrategy(CATEGORIES),
+    }
+
+
+@pytest.fixture(params=list(_strategies()))
+def make_strategy(request):
+    return _strategies()[request.param]
+
+
+def test_transform_uses_the_state_fitted_on_other_data(students, make_strategy):
+    train, test = students.iloc[:800], students.iloc[800:]
+
+    fitted = make_strategy().fit(train)
+    transformed = fitted.transform(test)
+
+    expected = make_strategy().fit(pd.concat([train, test])).transform(test) if isinstance(fitted, (LabelEncodingStrategy, OneHotEncodingStrategy)) else None
+    if expected is None:
+        # The scalers keep the train statistics instead of learning the test ones.
+        assert not np.allclose(transformed[SCORES], make_strategy().fit_transform(test)[SCORES])
+    else:
+        # Every category appears in the train rows, so the codes are those of the whole data.
+        pd.testing.assert_frame_equal(transformed, expected)
+
+
+def test_saved_engineer_transforms_like_the_fitted_one(tmp_path, students, make_strategy):
+    train, test = students.iloc[:800], students.iloc[800:]
+    engineer = FeatureEngineer(make_strategy())
+    engineer.fit(train)
+    path = str(tmp_path / "features.json")
+
+    engineer.save(path)
+
+    pd.testing.assert_frame_equal(FeatureEngineer.load(path).transform(test), engineer.transform(test))
+
+
+def test_scalers_match_scikit_learn(students):
+    from sklearn.preprocessing import StandardScaler, MinMaxScaler
+
+    standard = StandardScalingStrategy(SCORES).fit_transform(students)
+    minmax = MinMaxScalingStrategy(SCORES).fit_transform(students)
+
+    np.testing.assert_allclose(standard[SCORES], StandardScaler().fit_transform(students[SCORES]))
+    np.testing.assert_allclose(minmax[SCORES], MinMaxScaler().fit_transform(students[SCORES]))
+
+
+def test_unfitted_strategies_raise_before_transform_and_get_state(students, make_strategy):
+    strategy = make_strategy()
+
+    with pytest.raises(ValueError, match="fit"):
+        strategy.get_state()
+    with pytest.raises(ValueError, match="fit"):
+        strategy.transform(students)
+
+
+def test_stateless_strategy_has_empty_state(students):
+    strategy = LogTransformationStrategy(SCORES)
+
+    assert strategy.get_state() == {}
+    np.testing.assert_allclose(strategy.transform(students)[SCORES], np.log1p(students[SCORES]))
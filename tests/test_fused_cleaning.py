@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA
+from src.fused_cleaning import FusedCleaningEngine
+from steps.data_cleaning_step import clean
+
+FRAMES = ["students", "students_schema", "students_gaps", "students_gaps_schema", "int64_whole_bounds", "int_fractional_bounds", "float32_gaps"]
+
+
+def _frames(students: pd.DataFrame) -> dict:
+    rng = np.random.default_rng(0)
+    with_gaps = students.copy()
+    with_gaps.loc[::13, "math score"] = np.nan
+    return {
+        "students": students,
+        "students_schema": STUDENT_PERFORMANCE_SCHEMA.apply(students),
+        "students_gaps": with_gaps,
+        "students_gaps_schema": STUDENT_PERFORMANCE_SCHEMA.apply(with_gaps),
+        # Outliers are capped to whole 1%/99% bounds.
+        "int64_whole_bounds": pd.DataFrame({"a": rng.integers(0, 100, 1000), "b": rng.integers(0, 10, 1000), "c": rng.choice(["x", "y"], 1000)}),
+        # Interpolated bounds are fractions, so the capped columns become floats.
+        "int_fractional_bounds": pd.DataFrame({"a": np.array([0, 3, 7, 10, 20, 30, 1000], dtype=np.int64), "b": np.array([1, 2, 3, 4, 5, 6, 90], dtype=np.int8)}),
+        "float32_gaps": pd.DataFrame({"a": np.array([1.5, np.nan, 2.5, 3.0, 400.0, 2.0], dtype=np.float32), "b": [1.0, 2.0, np.nan, 4.0, 5.0, 6.0]}),
+    }
+
+
+@pytest.fixture(params=FRAMES)
+def frame(request, students):
+    return _frames(students)[request.param]
+
+
+def test_fused_cleaning_equals_the_unfused_steps(frame):
+    pd.testing.assert_frame_equal(clean(frame), clean(frame, fused=False))
+
+
+def test_fused_median_equals_the_unfused_strategies(frame):
+    from src.handling_missing_value import MissingValueHandler, FillMissingValueStrategy
+    from src.outlier_detection import OutlierDetector, IQROutlierDetectionStrategy
+
+    expected = MissingValueHandler(FillMissingValueStrategy(method="median")).handle(frame)
+    numerical_features = expected.select_dtypes(include=np.number).columns
+    detector = OutlierDetector(IQROutlierDetectionStrategy())
+    if detector.detect(expected[numerical_features]):
+        expected[numerical_features] = detector.handle(expected[numerical_features], method="cap")
+
+    pd.testing.assert_frame_equal(FusedCleaningEngine(method="median").clean(frame), expected)
+
+
+def test_fused_cleaning_leaves_the_input_untouched(frame):
+    before = frame.copy()
+    clean(frame)
+    pd.testing.assert_frame_equal(frame, before)
+
+
+def test_unsupported_fill_method_is_rejected():
+    with pytest.raises(ValueError):
+        FusedCleaningEngine(method="mode")
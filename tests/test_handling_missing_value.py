@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.handling_missing_value import KNNImputationStrategy
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.normal(size=300),
+        "b": rng.normal(size=300),
+        "c": rng.normal(size=300).astype(np.float32),
+        "id": np.arange(300, dtype=np.int64),
+        "group": rng.choice(["x", "y"], size=300),
+    })
+    df.loc[rng.choice(300, 20, replace=False), "a"] = np.nan
+    df.loc[rng.choice(300, 20, replace=False), "c"] = np.nan
+    return df
+
+
+def _brute_force(df: pd.DataFrame, features: list, k: int) -> np.ndarray:
+    # The mean of the k complete rows closest in plain Euclidean distance over the observed columns.
+    block = df[features].to_numpy(dtype=np.float64)
+    missing = np.isnan(block)
+    complete = block[~missing.any(axis=1)]
+    for row in np.flatnonzero(missing.any(axis=1)):
+        observed = ~missing[row]
+        distances = np.sqrt(((complete[:, observed] - block[row, observed]) ** 2).sum(axis=1))
+        block[row, ~observed] = complete[np.argsort(distances)[:k]][:, ~observed].mean(axis=0)
+    return block
+
+
+def test_fills_with_the_nearest_complete_rows(frame):
+    features = ["a", "b", "c", "id"]
+
+    result = KNNImputationStrategy(n_neighbors=3, features=features, chunk_size=7).handle(frame)
+
+    np.testing.assert_allclose(result[features].to_numpy(dtype=np.float64), _brute_force(frame, features, 3), rtol=1e-6)
+    assert not result[features].isna().any().any()
+
+
+def test_columns_without_gaps_keep_their_dtype(frame):
+    result = KNNImputationStrategy(n_neighbors=3).handle(frame)
+
+    assert result.dtypes.to_dict() == frame.dtypes.to_dict()
+    pd.testing.assert_series_equal(result["id"], frame["id"])
+    pd.testing.assert_series_equal(result["b"], frame["b"])
+
+
+def test_distance_weights_give_exact_matches_all_the_weight():
+    df = pd.DataFrame({"a": [0.0, 1.0, 5.0, 0.0], "b": [10.0, 20.0, 30.0, np.nan]})
+
+    uniform = KNNImputationStrategy(n_neighbors=2).handle(df)
+    weighted = KNNImputationStrategy(n_neighbors=2, weights="distance").handle(df)
+
+    assert uniform.loc[3, "b"] == 15.0
+    assert weighted.loc[3, "b"] == 10.0
+
+
+def test_rejects_data_without_complete_rows_and_bad_options():
+    with pytest.raises(ValueError, match="No complete rows"):
+        KNNImputationStrategy().handle(pd.DataFrame({"a": [1.0, np.nan], "b": [np.nan, 2.0]}))
+    with pytest.raises(ValueError):
+        KNNImputationStrategy(weights="gaussian")
+    with pytest.raises(ValueError):
+        KNNImputationStrategy(algorithm="brute")
\ No newline at end of file
@@ -0,0 +1,102 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipelines.training_pipeline import incremental_train_pipeline
+from src.feature_engineering import FeatureEngineer
+from src.incremental_training import IncrementalTrainer
+from src.mlflow_logger import MLflowLogger
+
+TARGETS = ["math score", "reading score", "writing score"]
+
+
+class RecordingTracker(MLflowLogger):
+    def __init__(self):
+        self.metrics, self.artifacts, self.models = {}, {}, []
+
+    def get_tracking_uri(self) -> str:
+        return "http://tracking.example"
+
+    def log_metric(self, key, value, step=None):
+        self.metrics[key] = value
+
+    def log_artifact(self, local_path, artifact_path=None):
+        with open(local_path) as f:
+            self.artifacts[f"{artifact_path}/{os.path.basename(local_path)}"] = json.load(f)
+
+    def log_model(self, model, name="model", registered_model_name=None):
+        self.models.append((name, registered_model_name, model))
+
+
+def _write(path, frame):
+    frame.to_csv(path, index=False)
+
+
+def _append(path, frame):
+    frame.to_csv(path, index=False, header=False, mode="a")
+
+
+def test_appended_rows_give_the_full_refit(tmp_path, students):
+    from sklearn.linear_model import LinearRegression
+
+    data_path, state_path = str(tmp_path / "data.csv"), str(tmp_path / "state.pkl")
+    _write(data_path, students.iloc[:600])
+    first = IncrementalTrainer()
+    first.update(data_path)
+    first.save(state_path)
+    _append(data_path, students.iloc[600:])
+
+    trainer = IncrementalTrainer.load(state_path)
+    report = trainer.update(data_path)
+
+    assert (report["new_rows"], report["total_rows"]) == (400, 1000)
+    assert {"Mean Squared Error", "R-Squared"} <= set(report)
+    X = pd.DataFrame({feature: pd.Index(trainer.dictionary.categories[feature]).get_indexer(students[feature]) for feature in trainer.categorical_features})
+    expected = LinearRegression().fit(X, students[TARGETS])
+    np.testing.assert_allclose(trainer.model().coef_, expected.coef_, rtol=1e-8)
+    assert trainer.update(data_path)["new_rows"] == 0
+
+
+def test_rewritten_file_retrains_from_the_first_row(tmp_path, students):
+    data_path = str(tmp_path / "data.csv")
+    _write(data_path, students.iloc[:500])
+    trainer = IncrementalTrainer()
+    trainer.update(data_path)
+
+    _write(data_path, students.iloc[500:])
+
+    assert trainer.update(data_path) == {"new_rows": 500, "total_rows": 500}
+
+
+def test_pipeline_logs_the_serving_state_next_to_the_model(tmp_path, students):
+    data_path, state_path = str(tmp_path / "data.csv"), str(tmp_path / "state.pkl")
+    _write(data_path, students.iloc[:600])
+    first = RecordingTracker()
+    incremental_train_pipeline(data_path, state_path, tracker=first)
+    _append(data_path, students.iloc[600:])
+
+    tracker = RecordingTracker()
+    report = incremental_train_pipeline(data_path, state_path, tracker=tracker)
+
+    assert "prev_model_R2_on_new_rows" not in first.metrics
+    assert tracker.metrics["prev_model_MSE_on_new_rows"] == report["Mean Squared Error"]
+    assert tracker.metrics["prev_model_R2_on_new_rows"] == report["R-Squared"]
+    assert not {"MSE", "R2"} & set(tracker.metrics)
+    (name, registered_name, model), = tracker.models
+    assert (name, registered_name) == ("model", "IncrementalLinearRegressionModel")
+
+    state = tracker.artifacts["transform/incremental_state.json"]
+    assert state["target_columns"] == TARGETS and state["feature_columns"] == list(model.feature_names_in_)
+    path = tmp_path / "transform_state.json"
+    path.write_text(json.dumps(tracker.artifacts["transform/transform_state.json"]))
+    X = FeatureEngineer.load(str(path)).transform(students)[state["feature_columns"]]
+    trainer = IncrementalTrainer.load(state_path)
+    np.testing.assert_allclose(model.predict(X), trainer.model().predict(trainer._prepare(students)[0]))
+
+
+def test_serving_state_needs_consumed_rows(tmp_path):
+    with pytest.raises(ValueError):
+        IncrementalTrainer().save_serving_state(str(tmp_path))
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fast_predictor import compile_predictor
+from src.feature_engineering import FeatureEngineer, LabelEncodingStrategy
+from src.inference_server import BatchPredictor, InferenceServer
+
+FEATURES = ["gender", "lunch", "reading score"]
+TARGETS = ["math score"]
+
+
+@pytest.fixture(params=["batch", "fast"])
+def predictor(request, students):
+    from sklearn.linear_model import LinearRegression
+
+    engineer = FeatureEngineer(LabelEncodingStrategy(["gender", "lunch"])).fit(students)
+    model = LinearRegression().fit(engineer.transform(students)[FEATURES], students[TARGETS])
+    if request.param == "batch":
+        return BatchPredictor(model, engineer, TARGETS)
+    return compile_predictor(model, engineer, TARGETS)
+
+
+async def _post(port: int, payload) -> tuple:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+
+def _serve(predictor, *payloads) -> list:
+    async def run():
+        server = InferenceServer(predictor, port=0, max_wait_ms=20)
+        await server.start()
+        try:
+            return await asyncio.gather(*(_post(server.port, payload) for payload in payloads))
+        finally:
+            await server.stop()
+
+    return asyncio.run(run())
+
+
+def test_concurrent_requests_are_batched_and_answered_in_order(predictor, students):
+    records = students[FEATURES].iloc[:6].to_dict(orient="records")
+
+    responses = _serve(predictor, {"instances": records[:4]}, records[4], [records[5]])
+
+    assert all(status == 200 for status, _ in responses)
+    predictions = [row for _, body in responses for row in body["predictions"]]
+    np.testing.assert_allclose(predictions, predictor.predict(records))
+    assert responses[0][1]["targets"] == TARGETS
+
+
+def test_missing_fields_are_a_bad_request_naming_them(predictor, students):
+    record = students[FEATURES].iloc[0].to_dict()
+    partial = {"gender": record["gender"]}
+
+    (status, body), = _serve(predictor, {"instances": [record, partial]})
+
+    assert status == 400
+    assert body["missing"] == ["lunch", "reading score"]
+    assert "lunch" in body["error"] and "reading score" in body["error"]
+
+
+@pytest.mark.parametrize("payload", [[], {"instances": [1, 2]}, "text"])
+def test_malformed_payloads_are_a_bad_request(predictor, payload):
+    (status, body), = _serve(predictor, payload)
+
+    assert status == 400 and body["error"]
+
+
+def test_unseen_label_is_unprocessable(predictor, students):
+    record = dict(students[FEATURES].iloc[0].to_dict(), gender="other")
+
+    (status, body), = _serve(predictor, record)
+
+    assert status == 422 and "unseen" in body["error"]
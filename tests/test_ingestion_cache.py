@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.ingestion_cache import IngestionCache
+from steps.data_ingestion_step import ingest
+
+pytest.importorskip("pyarrow")
+
+
+def test_key_changes_with_content_and_options(tmp_path, data_path):
+    source = tmp_path / "students.csv"
+    source.write_bytes(open(data_path, "rb").read())
+    cache = IngestionCache(str(tmp_path / "cache"))
+
+    key = cache.key(str(source))
+    assert cache.key(str(source)) == key
+    assert cache.key(str(source), dtype={"gender": "category"}) != key
+
+    with open(source, "a") as f:
+        f.write('"male","group A","high school","standard","none","50","50","50"\n')
+    assert cache.key(str(source)) != key
+
+
+def test_ingest_round_trips_through_the_cache(tmp_path, data_path):
+    cache_dir = str(tmp_path / "cache")
+
+    first = ingest(data_path, cache_dir=cache_dir)
+    cache = IngestionCache(cache_dir)
+    cached = cache.get(cache.key(data_path, dtype=None))
+
+    pd.testing.assert_frame_equal(first, pd.read_csv(data_path))
+    pd.testing.assert_frame_equal(cached, first)
+    pd.testing.assert_frame_equal(ingest(data_path, cache_dir=cache_dir), first)
+
+
+def test_eviction_drops_the_least_recently_used_entry(tmp_path, students):
+    cache = IngestionCache(str(tmp_path / "cache"))
+    cache.put("a", students)
+    cache.max_bytes = cache.size() * 2
+    cache.put("b", students)
+    cache.get("a")
+    cache.put("c", students)
+
+    assert sorted(cache._index["entries"]) == ["a", "c"]
+    assert cache.size() <= cache.max_bytes
+
+
+def test_invalidate_removes_only_the_source_entries(tmp_path, students):
+    cache = IngestionCache(str(tmp_path / "cache"))
+    cache.put("a", students, source="a.csv")
+    cache.put("b", students, source="b.csv")
+
+    assert cache.invalidate("a.csv") == 1
+    assert cache.get("a") is None
+    assert not os.path.exists(cache._entry_path("a"))
+    pd.testing.assert_frame_equal(cache.get("b"), students)
+
+
+def test_cached_frame_is_writable(tmp_path, students):
+    cache = IngestionCache(str(tmp_path / "cache"))
+    cache.put("a", students)
+
+    cached = cache.get("a")
+    cached.loc[0, "math score"] = 0
+
+    assert cached.loc[0, "math score"] == 0
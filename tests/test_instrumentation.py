@@ -0,0 +1,106 @@
+import json
+import os
+import pstats
+import threading
+
+import numpy as np
+import pytest
+
+from src.instrumentation import StepProfiler, instrumented
+from src.mlflow_logger import MLflowLogger
+from steps.data_cleaning_step import clean
+from steps.data_transforming_step import transform
+
+
+@instrumented("allocate")
+def allocate(n_bytes: int) -> np.ndarray:
+    return np.ones(n_bytes // 8)
+
+
+class RecordingTracker(MLflowLogger):
+    def __init__(self):
+        self.metrics, self.dicts, self.artifacts = [], {}, []
+
+    def log_metric(self, key, value, step=None):
+        self.metrics.append((key, value, step))
+
+    def log_dict(self, dictionary, artifact_file):
+        self.dicts[artifact_file] = dictionary
+
+    def log_artifact(self, local_path, artifact_path=None):
+        self.artifacts.append((local_path, artifact_path))
+
+
+def test_calls_are_only_measured_under_an_active_profiler(students):
+    profiler = StepProfiler()
+    clean(students)
+    assert profiler.records == []
+
+    with profiler.activate():
+        df = clean(students)
+        transform(df, strategy="label_encoding", features=["gender", "lunch"])
+
+    records = {record["name"]: record for record in profiler.records}
+    assert records["clean"]["parent"] is None and records["transform"]["parent"] is None
+    assert records["FeatureEngineer.apply[LabelEncodingStrategy]"]["parent"] == "transform"
+    assert [record["name"] for record in profiler.records if record["parent"] == "clean"]
+    step = records["clean"]
+    assert step["rows_in"] == step["rows_out"] == len(students)
+    assert step["wall_seconds"] > 0 and step["rows_per_second"] == pytest.approx(len(students) / step["wall_seconds"])
+    assert step["bytes_in"] == students.memory_usage(deep=True, index=False).sum()
+    assert profiler.report()["totals"]["clean"]["calls"] == 1
+
+
+def test_traced_peak_covers_the_allocations_of_the_call():
+    profiler = StepProfiler(trace_memory=True, measure_bytes=False)
+    with profiler.activate():
+        allocate(8 << 20)
+
+    record, = profiler.records
+    assert record["traced_peak_bytes"] >= 8 << 20
+    assert record["rows_out"] == 1 << 20 and "bytes_out" not in record
+
+
+def test_threads_keep_their_own_call_stacks():
+    profiler = StepProfiler(measure_bytes=False)
+    barrier = threading.Barrier(2)
+
+    @instrumented("outer")
+    def outer():
+        barrier.wait()
+        return allocate(8)
+
+    with profiler.activate():
+        threads = [threading.Thread(target=outer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted((record["name"], record["parent"]) for record in profiler.records) == [("allocate", "outer")] * 2 + [("outer", None)] * 2
+
+
+def test_reports_are_written_as_json_and_mlflow_metrics(tmp_path, students):
+    profiler = StepProfiler(profile_dir=str(tmp_path / "profiles"))
+    with profiler.activate():
+        clean(students)
+        clean(students)
+
+    path = str(tmp_path / "report" / "steps.json")
+    profiler.to_json(path)
+    tracker = RecordingTracker()
+    profiler.log_to_mlflow(tracker)
+
+    with open(path) as f:
+        assert [call["name"] for call in json.load(f)["calls"]][-1] == "clean"
+    assert tracker.dicts["profile/steps.json"]["totals"]["clean"]["calls"] == 2
+    assert [step for key, _, step in tracker.metrics if key == "clean.wall_seconds"] == [0, 1]
+    assert not any(key.startswith("FusedCleaningEngine") for key, _, _ in tracker.metrics)
+    dumps = [local_path for local_path, _ in tracker.artifacts]
+    assert len(dumps) == 2 and all(os.path.exists(dump) for dump in dumps)
+    assert pstats.Stats(dumps[0]).total_calls > 0
+
+
+def test_unknown_profiler_is_rejected():
+    with pytest.raises(ValueError):
+        StepProfiler(profiler="perf")
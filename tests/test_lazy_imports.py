@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.benchmark import ROOT, measure_startup
+from src.model_training import MODEL_STRATEGIES, SklearnRegressionStrategy
+
+
+@pytest.fixture(scope="module")
+def startup():
+    return measure_startup(repeat=1)
+
+
+@pytest.mark.parametrize("module", ["run_pipeline", "src.mlflow_logger", "src.inference_server", "src.fast_predictor"])
+def test_entry_points_load_no_heavy_dependency(startup, module):
+    assert startup[module]["loaded"] == []
+
+
+@pytest.mark.parametrize("module", ["pipelines.training_pipeline", "src.model_training"])
+def test_pipeline_imports_leave_sklearn_and_mlflow_for_first_use(startup, module):
+    assert not {"sklearn", "mlflow"} & set(startup[module]["loaded"])
+
+
+def test_step_modules_do_not_import_sklearn_or_mlflow():
+    script = (
+        "import sys, pkgutil, importlib, steps, src\n"
+        "for package in (steps, src):\n"
+        "    for info in pkgutil.iter_modules(package.__path__):\n"
+        "        importlib.import_module(f'{package.__name__}.{info.name}')\n"
+        "print(sorted(m for m in ('sklearn', 'mlflow') if m in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+
+    assert output.strip().splitlines()[-1] == "[]"
+
+
+def test_registered_estimators_resolve_on_first_training():
+    import importlib
+
+    for name, strategy in MODEL_STRATEGIES.items():
+        if issubclass(strategy, SklearnRegressionStrategy):
+            module, attribute = strategy.estimator.rsplit(".", 1)
+            assert hasattr(importlib.import_module(module), attribute), name
@@ -0,0 +1,122 @@
+import json
+import logging
+import os
+
+import pytest
+
+from src.mlflow_logger import AsyncMLflowLogger, replay_spool, _retryable
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    monkeypatch.setenv("MLFLOW_DISABLE_AGENT_HINT", "1")
+    return (tmp_path / "mlruns").as_uri()
+
+
+def _logger(tmp_path, tracking_uri) -> AsyncMLflowLogger:
+    return AsyncMLflowLogger(spool_dir=str(tmp_path / "spool"), tracking_uri=tracking_uri, flush_interval=0.05)
+
+
+def _run(logger: AsyncMLflowLogger):
+    from mlflow.tracking import MlflowClient
+
+    with open(os.path.join(logger.spool_dir, AsyncMLflowLogger.RUNS_FILE)) as f:
+        run_id = json.load(f)[logger.spool_run]
+    client = MlflowClient(logger.tracking_uri)
+    return client, client.get_run(run_id)
+
+
+def test_logs_are_delivered_to_the_store(tmp_path, store):
+    logger = _logger(tmp_path, store)
+    logger.log_metrics({"MSE": 1.5, "R2": 0.25})
+    logger.log_param("alpha", 0.1)
+    logger.log_dict({"a": 1}, "reports/report.json")
+
+    assert logger.close()
+
+    client, run = _run(logger)
+    assert run.data.metrics == {"MSE": 1.5, "R2": 0.25}
+    assert run.data.params == {"alpha": "0.1"} and run.info.status == "FINISHED"
+    assert [artifact.path for artifact in client.list_artifacts(run.info.run_id, "reports")] == ["reports/report.json"]
+    assert not logger._own_entries() and not logger._failed_entries()
+
+
+def test_retried_entry_resumes_after_the_delivered_calls(tmp_path, store, monkeypatch):
+    from mlflow.tracking import MlflowClient
+    from mlflow.exceptions import MlflowException
+    from mlflow.protos.databricks_pb2 import TEMPORARILY_UNAVAILABLE
+
+    log_artifact = MlflowClient.log_artifact
+
+    def unavailable(self, *args, **kwargs):
+        raise MlflowException("Service unavailable.", error_code=TEMPORARILY_UNAVAILABLE)
+
+    monkeypatch.setattr(MlflowClient, "log_artifact", unavailable)
+    logger = _logger(tmp_path, store)
+    logger.log_metric("MSE", 1.5)
+    logger.log_dict({"a": 1}, "report.json")
+    assert not logger.close()
+
+    path, = logger._own_entries()
+    with open(path) as f:
+        assert json.load(f)["sent"] == 1
+    monkeypatch.setattr(MlflowClient, "log_artifact", log_artifact)
+    assert replay_spool(logger.spool_dir)
+
+    client, run = _run(logger)
+    assert len(client.get_metric_history(run.info.run_id, "MSE")) == 1
+    assert [artifact.path for artifact in client.list_artifacts(run.info.run_id)] == ["report.json"]
+    assert run.info.status == "FINISHED" and not logger._own_entries()
+
+
+def test_rejected_entry_is_set_aside_and_replay_goes_on(tmp_path, store, caplog):
+    logger = _logger(tmp_path, store)
+    logger.log_param("alpha", 1)
+    assert logger.flush()
+    logger.log_param("alpha", 2)
+    assert logger.flush()
+    logger.log_metric("MSE", 1.5)
+
+    with caplog.at_level(logging.WARNING):
+        assert not logger.close()
+
+    failed, = logger._failed_entries()
+    with open(failed) as f:
+        assert "Changing param values is not allowed" in json.load(f)["error"]
+    _, run = _run(logger)
+    assert run.data.params == {"alpha": "1"} and run.data.metrics == {"MSE": 1.5}
+    assert not logger._own_entries()
+    assert "rejected 1 log entries" in caplog.text and "Could not reach" not in caplog.text
+
+
+def test_unreachable_server_keeps_the_spool(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("MLFLOW_HTTP_REQUEST_MAX_RETRIES", "0")
+    monkeypatch.setenv("MLFLOW_HTTP_REQUEST_TIMEOUT", "5")
+    logger = _logger(tmp_path, "http://127.0.0.1:1")
+    logger.log_metric("MSE", 1.5)
+
+    with caplog.at_level(logging.WARNING):
+        assert not logger.close(timeout=60)
+
+    assert len(logger._own_entries()) == 1 and not logger._failed_entries()
+    assert "replay them with replay_spool" in caplog.text
+
+
+def test_errors_are_classified_by_status():
+    from mlflow.exceptions import MlflowException
+    from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE, REQUEST_LIMIT_EXCEEDED, TEMPORARILY_UNAVAILABLE
+
+    assert _retryable(ConnectionRefusedError())
+    assert _retryable(MlflowException("down", error_code=TEMPORARILY_UNAVAILABLE))
+    assert _retryable(MlflowException("slow down", error_code=REQUEST_LIMIT_EXCEEDED))
+    assert not _retryable(MlflowException("bad", error_code=INVALID_PARAMETER_VALUE))
+    assert not _retryable(ValueError("bug"))
+    # The file store re-raises rejections as INTERNAL_ERROR from its except block.
+    try:
+        try:
+            raise MlflowException("bad", error_code=INVALID_PARAMETER_VALUE)
+        except MlflowException as e:
+            raise MlflowException(e, error_code=INTERNAL_ERROR)
+    except MlflowException as e:
+        assert not _retryable(e)
@@ -0,0 +1,90 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+import threadpoolctl
+
+import src.model_sweep as model_sweep
+from src.model_sweep import ModelSweep, SharedArray, expand_grid
+
+
+@pytest.fixture
+def scores(students):
+    scores = students[["math score", "reading score", "writing score"]].astype(np.float64)
+    X, y = scores[["reading score", "writing score"]], scores[["math score"]]
+    return X.iloc[:800], X.iloc[800:], y.iloc[:800], y.iloc[800:]
+
+
+class _RecordingLimits:
+    restored = 0
+
+    def __init__(self, limits):
+        self.limits = limits
+
+    def restore_original_limits(self):
+        _RecordingLimits.restored += 1
+
+
+def _worker_handles(X_train, X_test, y_train, y_test):
+    owners = {
+        "X_train": SharedArray(X_train.to_numpy()),
+        "X_test": SharedArray(X_test.to_numpy()),
+        "y_train": SharedArray(y_train.to_numpy()),
+        "y_test": SharedArray(y_test.to_numpy()),
+    }
+    # Workers receive pickled handles, which attach without owning the segment.
+    return owners, {key: pickle.loads(pickle.dumps(handle)) for key, handle in owners.items()}
+
+
+@pytest.mark.parametrize("params, fails", [({"alpha": 1.0}, False), ({"alpha": "not a number"}, True)])
+def test_fit_candidate_releases_memory_and_thread_limits(scores, monkeypatch, params, fails):
+    monkeypatch.setattr(threadpoolctl, "threadpool_limits", _RecordingLimits)
+    _RecordingLimits.restored = 0
+    owners, handles = _worker_handles(*scores)
+    columns = {"X": list(scores[0].columns), "y": list(scores[2].columns)}
+    try:
+        row = model_sweep._fit_candidate("ridge", params, handles, columns)
+    finally:
+        for handle in owners.values():
+            handle.close()
+
+    assert ("error" in row) == fails
+    assert all(handle._shm is None for handle in handles.values())
+    assert _RecordingLimits.restored == 1
+
+
+def test_sweep_ranks_candidates_like_sequential_fits(scores):
+    from sklearn.linear_model import Ridge
+    from sklearn.metrics import r2_score
+
+    X_train, X_test, y_train, y_test = scores
+    leaderboard = ModelSweep({"ridge": {"alpha": [0.1, 1000.0]}, "linear_regression": {}}, max_workers=1).run(*scores)
+
+    assert len(leaderboard) == 3
+    assert leaderboard["R-Squared"].is_monotonic_decreasing
+    row = leaderboard[leaderboard["params"] == {"alpha": 1000.0}].iloc[0]
+    expected = r2_score(y_test, Ridge(alpha=1000.0).fit(X_train, y_train).predict(X_test))
+    assert row["R-Squared"] == pytest.approx(expected)
+
+
+def test_shared_array_round_trips_read_only():
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    owner = SharedArray(array)
+    handle = pickle.loads(pickle.dumps(owner))
+    try:
+        view = handle.open()
+        np.testing.assert_array_equal(view, array)
+        assert not view.flags.writeable
+        del view
+        handle.close()
+    finally:
+        owner.close()
+
+
+def test_expand_grid_and_bad_metric():
+    assert expand_grid({"ridge": {"alpha": [1, 2]}, "lasso": {}}) == [("ridge", {"alpha": 1}), ("ridge", {"alpha": 2}), ("lasso", {})]
+    with pytest.raises(ValueError):
+        expand_grid({"svm": {}})
+    with pytest.raises(ValueError):
+        ModelSweep({"ridge": {}}, metric="MAE")
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.outlier_detection import OutlierDetector, IsolationForestOutlierDetectionStrategy, ZScoreOutlierDetectionStrategy
+from steps.data_cleaning_step import clean
+
+SCORES = ["math score", "reading score", "writing score"]
+
+
+class CountingIsolationForest(IsolationForestOutlierDetectionStrategy):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.detections = 0
+
+    def detect(self, df, stats=None):
+        self.detections += 1
+        return super().detect(df, stats)
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(size=2_000), "b": rng.normal(size=2_000)})
+    df.loc[:19, ["a", "b"]] = 50.0
+    return df
+
+
+def test_clean_detects_outliers_once(students):
+    strategy = CountingIsolationForest()
+
+    cleaned = clean(students, outlier_strategy=strategy)
+
+    assert strategy.detections == 1
+    assert cleaned.shape == students.shape
+
+
+def test_flagged_rows_are_capped_to_the_inlier_quantiles(frame):
+    detector = OutlierDetector(IsolationForestOutlierDetectionStrategy())
+    outliers = detector.detect(frame)
+
+    capped = detector.handle(frame, method="cap", outliers=outliers)
+
+    inliers = frame[~outliers]
+    assert outliers.iloc[:20].all()
+    pd.testing.assert_series_equal(capped.loc[0], inliers.quantile(0.99), check_names=False)
+    pd.testing.assert_frame_equal(capped[~outliers], inliers)
+
+
+def test_given_mask_is_used_instead_of_detecting(frame):
+    detector = OutlierDetector(CountingIsolationForest())
+    mask = pd.Series(False, index=frame.index)
+    mask.iloc[[0, 1]] = True
+
+    removed = detector.handle(frame, method="remove", outliers=mask)
+
+    assert detector._strategy.detections == 0
+    pd.testing.assert_frame_equal(removed, frame.iloc[2:])
+
+
+def test_univariate_capping_clips_every_value_to_the_quantiles_of_all_rows(students):
+    scores = students[SCORES]
+
+    capped = OutlierDetector(ZScoreOutlierDetectionStrategy(threshold=3)).handle(scores, method="cap")
+
+    pd.testing.assert_frame_equal(capped, scores.clip(scores.quantile(0.01), scores.quantile(0.99), axis=1).astype(capped.dtypes))
+
+def test_saved_detector_scores_new_rows_without_refitting(tmp_path, frame, monkeypatch):
+    strategy = IsolationForestOutlierDetectionStrategy().fit(frame.iloc[:1_500])
+    path = str(tmp_path / "detector" / "forest.pkl")
+    strategy.save(path)
+
+    loaded = IsolationForestOutlierDetectionStrategy.load(path, n_estimators=7)
+    monkeypatch.setattr(loaded, "fit", lambda df: pytest.fail("the loaded detector refitted"))
+
+    assert loaded.n_estimators == strategy.n_estimators
+    pd.testing.assert_series_equal(loaded.detect(frame.iloc[1_500:]), strategy.detect(frame.iloc[1_500:]))
+    assert IsolationForestOutlierDetectionStrategy.load(str(tmp_path / "missing.pkl"), n_estimators=7).forest is None
+
+
+def test_batched_scoring_equals_one_decision_function_call(frame):
+    strategy = IsolationForestOutlierDetectionStrategy(batch_size=128, n_jobs=3).fit(frame)
+
+    scores = strategy.score(frame)
+
+    np.testing.assert_array_equal(scores.to_numpy(), strategy.forest.decision_function(frame[strategy.columns].to_numpy(dtype=np.float32)))
+    assert scores.index.equals(frame.index)
@@ -0,0 +1,134 @@
+import functools
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.sharded_execution import ColumnStatistics, ShardedExecutor, _scan_ranges
+from src.feature_engineering import StandardScalingStrategy, MinMaxScalingStrategy, LabelEncodingStrategy
+from src.handling_missing_value import FillMissingValueStrategy, MissingValueHandler
+from src.outlier_detection import OutlierDetector, IQROutlierDetectionStrategy
+
+SCORES = ["math score", "reading score", "writing score"]
+FEATURES = ["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"]
+
+
+def _merged(df: pd.DataFrame, n_shards: int = 4, **kwargs) -> ColumnStatistics:
+    # Partials travel to the merging process pickled, like from the workers.
+    shards = ShardedExecutor(max_workers=1, n_shards=n_shards).shards(df)
+    partials = [pickle.loads(pickle.dumps(ColumnStatistics(**kwargs).update(shard))) for shard in shards]
+    return functools.reduce(lambda merged, partial: merged.merge(partial), partials, ColumnStatistics(**kwargs))
+
+
+@pytest.fixture
+def gaps(students_with_gaps) -> pd.DataFrame:
+    df = pd.read_csv(students_with_gaps)
+    df["writing score"] = df["writing score"].astype(np.float32)
+    return df
+
+
+def test_merged_statistics_match_pandas(gaps):
+    stats = _merged(gaps)
+
+    pd.testing.assert_series_equal(stats.count(), gaps.count())
+    pd.testing.assert_series_equal(stats[SCORES].mean(), gaps[SCORES].mean().astype(np.float64), rtol=1e-6)
+    pd.testing.assert_series_equal(stats[SCORES].std(ddof=0), gaps[SCORES].std(ddof=0).astype(np.float64), rtol=1e-6)
+    for q in (0.01, 0.25, 0.5, 0.99):
+        pd.testing.assert_series_equal(stats[SCORES].quantile(q), gaps[SCORES].quantile(q).astype(np.float64), check_names=False)
+    pd.testing.assert_series_equal(stats[SCORES].median(), gaps[SCORES].median().astype(np.float64))
+    assert stats.min().tolist() == gaps.min().tolist()
+    assert stats.max().tolist() == gaps.max().tolist()
+    assert stats.mode().iloc[0].tolist() == gaps.mode().iloc[0].tolist()
+    assert stats.categories("gender").tolist() == sorted(gaps["gender"].dropna().unique())
+
+
+def test_high_cardinality_columns_keep_bounded_partials(students):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=20_000), "score": students["math score"].sample(20_000, replace=True, random_state=0).to_numpy()})
+
+    stats = _merged(df, max_distinct=100, k=256)
+
+    assert stats.counts["x"] is None and len(stats.counts["score"]) <= 100
+    assert sum(len(items) for items in stats.sketches["x"].levels) < 256 * 10
+    assert stats[["score"]].quantile(0.25)["score"] == df["score"].quantile(0.25)
+    assert stats.mean()["x"] == pytest.approx(df["x"].mean())
+    assert stats.std()["x"] == pytest.approx(df["x"].std())
+    with pytest.raises(ValueError, match="distinct values"):
+        stats.mode()
+    # Unresolved quantiles of x are refused rather than approximated.
+    with pytest.raises(ValueError, match="not resolved"):
+        stats.quantile(0.5)
+
+    # Opted in, they come from the sketch, within its rank error.
+    stats.approximate_quantiles = True
+    for q in (0.01, 0.5, 0.99):
+        rank = (df["x"] <= stats.quantile(q)["x"]).mean()
+        assert abs(rank - q) < 0.02
+    with pytest.raises(TypeError, match="not numeric"):
+        _merged(students).mean()
+
+
+def test_resolved_quantiles_are_exact():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.lognormal(size=20_000), "y": rng.normal(size=20_000).astype(np.float32)})
+    df.loc[rng.choice(len(df), 1_000, replace=False), "x"] = np.nan
+    executor = ShardedExecutor(max_workers=1, n_shards=4)
+    scans = []
+
+    def scan(ranges):
+        scans.append(ranges)
+        return executor.map(_scan_ranges, df, ranges)
+
+    stats = _merged(df, max_distinct=100, k=256).resolve_quantiles([0.01, 0.25, 0.5, 0.99], scan)
+
+    for q in (0.01, 0.25, 0.5, 0.99):
+        pd.testing.assert_series_equal(stats.quantile(q), df.quantile(q), check_exact=True, check_names=False)
+    pd.testing.assert_series_equal(stats.median(), df.median().astype(np.float64), check_exact=True)
+    # The second pass only collects the values in narrow ranges around the ranks.
+    assert len(scans) == 1
+    collected = sum(len(values) for partial in executor.map(_scan_ranges, df, scans[0]) for _, values in partial["x"])
+    assert collected < len(df) // 4
+
+
+def test_strategies_fit_on_statistics_like_on_the_frame(gaps):
+    stats = _merged(gaps)
+
+    standard = StandardScalingStrategy(SCORES).fit_statistics(stats)
+    expected = StandardScalingStrategy(SCORES).fit(gaps)
+    np.testing.assert_allclose(standard.mean_, expected.mean_, rtol=1e-6)
+    np.testing.assert_allclose(standard.scale_, expected.scale_, rtol=1e-6)
+
+    min_max = MinMaxScalingStrategy(SCORES).fit_statistics(stats)
+    expected = MinMaxScalingStrategy(SCORES).fit(gaps)
+    np.testing.assert_allclose(min_max.scale_, expected.scale_, rtol=1e-6)
+    np.testing.assert_allclose(min_max.min_, expected.min_, rtol=1e-6)
+
+    label = LabelEncodingStrategy(FEATURES).fit_statistics(stats)
+    assert label.dictionary.to_dict() == LabelEncodingStrategy(FEATURES).fit(gaps.fillna({"gender": "female"})).dictionary.to_dict()
+
+
+def test_process_pool_on_high_cardinality_columns_equals_a_single_process_run():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.lognormal(size=40_000), "y": rng.lognormal(size=40_000).astype(np.float32), "z": rng.integers(0, 10**7, 40_000)})
+    for column in ["x", "y"]:
+        df.loc[rng.choice(len(df), 2_000, replace=False), column] = np.nan
+
+    with ShardedExecutor(max_workers=2, n_shards=4) as executor:
+        sharded = MissingValueHandler(FillMissingValueStrategy(method="median"), executor=executor).handle(df)
+        single = MissingValueHandler(FillMissingValueStrategy(method="median")).handle(df)
+        pd.testing.assert_frame_equal(sharded, single, check_exact=True)
+
+        capped = OutlierDetector(IQROutlierDetectionStrategy(), executor=executor).handle(single, method="cap")
+        pd.testing.assert_frame_equal(capped, OutlierDetector(IQROutlierDetectionStrategy()).handle(single, method="cap"), check_exact=True)
+        assert OutlierDetector(IQROutlierDetectionStrategy(), executor=executor).detect(single) == OutlierDetector(IQROutlierDetectionStrategy()).detect(single)
+
+
+@pytest.mark.parametrize("method", ["mean", "median", "mode"])
+def test_sharded_fill_equals_a_single_process_run(gaps, method):
+    executor = ShardedExecutor(max_workers=1, n_shards=3)
+
+    sharded = MissingValueHandler(FillMissingValueStrategy(method=method), executor=executor).handle(gaps)
+    single = MissingValueHandler(FillMissingValueStrategy(method=method)).handle(gaps)
+
+    pd.testing.assert_frame_equal(sharded, single, rtol=1e-6)
\ No newline at end of file
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse as sp
+
+from src.sparse_design_matrix import SparseDesignMatrix, to_model_input
+from steps.data_transforming_step import transform
+from steps.data_splitting_step import split
+from steps.model_training_step import train
+from steps.model_evaluator_step import evaluate
+
+FEATURES = ["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"]
+TARGETS = ["math score", "reading score", "writing score"]
+
+
+def _run(df: pd.DataFrame, strategy: str):
+    df_transformed = transform(df, strategy=strategy, features=FEATURES)
+    X_train, X_test, y_train, y_test = split(df_transformed, TARGETS)
+    model = train(X_train, y_train)
+    return df_transformed, X_train, X_test, model, evaluate(model, X_test, y_test)
+
+
+def test_sparse_path_matches_the_dense_one_hot_path(students):
+    dense_df, dense_train, _, dense_model, dense_metrics = _run(students, "one_hot_encoding")
+    sparse_df, sparse_train, sparse_test, sparse_model, sparse_metrics = _run(students, "sparse_one_hot_encoding")
+
+    assert isinstance(sparse_df, SparseDesignMatrix)
+    assert isinstance(sparse_train, SparseDesignMatrix) and isinstance(sparse_test, SparseDesignMatrix)
+    assert sparse_df.columns == list(dense_df.columns)
+    np.testing.assert_array_equal(to_model_input(sparse_train).toarray(), dense_train.to_numpy(dtype=np.float64))
+    np.testing.assert_allclose(sparse_model.coef_, dense_model.coef_, atol=1e-8)
+    for metric in dense_metrics:
+        assert sparse_metrics[metric] == pytest.approx(dense_metrics[metric])
+
+
+def test_design_matrix_stays_sparse(students):
+    matrix = transform(students, strategy="sparse_one_hot_encoding", features=FEATURES)
+
+    taken = matrix.drop(columns=TARGETS).take(np.array([3, 1, 2]))
+    csr = to_model_input(taken)
+
+    assert sp.isspmatrix_csr(csr)
+    assert csr.shape == (3, len(taken.columns))
+    np.testing.assert_array_equal(csr.toarray(), matrix.drop(columns=TARGETS).to_csr().toarray()[[3, 1, 2]])
+
+
+def test_mismatched_sparse_block_is_rejected():
+    with pytest.raises(ValueError):
+        SparseDesignMatrix(pd.DataFrame({"a": [1, 2]}), sp.csr_matrix(np.eye(3)), ["x", "y", "z"])
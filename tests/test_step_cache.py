@@ -0,0 +1,104 @@
+import importlib
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.step_cache as step_cache
+from src.step_cache import StepCache
+from steps.data_cleaning_step import clean
+from steps.data_splitting_step import split
+from steps.model_training_step import train
+
+
+def scale(df: pd.DataFrame, factor: int = 2) -> pd.DataFrame:
+    return df * factor
+
+
+@pytest.fixture
+def cache(tmp_path) -> StepCache:
+    return StepCache(str(tmp_path / "steps"))
+
+
+def test_second_run_is_a_hit_with_the_same_output(cache, students):
+    first = cache.run("clean", clean, students)
+    second = cache.run("clean", clean, students.copy())
+
+    assert (cache.misses, cache.hits) == (1, 1)
+    pd.testing.assert_frame_equal(second, first)
+
+
+def test_key_covers_arguments_and_defaults(cache):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    base = cache.key("scale", scale, (df,), {})
+
+    assert cache.key("scale", scale, (df,), {"factor": 2}) == base
+    assert cache.key("scale", scale, (), {"df": df}) == base
+    assert cache.key("scale", scale, (df, 3), {}) != base
+    assert cache.key("scale", scale, (df.assign(a=[1, 2, 4]),), {}) != base
+
+    scale.__defaults__ = (3,)
+    try:
+        assert cache.key("scale", scale, (df,), {}) != base
+    finally:
+        scale.__defaults__ = (2,)
+
+
+def test_changing_the_step_source_misses(tmp_path, monkeypatch):
+    package = tmp_path / "repo"
+    package.mkdir()
+    module_path = package / "cached_step.py"
+    module_path.write_text("def step(x):\n    return x + 1\n")
+    monkeypatch.setattr(step_cache, "ROOT", str(package))
+    monkeypatch.syspath_prepend(str(package))
+    cache = StepCache(str(tmp_path / "steps"))
+
+    module = importlib.import_module("cached_step")
+    assert cache.run("step", module.step, 1) == 2
+
+    module_path.write_text("def step(x):\n    return x + 2\n")
+    step_cache._module_fingerprint.cache_clear()
+    module = importlib.reload(module)
+    try:
+        assert cache.run("step", module.step, 1) == 3
+    finally:
+        sys.modules.pop("cached_step", None)
+        step_cache._module_fingerprint.cache_clear()
+    assert cache.misses == 2
+
+
+def test_code_fingerprint_covers_the_modules_a_step_uses():
+    modules = step_cache._repository_modules(clean.__module__)
+
+    assert {"steps.data_cleaning_step", "src.fused_cleaning", "src.handling_missing_value", "src.outlier_detection"} <= set(modules)
+    assert not any(name.startswith(("pandas", "numpy", "sklearn")) for name in modules)
+
+
+def _train(cache: StepCache, scores: pd.DataFrame):
+    df = cache.run("clean", clean, scores)
+    X_train, X_test, y_train, y_test = cache.run("split", split, df, ["math score"])
+    return X_train, cache.run("train", train, X_train, y_train)
+
+
+def test_downstream_steps_reuse_the_lineage_of_cached_outputs(cache, students):
+    scores = students[["math score", "reading score", "writing score"]]
+    X_train, _ = _train(cache, scores)
+    assert cache.fingerprint(X_train).startswith("step:")
+
+    rerun = StepCache(cache.cache_dir)
+    _, model = _train(rerun, scores.copy())
+
+    assert (rerun.hits, rerun.misses) == (3, 0)
+    assert np.isfinite(model.coef_).all()
+
+
+def test_invalidate_and_eviction(cache, students):
+    cache.run("clean", clean, students)
+    cache.max_bytes = 0
+    cache.run("clean", clean, students.iloc[:10])
+
+    assert cache.size() == 0
+    cache.max_bytes = 1 << 30
+    cache.run("clean", clean, students)
+    assert cache.invalidate("clean") == 1
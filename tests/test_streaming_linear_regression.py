@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.model_training import LinearSufficientStatistics, StreamingLinearRegressionStrategy
+from steps.streaming_training_step import train_streaming
+
+TARGETS = ["math score", "reading score", "writing score"]
+FEATURES = ["gender", "race/ethnicity", "parental level of education", "lunch", "test preparation course"]
+
+
+@pytest.fixture
+def regression():
+    rng = np.random.default_rng(0)
+    X = rng.normal(1000.0, 5.0, size=(600, 4))
+    y = X @ rng.normal(size=(4, 3)) + rng.normal(size=(600, 3))
+    return X, y
+
+
+def _chunked(X, y, sizes):
+    stats = LinearSufficientStatistics()
+    for start, stop in zip(np.cumsum([0] + sizes[:-1]), np.cumsum(sizes)):
+        stats.update(X[start:stop], y[start:stop])
+    return stats
+
+
+@pytest.mark.parametrize("alpha", [0.0, 10.0])
+def test_chunked_statistics_solve_like_scikit_learn(regression, alpha):
+    from sklearn.linear_model import LinearRegression, Ridge
+
+    X, y = regression
+    coef, intercept = _chunked(X, y, [1, 99, 250, 250]).solve(alpha)
+
+    model = (Ridge(alpha=alpha) if alpha else LinearRegression()).fit(X, y)
+    np.testing.assert_allclose(coef, model.coef_, rtol=1e-6)
+    np.testing.assert_allclose(intercept, model.intercept_, rtol=1e-6)
+
+
+def test_merged_shards_equal_one_pass(regression):
+    X, y = regression
+    single = _chunked(X, y, [600])
+    shards = [_chunked(X[i:i + 200], y[i:i + 200], [200]) for i in (400, 0, 200)]
+    merged = LinearSufficientStatistics()
+    for shard in shards + [LinearSufficientStatistics()]:
+        merged.merge(shard)
+
+    assert merged.n == single.n
+    np.testing.assert_allclose(merged.xx, single.xx, rtol=1e-9)
+    np.testing.assert_allclose(merged.xy, single.xy, rtol=1e-9)
+    np.testing.assert_allclose(merged.mean_x, single.mean_x)
+
+
+def test_rank_deficient_features_fall_back_to_minimum_norm(regression):
+    from sklearn.linear_model import LinearRegression
+
+    X, y = regression
+    X = np.column_stack([X, X[:, 0]])
+    coef, _ = _chunked(X, y, [600]).solve()
+
+    np.testing.assert_allclose(X @ coef.T, X @ LinearRegression().fit(X, y).coef_.T, rtol=1e-6)
+
+
+def test_strategy_rejects_mismatched_merges_and_empty_solves(regression):
+    X, y = regression
+    left = StreamingLinearRegressionStrategy().partial_fit(pd.DataFrame(X, columns=list("abcd")), pd.DataFrame(y))
+    right = StreamingLinearRegressionStrategy().partial_fit(pd.DataFrame(X, columns=list("abce")), pd.DataFrame(y))
+
+    with pytest.raises(ValueError):
+        left.merge(right)
+    with pytest.raises(ValueError):
+        LinearSufficientStatistics().solve()
+
+
+@pytest.mark.parametrize("max_workers", [None, 1])
+def test_streaming_training_equals_the_in_memory_fit(data_path, students, max_workers):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import LabelEncoder
+
+    model = train_streaming(data_path, chunksize=128, max_workers=max_workers)
+
+    X = pd.DataFrame({feature: LabelEncoder().fit_transform(students[feature]) for feature in FEATURES})
+    expected = LinearRegression().fit(X, students[TARGETS])
+    assert list(model.feature_names_in_) == FEATURES
+    np.testing.assert_allclose(model.coef_, expected.coef_, rtol=1e-8)
+    np.testing.assert_allclose(model.intercept_, expected.intercept_, rtol=1e-8)
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.outlier_detection import (
+    RunningMoments,
+    QuantileSketch,
+    StreamingZScoreOutlierDetectionStrategy,
+    StreamingIQROutlierDetectionStrategy,
+)
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(50, 10, 20_000), "b": rng.exponential(3, 20_000)})
+    df.loc[rng.choice(len(df), 500, replace=False), "b"] = np.nan
+    return df
+
+
+def _chunks(df: pd.DataFrame, n: int):
+    bounds = np.linspace(0, len(df), n + 1).astype(int)
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def test_running_moments_merge_equals_pandas(data):
+    partials = [RunningMoments().update(chunk) for chunk in _chunks(data, 7)]
+    merged = RunningMoments()
+    for partial in partials:
+        merged.merge(partial)
+
+    pd.testing.assert_series_equal(merged.means(), data.mean(), rtol=1e-12)
+    pd.testing.assert_series_equal(merged.std(), data.std(), rtol=1e-10)
+    pd.testing.assert_series_equal(merged.std(ddof=0), data.std(ddof=0), rtol=1e-10)
+    np.testing.assert_array_equal(merged.count, data.count().to_numpy())
+
+
+def test_running_moments_reject_other_columns(data):
+    with pytest.raises(ValueError):
+        RunningMoments().update(data).merge(RunningMoments().update(data[["b", "a"]]))
+
+
+def test_quantile_sketch_is_exact_before_compaction():
+    values = np.random.default_rng(1).normal(size=1000)
+    sketch = QuantileSketch(k=2048).update(values)
+    np.testing.assert_allclose(sketch.quantile([0.01, 0.25, 0.5, 0.99]), np.quantile(values, [0.01, 0.25, 0.5, 0.99]))
+
+
+@pytest.mark.parametrize("k", [256, 2048])
+def test_merged_sketches_stay_within_the_rank_error_bound(k):
+    values = np.random.default_rng(2).lognormal(size=200_000)
+    sketches = [QuantileSketch(k=k, seed=i).update(chunk) for i, chunk in enumerate(np.array_split(values, 16))]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    qs = np.linspace(0.01, 0.99, 21)
+    ranks = np.searchsorted(np.sort(values), merged.quantile(qs)) / len(values)
+    n = len(values)
+    worst_case = 2 * np.log2(n / k) / k
+    assert merged.count == n
+    assert np.abs(ranks - qs).max() <= worst_case
+    # Much tighter in practice, see the QuantileSketch docstring.
+    assert np.abs(ranks - qs).max() <= 4 / k
+    assert sum(len(level) for level in merged.levels) <= k * (np.log2(n / k) + 2)
+
+
+def test_quantile_sketch_ignores_nan_and_handles_empty():
+    assert np.isnan(QuantileSketch().quantile(0.5))
+    assert QuantileSketch().update([1.0, np.nan, 3.0]).quantile(0.5) == 2.0
+
+
+def test_streaming_zscore_equals_batch_zscore(data):
+    strategy = StreamingZScoreOutlierDetectionStrategy(threshold=2)
+    for chunk in _chunks(data, 5):
+        strategy.update(chunk)
+
+    expected = np.abs((data - data.mean()) / data.std()) > 2
+    pd.testing.assert_frame_equal(strategy.detect(data), expected)
+
+
+def test_streaming_iqr_merges_shards_and_flags_values(data):
+    shards = [StreamingIQROutlierDetectionStrategy(seed=i).update(chunk) for i, chunk in enumerate(_chunks(data, 4))]
+    strategy = shards[0]
+    for shard in shards[1:]:
+        strategy.merge(shard)
+
+    outliers = strategy.detect(data)
+    q1, q3 = data.quantile(0.25), data.quantile(0.75)
+    expected = (data > q3 + 1.5 * (q3 - q1)) | (data < q1 - 1.5 * (q3 - q1))
+    assert outliers.shape == data.shape
+    # The fences are approximate, so only values right at them may disagree.
+    assert (outliers != expected).to_numpy().mean() < 0.002
+    assert not outliers["b"][data["b"].isna()].any()
@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.benchmark import STEPS, BenchmarkSuite, compare
+from src.data_schema import STUDENT_PERFORMANCE_SCHEMA
+from src.synthetic_data import CATEGORICAL_COLUMNS, SCORE_COLUMNS, StudentPerformanceGenerator
+from steps.data_ingestion_step import ingest
+
+
+@pytest.fixture
+def generator(students):
+    return StudentPerformanceGenerator(missing_rate=0.02, outlier_rate=0.01).fit(students)
+
+
+def test_generated_rows_keep_the_distributions(generator, students):
+    df = generator.generate(100_000)
+
+    assert list(df.columns) == CATEGORICAL_COLUMNS + SCORE_COLUMNS
+    for column in CATEGORICAL_COLUMNS:
+        real = students[column].value_counts(normalize=True)
+        synthetic = df[column].value_counts(normalize=True).reindex(real.index)
+        np.testing.assert_allclose(synthetic, real, atol=0.01)
+    inliers = df[SCORE_COLUMNS].dropna()
+    inliers = inliers[(inliers >= 0).all(axis=1) & (inliers <= 100).all(axis=1)].astype(float)
+    np.testing.assert_allclose(inliers.corr(), students[SCORE_COLUMNS].corr(), atol=0.03)
+    np.testing.assert_allclose(inliers.mean(), students[SCORE_COLUMNS].mean(), atol=1.0)
+
+
+def test_missing_values_and_outliers_are_injected(generator):
+    df = generator.generate(50_000)
+    scores = df[SCORE_COLUMNS].astype("float64")
+
+    assert df[SCORE_COLUMNS].isna().mean().to_numpy() == pytest.approx([0.02] * 3, abs=0.003)
+    assert ((scores < 0) | (scores > 100)).any(axis=1).mean() == pytest.approx(0.01, abs=0.002)
+    assert all(str(dtype) == "Int64" for dtype in df[SCORE_COLUMNS].dtypes)
+
+
+def test_generation_is_seeded_and_streams_in_chunks(generator):
+    pd.testing.assert_frame_equal(generator.generate(500, seed=3), generator.generate(500, seed=3))
+    assert [len(chunk) for chunk in generator.iter_chunks(2_500, chunksize=1_000)] == [1_000, 1_000, 500]
+    with pytest.raises(ValueError):
+        StudentPerformanceGenerator().generate(10)
+
+
+def test_written_csv_ingests_with_the_schema(generator, tmp_path):
+    path = generator.write_csv(str(tmp_path / "students.csv"), 2_500, chunksize=1_000)
+
+    df = ingest(path, schema=STUDENT_PERFORMANCE_SCHEMA)
+
+    assert len(df) == 2_500 and list(df.columns) == CATEGORICAL_COLUMNS + SCORE_COLUMNS
+    pd.testing.assert_frame_equal(df[CATEGORICAL_COLUMNS].astype(object), pd.concat(generator.iter_chunks(2_500, 1_000), ignore_index=True)[CATEGORICAL_COLUMNS].astype(object))
+
+
+def test_benchmark_report_covers_every_step_and_compares(tmp_path, data_path):
+    suite = BenchmarkSuite(sizes=[2_000], repeat=1, data_dir=str(tmp_path), source=data_path)
+
+    report = json.loads(json.dumps(suite.run()))
+
+    result, = report["results"]
+    assert result["error"] is None and list(result["steps"]) == STEPS
+    assert all(step["wall_seconds"] > 0 and step["traced_peak_bytes"] > 0 for step in result["steps"].values())
+    slower = json.loads(json.dumps(report))
+    slower["results"][0]["steps"]["train"]["wall_seconds"] *= 2
+    comparison = compare(report, slower)
+    assert comparison.loc[comparison["regression"], ["step", "measure"]].values.tolist() == [["train", "wall_seconds"]]